@@ -0,0 +1,248 @@
+"""
+Batch helpers shared by the use case scripts.
+
+Batch files hold one item per line, either as JSON objects (JSONL) or as a
+tab-separated table with a header row. Items are dispatched concurrently so
+that the network round-trips of independent predictions overlap, and every
+result is written as one JSON line and flushed as soon as it completes, so
+no more than the in-flight results are held in memory.
+
+run_batch overlaps up to `concurrency` requests with threads driven by
+asyncio (on uvloop when it is installed); run_batch_pool spreads the items
+over worker processes (--jobs) so that result post-processing and JSON
+encoding are not serialized by the GIL.
+"""
+
+import asyncio
+import contextlib
+import csv
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from multiprocessing.pool import ThreadPool
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import _output
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Batch validator: a chunk of records in, one error result (or None if valid) per record out
+Preflight = Callable[[List[Dict[str, Any]]], List[Optional[Dict[str, Any]]]]
+
+# Records validated per preflight call; records are read and validated a chunk
+# at a time as they are dispatched, so the batch file is never held in memory
+PREFLIGHT_CHUNK = 1024
+
+
+def iter_batch_records(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a JSONL or TSV batch file.
+
+    The format is detected from the first data line: lines starting with "{"
+    are parsed as JSONL, anything else as TSV with a header row.
+    Empty lines and lines starting with # are skipped.
+    """
+    with open(file_path, 'r') as f:
+        lines = (line.rstrip('\n') for line in f)
+        lines = (line for line in lines if line.strip() and not line.startswith('#'))
+
+        first = next(lines, None)
+        if first is None:
+            return
+
+        if first.lstrip().startswith('{'):
+            yield json.loads(first)
+            for line in lines:
+                yield json.loads(line)
+        else:
+            header = [column.strip() for column in first.split('\t')]
+            for row in csv.reader(lines, delimiter='\t'):
+                yield {key: value.strip() for key, value in zip(header, row)}
+
+
+def run_batch(worker: Callable[[Dict[str, Any]], Dict[str, Any]],
+              records: Iterator[Dict[str, Any]],
+              output_path: Optional[str] = None,
+              concurrency: int = 8,
+              preflight: Optional[Preflight] = None) -> Dict[str, int]:
+    """
+    Run worker over all records concurrently and write results as JSONL.
+
+    Args:
+        worker: Function mapping one batch record to a result dictionary
+        records: Batch records (e.g. from iter_batch_records)
+        output_path: JSONL output file path (default: stdout)
+        concurrency: Maximum number of predictions in flight
+        preflight: Optional validator for chunks of records, see _preflight
+
+    Returns:
+        Dictionary with total and failed record counts
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    counts = {"total": 0, "failed": 0}
+    with _open_output(output_path) as fh:
+        items = _preflight(records, preflight)
+        asyncio.run(_run_batch(worker, items, fh, max(1, concurrency), counts))
+    return counts
+
+
+async def _run_batch(worker, items, fh, concurrency: int, counts: Dict[str, int]) -> None:
+    # The default executor is capped at 32 threads; size it to the concurrency
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(index: int, record: Dict[str, Any]) -> None:
+        try:
+            result = await asyncio.to_thread(worker, record)
+        except Exception as e:
+            result = {"success": False, "error": str(e), "type": type(e).__name__}
+        finally:
+            semaphore.release()
+        result['batch_index'] = index
+        _emit(fh, result)
+        counts["total"] += 1
+        counts["failed"] += not result.get('success', False)
+
+    # Records are pulled only as slots free up, so large batch files are
+    # never materialized as pending tasks all at once
+    tasks = set()
+    for index, record, error in items:
+        if error is not None:
+            # Rejected by the preflight: reported without touching the network
+            error['batch_index'] = index
+            _emit(fh, error)
+            counts["total"] += 1
+            counts["failed"] += 1
+            continue
+        await semaphore.acquire()
+        task = asyncio.create_task(run_one(index, record))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+def run_batch_pool(worker: Callable[[Dict[str, Any]], Dict[str, Any]],
+                   records: Iterator[Dict[str, Any]],
+                   output_path: Optional[str] = None,
+                   jobs: int = 4,
+                   threads: bool = False,
+                   initializer: Optional[Callable] = None,
+                   initargs: tuple = (),
+                   preflight: Optional[Preflight] = None) -> Dict[str, int]:
+    """
+    Run worker over all records in a pool of processes and write results as JSONL.
+
+    Results are encoded to JSON inside the workers and written in completion
+    order. The worker must be picklable (a top-level function or a partial of
+    one); with processes, initializer/initargs re-apply settings such as the
+    cache configuration in every worker.
+
+    Args:
+        worker: Function mapping one batch record to a result dictionary
+        records: Batch records (e.g. from iter_batch_records)
+        output_path: JSONL output file path (default: stdout)
+        jobs: Number of worker processes (or threads)
+        threads: Use a thread pool instead of processes
+        initializer: Optional function called once in every worker
+        initargs: Arguments for initializer
+        preflight: Optional validator for chunks of records, see _preflight
+
+    Returns:
+        Dictionary with total and failed record counts
+    """
+    counts = {"total": 0, "failed": 0}
+    with _open_output(output_path) as fh:
+        items = _preflight(records, preflight)
+
+        if threads:
+            pool = ThreadPool(max(1, jobs), initializer, initargs)
+        else:
+            # forkserver avoids copying the parent interpreter state into every worker
+            context = multiprocessing.get_context('forkserver' if sys.platform == 'linux' else None)
+            pool = context.Pool(max(1, jobs), initializer, initargs)
+
+        with pool:
+            for success, data in pool.imap_unordered(partial(_encode_result, worker), items, chunksize=8):
+                _emit(fh, data)
+                counts["total"] += 1
+                counts["failed"] += not success
+    return counts
+
+
+def write_results(results: Iterable[Dict[str, Any]],
+                  output_path: Optional[str] = None) -> Dict[str, int]:
+    """
+    Write already computed batch results as JSONL, numbering them in order.
+
+    Returns:
+        Dictionary with total and failed record counts
+    """
+    total = failed = 0
+    with _open_output(output_path) as fh:
+        for index, result in enumerate(results):
+            result['batch_index'] = index
+            _emit(fh, result)
+            total += 1
+            failed += not result.get('success', False)
+    return {"total": total, "failed": failed}
+
+
+def _preflight(records: Iterable[Dict[str, Any]],
+               preflight: Optional[Preflight]) -> Iterator[Tuple[int, Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """
+    Validate records lazily, PREFLIGHT_CHUNK at a time, as they are dispatched.
+
+    preflight receives a list of records and returns, per record, either an
+    error result (reported without touching the network) or None. Yields
+    (index, record, error) triples, with error None for valid records and
+    for every record when there is no preflight.
+    """
+    if preflight is None:
+        for index, record in enumerate(records):
+            yield index, record, None
+        return
+
+    records = iter(records)
+    index = 0
+    while True:
+        chunk = list(islice(records, PREFLIGHT_CHUNK))
+        if not chunk:
+            return
+        for record, error in zip(chunk, preflight(chunk)):
+            yield index, record, error
+            index += 1
+
+
+@contextlib.contextmanager
+def _open_output(output_path: Optional[str]) -> Iterator[BinaryIO]:
+    """Open the JSONL output once in binary mode (stdout if no path is given)."""
+    if output_path:
+        with open(output_path, 'wb') as fh:
+            yield fh
+    else:
+        sys.stdout.flush()
+        yield sys.stdout.buffer
+
+
+def _emit(fh: BinaryIO, record: Any) -> None:
+    """Write one record (a result dictionary or pre-encoded JSON bytes) as a JSONL line."""
+    if not isinstance(record, bytes):
+        record = _output.dumps(record)
+    fh.write(record)
+    fh.write(b'\n')
+    fh.flush()
+
+
+def _encode_result(worker, item: Tuple[int, Dict[str, Any], Optional[Dict[str, Any]]]) -> Tuple[bool, bytes]:
+    index, record, error = item
+    result = worker(record) if error is None else error
+    result['batch_index'] = index
+    return bool(result.get('success', False)), _output.dumps(result)
@@ -0,0 +1,128 @@
+"""
+On-disk memoization of prediction results for the use case scripts.
+
+Results are stored in a small SQLite database keyed by a BLAKE2b hash of the
+normalized request, so repeated (sequence|interval|variant, organism,
+output_types) queries are answered locally instead of costing another API
+round-trip. Keys include the client that produced the result (mock or live,
+client class and model version), so mock results are never served as real
+ones. Only successful results are cached, and the cache is best effort: a
+database error is treated as a miss and never fails a prediction.
+
+With http_cache=True and requests-cache installed, HTTP responses are cached
+as well (honoring the server's Cache-Control and ETag headers), so requests
+that miss the result cache can still be answered with cheap conditional
+requests. This patches requests globally, so it is opt-in.
+
+The cache lives in ~/.cache/alphagenome (override with ALPHAGENOME_CACHE_DIR).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+CACHE_DIR = os.path.expanduser(os.getenv('ALPHAGENOME_CACHE_DIR', '~/.cache/alphagenome'))
+DEFAULT_TTL = 7 * 24 * 3600  # seconds
+
+_settings = {"enabled": True, "ttl": DEFAULT_TTL, "refresh": False}
+_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+
+
+def configure(enabled: bool = True, ttl: Optional[float] = DEFAULT_TTL, refresh: bool = False,
+              http_cache: bool = False) -> None:
+    """
+    Configure the result cache and, optionally, the HTTP cache.
+
+    Args:
+        enabled: Whether cached results are read and written
+        ttl: Maximum age of a cached result in seconds (None or 0 for no expiry)
+        refresh: Ignore cached results and store fresh ones; cached HTTP
+            responses are revalidated with the server instead of reused
+        http_cache: Also install requests-cache (if installed) for all
+            requests made by this process
+    """
+    _settings["enabled"] = enabled
+    _settings["ttl"] = ttl
+    _settings["refresh"] = refresh
+    if enabled and http_cache:
+        _install_http_cache(ttl, refresh)
+
+
+def make_key(kind: str, payload: Dict[str, Any]) -> str:
+    """Hash a request kind and its normalized payload into a cache key."""
+    data = json.dumps([kind, payload], sort_keys=True).encode()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def output_types_key(output_types: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """Normalize output types for a cache key (lower-cased and sorted)."""
+    if not output_types:
+        return None
+    return sorted({t.lower() for t in output_types})
+
+
+def get(key: str) -> Optional[dict]:
+    """Return the cached result for key, or None if missing, expired or disabled."""
+    if not _settings["enabled"] or _settings["refresh"]:
+        return None
+
+    try:
+        with _lock:
+            row = _connect().execute("SELECT created, value FROM results WHERE key = ?", (key,)).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+
+    if row is None:
+        return None
+    created, value = row
+    ttl = _settings["ttl"]
+    if ttl and time.time() - created > ttl:
+        return None
+    return json.loads(value)
+
+
+def put(key: str, result: dict) -> None:
+    """Store a successful result under key."""
+    if not _settings["enabled"] or not result.get('success', False):
+        return
+
+    try:
+        with _lock:
+            conn = _connect()
+            conn.execute("INSERT OR REPLACE INTO results (key, created, value) VALUES (?, ?, ?)",
+                         (key, time.time(), json.dumps(result)))
+            conn.commit()
+    except (sqlite3.Error, OSError, TypeError, ValueError):
+        # Not writable or not JSON-serializable: the result is simply not cached
+        pass
+
+
+def _install_http_cache(ttl: Optional[float], refresh: bool) -> None:
+    try:
+        import requests_cache
+    except ImportError:
+        return
+
+    if refresh:
+        expire_after = requests_cache.EXPIRE_IMMEDIATELY
+    else:
+        expire_after = ttl if ttl else requests_cache.NEVER_EXPIRE
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    requests_cache.install_cache(os.path.join(CACHE_DIR, 'http'), backend='sqlite',
+                                 expire_after=expire_after, cache_control=True)
+
+
+def _connect() -> sqlite3.Connection:
+    global _connection
+    if _connection is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _connection = sqlite3.connect(os.path.join(CACHE_DIR, 'results.sqlite'),
+                                      timeout=30, check_same_thread=False)
+        _connection.execute("CREATE TABLE IF NOT EXISTS results "
+                            "(key TEXT PRIMARY KEY, created REAL, value TEXT)")
+    return _connection
@@ -0,0 +1,75 @@
+"""
+AlphaGenome client bootstrap shared by the use case scripts.
+
+Resolves the API key (or the mock key when ALPHAGENOME_USE_MOCK is set) and
+hands out one client per key, importing alphagenome_client from the repo
+checkout when it is not installed.
+"""
+
+import os
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Optional
+
+# Fallback location of alphagenome_client when it is not installed
+_REPO_DIR = str(Path(__file__).resolve().parent.parent / 'repo' / 'AlphaGenome-MCP-Server')
+
+# Mock mode and the environment API key, read once per process (see refresh_env)
+_USE_MOCK = False
+_ENV_KEY: Optional[str] = None
+
+
+def refresh_env() -> None:
+    """Re-read ALPHAGENOME_USE_MOCK and ALPHAGENOME_API_KEY, e.g. after the environment was changed."""
+    global _USE_MOCK, _ENV_KEY
+    _USE_MOCK = os.environ.get('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
+    _ENV_KEY = os.environ.get('ALPHAGENOME_API_KEY')
+
+
+refresh_env()
+
+
+def use_mock() -> bool:
+    """Whether the scripts run against the mock client."""
+    return _USE_MOCK
+
+
+def client_api_key(api_key: Optional[str]) -> str:
+    """Resolve the API key to construct the client with ("mock_key" in mock mode)."""
+    if _USE_MOCK:
+        return "mock_key"
+    api_key = api_key or _ENV_KEY
+    if not api_key:
+        raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    return api_key
+
+
+def identity(client: Any) -> str:
+    """Describe the client results come from (mode, class and model version), e.g. for cache keys."""
+    cls = type(client)
+    mode = "mock" if _USE_MOCK else "live"
+    return f"{mode}:{cls.__module__}.{cls.__qualname__}:{getattr(client, 'model_version', '')}"
+
+
+@lru_cache(maxsize=4)
+def get_client(api_key: str) -> "AlphaGenomeClient":
+    """
+    Return a shared client per API key so its connections are reused across calls.
+
+    The client module is imported on first use, so --help and input
+    validation errors do not pay for it.
+    """
+    try:
+        from alphagenome_client import AlphaGenomeClient
+    except ImportError:
+        # Not installed: fall back to the repo checkout, appended so it is only
+        # searched after the regular import path
+        if _REPO_DIR not in sys.path:
+            sys.path.append(_REPO_DIR)
+        try:
+            from alphagenome_client import AlphaGenomeClient
+        except ImportError as e:
+            raise ImportError("Could not import AlphaGenome client. "
+                              "Please ensure the environment is set up correctly.") from e
+    return AlphaGenomeClient(api_key)
@@ -0,0 +1,118 @@
+"""
+Interval clustering for batched interval queries.
+
+Nearby intervals on the same chromosome are merged into one window of a
+supported AlphaGenome size, the window is predicted once, and each
+interval's share is sliced back out of the window's tracks. This turns N
+API calls for a dense interval list (e.g. a gene-list scan) into K << N.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Interval lengths accepted by AlphaGenome: 2KB, 16KB, 131KB, 524KB, 1MB
+SUPPORTED_SIZES = (2048, 16384, 131072, 524288, 1048576)
+
+
+def cluster_intervals(items: Sequence[Tuple[str, int, int]], max_gap: int,
+                      sizes: Sequence[int] = SUPPORTED_SIZES) -> Tuple[List[Tuple[str, int, int]], List[Tuple[int, int, int]]]:
+    """
+    Greedily merge nearby intervals into windows of a supported size.
+
+    Intervals are sorted by (chromosome, start) and merged while the gap to
+    the intervals before them is at most max_gap and the combined span still
+    fits the largest supported size. A merged group is widened to the
+    smallest supported size covering it; groups of one keep their bounds.
+
+    Args:
+        items: (chromosome, start, end) tuples
+        max_gap: Maximum distance in bp between merged intervals
+        sizes: Supported window sizes
+
+    Returns:
+        Tuple (windows, mapping) where windows is a list of (chromosome, start, end)
+        and mapping[i] is (window_index, offset, length) of items[i] in its window
+    """
+    sizes = np.sort(np.asarray(sizes, dtype=np.int64))
+    max_size = int(sizes[-1])
+    windows: List[Tuple[str, int, int]] = []
+    mapping: List[Tuple[int, int, int]] = [None] * len(items)
+
+    by_chromosome: Dict[str, List[int]] = {}
+    for i, item in enumerate(items):
+        by_chromosome.setdefault(item[0], []).append(i)
+
+    for chromosome in sorted(by_chromosome):
+        indices = np.asarray(by_chromosome[chromosome])
+        starts = np.fromiter((items[i][1] for i in indices), dtype=np.int64, count=len(indices))
+        ends = np.fromiter((items[i][2] for i in indices), dtype=np.int64, count=len(indices))
+        order = np.lexsort((ends, starts))
+        indices, starts, ends = indices[order], starts[order], ends[order]
+
+        # A new group starts wherever the gap to everything before it exceeds max_gap
+        reach = np.maximum.accumulate(ends)
+        breaks = np.flatnonzero(starts[1:] - reach[:-1] > max_gap) + 1
+        bounds = np.concatenate(([0], breaks, [len(indices)]))
+
+        for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+            while lo < hi:
+                # Take members while the window span fits the largest size
+                limit = min(hi, int(np.searchsorted(starts, starts[lo] + max_size, side='right')))
+                spans = np.maximum.accumulate(ends[lo:limit]) - starts[lo]
+                cut = lo + max(1, int(np.searchsorted(spans, max_size, side='right')))
+
+                window_start = int(starts[lo])
+                if cut - lo == 1:
+                    window_end = int(ends[lo])
+                else:
+                    span = int(spans[cut - lo - 1])
+                    window_end = window_start + int(sizes[np.searchsorted(sizes, span)])
+
+                window_index = len(windows)
+                windows.append((chromosome, window_start, window_end))
+                for k in range(lo, cut):
+                    mapping[indices[k]] = (window_index, int(starts[k]) - window_start,
+                                           int(ends[k] - starts[k]))
+                lo = cut
+
+    return windows, mapping
+
+
+def slice_predictions(predictions: Dict[str, Any], window_start: int, window_end: int,
+                      offset: int, length: int,
+                      recomputed: Iterable[str] = ()) -> Optional[Dict[str, Any]]:
+    """
+    Cut one interval's share out of a merged window's predictions.
+
+    Numeric tracks (lists or arrays) are treated as n uniform bins over the
+    window, bin i covering [i * L / n, (i + 1) * L / n) of a window of length
+    L, and the bins overlapping the interval are kept; n need not divide L.
+    Lists of records with a "position" are filtered to the interval. Values
+    named in recomputed (e.g. a summary the caller rebuilds from the sliced
+    tracks) are left out.
+
+    Returns None if any other value cannot be sliced, so that the caller
+    predicts the interval on its own instead of losing data.
+    """
+    window_length = window_end - window_start
+    start = window_start + offset
+    end = start + length
+
+    sliced = {}
+    for name, value in predictions.items():
+        if name in recomputed:
+            continue
+        if not isinstance(value, (list, np.ndarray)):
+            return None
+        if len(value):
+            first = value[0]
+            if isinstance(first, dict) and 'position' in first:
+                value = [v for v in value if start <= v.get('position', -1) < end]
+            elif isinstance(first, (int, float, np.number)) and not isinstance(first, bool):
+                n = len(value)
+                value = value[offset * n // window_length:-(-(offset + length) * n // window_length)]
+            else:
+                return None
+        sliced[name] = value
+    return sliced
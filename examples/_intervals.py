@@ -0,0 +1,127 @@
+"""
+Region index for variant-in-interval lookups.
+
+Finding which of M candidate regions contain each of N variants by pairwise
+comparison costs O(N*M). RegionIndex answers each lookup in O(log M + k)
+using a nested containment list (ncls) when it is installed, and sorted
+NumPy arrays with a running maximum of the region ends otherwise.
+
+Variant positions are 1-based and region coordinates 0-based half-open, so
+a region contains a variant when start < position <= end.
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from ncls import NCLS
+except ImportError:
+    NCLS = None
+
+_REGION_RE = re.compile(r'^(\w+):(\d+)-(\d+)$')
+
+
+class RegionIndex:
+    """Static set of (chromosome, start, end) regions indexed for point lookups."""
+
+    def __init__(self, regions: Sequence[Tuple[str, int, int]], names: Optional[Sequence[str]] = None):
+        self.regions = [(chromosome, int(start), int(end)) for chromosome, start, end in regions]
+        self.names = list(names) if names is not None else [f"{c}:{s}-{e}" for c, s, e in self.regions]
+        self._index: Dict[str, tuple] = {}
+
+        by_chromosome: Dict[str, List[int]] = {}
+        for i, (chromosome, _, _) in enumerate(self.regions):
+            by_chromosome.setdefault(chromosome.lower(), []).append(i)
+
+        for chromosome, ids in by_chromosome.items():
+            ids = np.asarray(ids, dtype=np.int64)
+            starts = np.array([self.regions[i][1] for i in ids], dtype=np.int64)
+            ends = np.array([self.regions[i][2] for i in ids], dtype=np.int64)
+            if NCLS is not None:
+                self._index[chromosome] = (NCLS(starts, ends, ids),)
+            else:
+                order = np.argsort(starts, kind='stable')
+                ids, starts, ends = ids[order], starts[order], ends[order]
+                self._index[chromosome] = (None, ids, starts, ends, np.maximum.accumulate(ends))
+
+    def __len__(self) -> int:
+        return len(self.regions)
+
+    def find(self, chromosome: str, position: int) -> List[int]:
+        """Return the indices of all regions containing a 1-based position."""
+        entry = self._index.get(chromosome.lower())
+        if entry is None:
+            return []
+        if entry[0] is not None:
+            return sorted(int(region_id) for _, _, region_id in entry[0].find_overlap(position - 1, position))
+
+        _, ids, starts, ends, max_ends = entry
+        found = []
+        # Regions starting before the position, scanned backwards until no
+        # earlier region can reach it
+        j = int(np.searchsorted(starts, position, side='left')) - 1
+        while j >= 0 and max_ends[j] >= position:
+            if ends[j] >= position:
+                found.append(int(ids[j]))
+            j -= 1
+        return sorted(found)
+
+    def find_many(self, chromosomes: Sequence[str], positions: Sequence[int]) -> List[List[int]]:
+        """Return the containing region indices for every (chromosome, position) pair."""
+        chromosomes = [c.lower() for c in chromosomes]
+        positions = np.asarray(positions, dtype=np.int64)
+        matches: List[List[int]] = [[] for _ in range(len(positions))]
+
+        queries: Dict[str, List[int]] = {}
+        for i, chromosome in enumerate(chromosomes):
+            queries.setdefault(chromosome, []).append(i)
+
+        for chromosome, query_ids in queries.items():
+            entry = self._index.get(chromosome)
+            if entry is None:
+                continue
+            if entry[0] is None:
+                for i in query_ids:
+                    matches[i] = self.find(chromosome, int(positions[i]))
+                continue
+
+            query_ids = np.asarray(query_ids, dtype=np.int64)
+            query_positions = positions[query_ids]
+            hits, region_ids = entry[0].all_overlaps_both(query_positions - 1, query_positions, query_ids)
+            for i, region_id in zip(hits.tolist(), region_ids.tolist()):
+                matches[i].append(region_id)
+            for i in query_ids.tolist():
+                matches[i].sort()
+
+        return matches
+
+
+def load_regions(file_path: str) -> RegionIndex:
+    """
+    Load regions from a BED-like file (chromosome, start, end[, name]) or one chr:start-end per line.
+
+    Comment, track and browser lines and lines without integer coordinates
+    (e.g. a header row) are skipped.
+    """
+    regions = []
+    names = []
+    with open(file_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(('#', 'track', 'browser')):
+                continue
+            match = _REGION_RE.match(line)
+            if match:
+                chromosome, start, end = match.group(1), int(match.group(2)), int(match.group(3))
+                name = line
+            else:
+                fields = line.split('\t') if '\t' in line else line.split()
+                if len(fields) < 3 or not (fields[1].isdigit() and fields[2].isdigit()):
+                    continue
+                chromosome, start, end = fields[0], int(fields[1]), int(fields[2])
+                name = fields[3] if len(fields) > 3 else f"{chromosome}:{start}-{end}"
+            regions.append((chromosome, start, end))
+            names.append(name)
+    return RegionIndex(regions, names)
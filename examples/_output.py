@@ -0,0 +1,47 @@
+"""
+JSON output helpers for the use case scripts.
+
+Uses orjson when it is installed (faster, writes bytes directly and handles
+NumPy arrays) and falls back to the standard library json module otherwise.
+"""
+
+import json
+import sys
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize obj to JSON bytes, indented by two spaces if pretty."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if pretty else None).encode()
+
+
+def write(obj: Any, output_path: Optional[str] = None, pretty: bool = False) -> None:
+    """Write obj as JSON to output_path, or to stdout followed by a newline."""
+    data = dumps(obj, pretty)
+    if output_path:
+        with open(output_path, 'wb') as f:
+            f.write(data)
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data + b'\n')
+        sys.stdout.buffer.flush()
+
+
+def emit(obj: Any, args: Any) -> None:
+    """
+    Write obj as JSON according to the parsed command line arguments.
+
+    Reads --output and --pretty from args with defaults, so it can be used on
+    any code path, including error handling with a partially filled namespace.
+    """
+    write(obj, getattr(args, 'output', None), getattr(args, 'pretty', False))
@@ -8,33 +8,68 @@ transcription start sites, and regulatory elements.
 Example usage:
     python examples/use_case_1_dna_sequence_prediction.py --sequence "ATGCGATCGTAGCTAGCATGCAAATTTGGGCCC" --output-types atac cage dnase
     python examples/use_case_1_dna_sequence_prediction.py --input examples/data/sample_sequence.txt
+    python examples/use_case_1_dna_sequence_prediction.py --batch-file sequences.jsonl --output results.jsonl
 """
 
 import argparse
-import json
+import mmap
 import sys
 import os
+from functools import lru_cache, partial
+from pathlib import Path
 from typing import List, Optional
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
+import _cache
+import _client
+import _output
 
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+# Byte tables for sequence cleaning: upper-case a/t/g/c/n and drop everything else
+_UPPER = bytes.maketrans(b'atgcn', b'ATGCN')
+_DELETE = bytes(b for b in range(256) if chr(b).upper() not in 'ATGCN')
+_DNA_CHARS = b'ATGCNatgcn'
+
+# Sequence files at least this large are memory-mapped
+_MMAP_THRESHOLD = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _allowed_mask():
+    """Return numpy and a mask of the byte values allowed in a DNA sequence, or None without numpy."""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    allowed = np.zeros(256, dtype=bool)
+    allowed[list(_DNA_CHARS)] = True
+    return np, allowed
+
+
+def _has_invalid_dna_chars(sequence: str) -> bool:
+    """Return True if sequence contains anything other than A, T, G, C, N (any case)."""
+    data = sequence.encode('ascii', 'replace')
+    numpy_mask = _allowed_mask()
+    if numpy_mask is None:
+        return bool(data.translate(None, delete=_DNA_CHARS))
+    np, allowed = numpy_mask
+    counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+    return bool(counts[~allowed].any())
 
 
 def load_sequence_from_file(file_path: str) -> str:
     """Load DNA sequence from a text file."""
     try:
-        with open(file_path, 'r') as f:
-            # Read first line and strip whitespace
-            sequence = f.readline().strip()
-            # Remove any non-DNA characters
-            sequence = ''.join(c.upper() for c in sequence if c.upper() in 'ATGCN')
-            return sequence
+        with open(file_path, 'rb') as f:
+            # Read first line; large files are memory-mapped and sliced up to
+            # the first newline instead of growing a readline buffer
+            if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+                data = f.readline()
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = mm.find(b'\n')
+                    data = mm[:end] if end >= 0 else mm[:]
+
+        # Upper-case it and remove any non-DNA characters
+        return data.strip().translate(_UPPER, delete=_DELETE).decode('ascii')
     except Exception as e:
         raise ValueError(f"Could not read sequence from {file_path}: {e}")
 
@@ -54,20 +89,27 @@ def predict_dna_sequence(sequence: str, organism: str = "human",
     Returns:
         Dictionary with prediction results
     """
-    if not api_key:
-        # Try to get from environment
-        api_key = os.getenv('ALPHAGENOME_API_KEY')
-        if not api_key:
-            raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    api_key = _client.client_api_key(api_key)
 
     try:
-        client = AlphaGenomeClient(api_key)
+        client = _client.get_client(api_key)
+
+        # Serve repeated requests from the on-disk result cache
+        cache_key = _cache.make_key("predict_sequence", {
+            "client": _client.identity(client),
+            "sequence": sequence.upper(),
+            "organism": organism,
+            "output_types": _cache.output_types_key(output_types)
+        })
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         result = client.predict_sequence(
             sequence=sequence,
             organism=organism,
             output_types=output_types
         )
-        return result
     except Exception as e:
         return {
             "success": False,
@@ -75,6 +117,85 @@ def predict_dna_sequence(sequence: str, organism: str = "human",
             "type": type(e).__name__
         }
 
+    _cache.put(cache_key, result)
+    return result
+
+
+def validate_sequence(sequence: str) -> None:
+    """Raise ValueError if the sequence is empty or contains invalid characters."""
+    if not sequence:
+        raise ValueError("DNA sequence cannot be empty")
+
+    # Check for valid DNA characters
+    if _has_invalid_dna_chars(sequence):
+        invalid_chars = set(sequence.upper()) - set('ATGCN')
+        raise ValueError(f"Invalid DNA characters found: {invalid_chars}")
+
+
+def analyze_sequence(sequence: str, organism: str = "human",
+                     output_types: Optional[List[str]] = None,
+                     api_key: Optional[str] = None) -> dict:
+    """
+    Validate a DNA sequence, predict its features and attach analysis metadata.
+
+    Raises:
+        ValueError: If the sequence is empty or contains invalid characters
+    """
+    validate_sequence(sequence)
+
+    result = predict_dna_sequence(
+        sequence=sequence,
+        organism=organism,
+        output_types=output_types,
+        api_key=api_key
+    )
+
+    # Add analysis metadata
+    result['metadata'] = {
+        'sequence_length': len(sequence),
+        'organism': organism,
+        'output_types_requested': output_types or 'all',
+        'script': 'use_case_1_dna_sequence_prediction.py'
+    }
+    return result
+
+
+def analyze_batch_record(record: dict, organism: str = "human",
+                         output_types: Optional[List[str]] = None,
+                         api_key: Optional[str] = None) -> dict:
+    """Analyze one batch record ({"sequence": ...}), returning errors as results."""
+    try:
+        return analyze_sequence(
+            sequence=str(record.get('sequence') or '').strip(),
+            organism=record.get('organism') or organism,
+            output_types=output_types,
+            api_key=api_key
+        )
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "type": type(e).__name__,
+            "script": "use_case_1_dna_sequence_prediction.py"
+        }
+
+
+def preflight_batch(records: List[dict]) -> List[Optional[dict]]:
+    """Validate a chunk of batch records before dispatch: an error result per invalid record, None for valid ones."""
+    errors = []
+    for record in records:
+        try:
+            validate_sequence(str(record.get('sequence') or '').strip())
+            errors.append(None)
+        except Exception as e:
+            errors.append({
+                "success": False,
+                "error": str(e),
+                "type": type(e).__name__,
+                "script": "use_case_1_dna_sequence_prediction.py"
+            })
+    return errors
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -90,6 +211,12 @@ Examples:
 
   # Generate all available outputs
   python %(prog)s --sequence "ATGCGATCGTAGCTAGCATGC" --all-outputs
+
+  # Analyze many sequences at once (JSONL with a "sequence" field, or TSV with a header)
+  python %(prog)s --batch-file sequences.jsonl --output results.jsonl --concurrency 16
+
+  # Spread a large batch over 4 worker processes (add --threads for a thread pool)
+  python %(prog)s --batch-file sequences.jsonl --output results.jsonl --jobs 4
         """
     )
 
@@ -99,6 +226,8 @@ Examples:
                            help='DNA sequence string (A, T, G, C, N)')
     input_group.add_argument('--input', '-i',
                            help='Path to text file containing DNA sequence')
+    input_group.add_argument('--batch-file',
+                           help='JSONL/TSV file with one sequence per record; results are written as JSONL')
 
     # Analysis options
     parser.add_argument('--organism', default='human',
@@ -107,6 +236,20 @@ Examples:
                        help='Specific output types to request (e.g., atac cage dnase)')
     parser.add_argument('--all-outputs', action='store_true',
                        help='Request all available output types')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Maximum number of predictions in flight in batch mode (default: 8)')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Run batch records in N worker processes instead of threads')
+    parser.add_argument('--threads', action='store_true',
+                       help='With --jobs, use a thread pool instead of worker processes')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk result cache (~/.cache/alphagenome)')
+    parser.add_argument('--refresh-cache', action='store_true',
+                       help='Ignore cached results and store fresh ones (cached HTTP responses are revalidated)')
+    parser.add_argument('--http-cache', action='store_true',
+                       help='Also cache HTTP responses (requires requests-cache)')
+    parser.add_argument('--cache-ttl', type=float, default=_cache.DEFAULT_TTL,
+                       help=f'Maximum age of cached results in seconds (default: {_cache.DEFAULT_TTL}, 0 = no expiry)')
 
     # API options
     parser.add_argument('--api-key',
@@ -119,56 +262,56 @@ Examples:
                        help='Pretty print JSON output')
 
     args = parser.parse_args()
+    _cache.configure(enabled=not args.no_cache, ttl=args.cache_ttl, refresh=args.refresh_cache,
+                     http_cache=args.http_cache)
 
     try:
+        # Set output types
+        output_types = args.output_types if not args.all_outputs else None
+
+        # Batch mode: one JSON line per record
+        if args.batch_file:
+            from _batch import iter_batch_records, run_batch, run_batch_pool
+
+            worker = partial(analyze_batch_record, organism=args.organism,
+                             output_types=output_types, api_key=args.api_key)
+            records = iter_batch_records(args.batch_file)
+            if args.jobs:
+                counts = run_batch_pool(
+                    worker, records,
+                    output_path=args.output,
+                    jobs=args.jobs,
+                    threads=args.threads,
+                    initializer=_cache.configure,
+                    initargs=(not args.no_cache, args.cache_ttl, args.refresh_cache, args.http_cache),
+                    preflight=preflight_batch
+                )
+            else:
+                counts = run_batch(worker, records, output_path=args.output,
+                                   concurrency=args.concurrency, preflight=preflight_batch)
+            print(f"Processed {counts['total']} records ({counts['failed']} failed)", file=sys.stderr)
+            if counts['failed']:
+                sys.exit(1)
+            return
+
         # Get DNA sequence
         if args.sequence:
             sequence = args.sequence.strip()
         else:
             sequence = load_sequence_from_file(args.input)
 
-        # Validate sequence
-        if not sequence:
-            raise ValueError("DNA sequence cannot be empty")
-
-        # Check for valid DNA characters
-        valid_chars = set('ATGCN')
-        invalid_chars = set(sequence.upper()) - valid_chars
-        if invalid_chars:
-            raise ValueError(f"Invalid DNA characters found: {invalid_chars}")
-
-        # Set output types
-        output_types = args.output_types if not args.all_outputs else None
-
-        # Make prediction
-        result = predict_dna_sequence(
+        # Validate sequence and make prediction
+        result = analyze_sequence(
             sequence=sequence,
             organism=args.organism,
             output_types=output_types,
             api_key=args.api_key
         )
 
-        # Add analysis metadata
-        result['metadata'] = {
-            'sequence_length': len(sequence),
-            'organism': args.organism,
-            'output_types_requested': output_types or 'all',
-            'script': 'use_case_1_dna_sequence_prediction.py'
-        }
-
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if prediction failed
         if not result.get('success', False):
@@ -182,12 +325,7 @@ Examples:
             "script": "use_case_1_dna_sequence_prediction.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
@@ -8,23 +8,21 @@ chromatin accessibility, and other genomic features.
 Example usage:
     python examples/use_case_2_genomic_interval_analysis.py --chromosome chr1 --start 1000000 --end 1002048
     python examples/use_case_2_genomic_interval_analysis.py --interval chr1:1000000-1002048 --output-types atac cage
+    python examples/use_case_2_genomic_interval_analysis.py --batch-file intervals.tsv --output results.jsonl
 """
 
 import argparse
-import json
 import sys
-import os
 import re
-from typing import List, Optional
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
+import _cache
+import _client
+import _output
 
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+# Precompiled input format (chr:start-end)
+_INTERVAL_RE = re.compile(r'^(\w+):(\d+)-(\d+)$')
 
 
 def parse_interval_string(interval_str: str) -> tuple:
@@ -33,8 +31,7 @@ def parse_interval_string(interval_str: str) -> tuple:
 
     Example: "chr1:1000000-1002048" -> ("chr1", 1000000, 1002048)
     """
-    pattern = r'^(\w+):(\d+)-(\d+)$'
-    match = re.match(pattern, interval_str)
+    match = _INTERVAL_RE.match(interval_str)
     if not match:
         raise ValueError(f"Invalid interval format: {interval_str}. Expected format: chr:start-end")
 
@@ -66,14 +63,24 @@ def predict_genomic_interval(chromosome: str, start: int, end: int,
     Returns:
         Dictionary with prediction results
     """
-    if not api_key:
-        # Try to get from environment
-        api_key = os.getenv('ALPHAGENOME_API_KEY')
-        if not api_key:
-            raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    api_key = _client.client_api_key(api_key)
 
     try:
-        client = AlphaGenomeClient(api_key)
+        client = _client.get_client(api_key)
+
+        # Serve repeated requests from the on-disk result cache
+        cache_key = _cache.make_key("predict_interval", {
+            "client": _client.identity(client),
+            "chromosome": chromosome,
+            "start": start,
+            "end": end,
+            "organism": organism,
+            "output_types": _cache.output_types_key(output_types)
+        })
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         result = client.predict_interval(
             chromosome=chromosome,
             start=start,
@@ -81,7 +88,6 @@ def predict_genomic_interval(chromosome: str, start: int, end: int,
             organism=organism,
             output_types=output_types
         )
-        return result
     except Exception as e:
         return {
             "success": False,
@@ -89,6 +95,223 @@ def predict_genomic_interval(chromosome: str, start: int, end: int,
             "type": type(e).__name__
         }
 
+    _cache.put(cache_key, result)
+    return result
+
+
+def validate_coordinates(start: int, end: int) -> None:
+    """Raise ValueError unless 0 <= start < end."""
+    if start < 0:
+        raise ValueError("Start position cannot be negative")
+    if start >= end:
+        raise ValueError("Start position must be less than end position")
+
+
+def analyze_interval(chromosome: str, start: int, end: int,
+                     organism: str = "human",
+                     output_types: Optional[List[str]] = None,
+                     api_key: Optional[str] = None) -> dict:
+    """
+    Validate interval coordinates, predict features and attach analysis metadata.
+
+    Raises:
+        ValueError: If the coordinates are invalid
+    """
+    validate_coordinates(start, end)
+
+    # Calculate interval size
+    interval_size = end - start
+
+    # Common AlphaGenome interval sizes
+    supported_sizes = [2048, 16384, 131072, 524288, 1048576]  # 2KB, 16KB, 131KB, 524KB, 1MB
+    if interval_size not in supported_sizes:
+        print(f"Warning: Interval size {interval_size}bp may not be optimal.", file=sys.stderr)
+        print(f"Recommended sizes: {', '.join(f'{s}bp' for s in supported_sizes)}", file=sys.stderr)
+
+    result = predict_genomic_interval(
+        chromosome=chromosome,
+        start=start,
+        end=end,
+        organism=organism,
+        output_types=output_types,
+        api_key=api_key
+    )
+
+    # Add analysis metadata
+    result['metadata'] = {
+        'chromosome': chromosome,
+        'start': start,
+        'end': end,
+        'interval_size': interval_size,
+        'organism': organism,
+        'output_types_requested': output_types or 'all',
+        'script': 'use_case_2_genomic_interval_analysis.py'
+    }
+    return result
+
+
+def parse_batch_record(record: dict) -> tuple:
+    """
+    Get (chromosome, start, end) from a batch record.
+
+    Records provide either an "interval" (chr:start-end) or "chromosome", "start" and "end".
+    """
+    if record.get('interval'):
+        return parse_interval_string(str(record['interval']).strip())
+    return record['chromosome'], int(record['start']), int(record['end'])
+
+
+def analyze_batch_record(record: dict, organism: str = "human",
+                         output_types: Optional[List[str]] = None,
+                         api_key: Optional[str] = None) -> dict:
+    """Analyze one batch record (see parse_batch_record), returning errors as results."""
+    try:
+        chromosome, start, end = parse_batch_record(record)
+        return analyze_interval(
+            chromosome=chromosome,
+            start=start,
+            end=end,
+            organism=record.get('organism') or organism,
+            output_types=output_types,
+            api_key=api_key
+        )
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "type": type(e).__name__,
+            "script": "use_case_2_genomic_interval_analysis.py"
+        }
+
+
+def preflight_batch(records: List[dict]) -> List[Optional[dict]]:
+    """Validate a chunk of batch records before dispatch: an error result per invalid record, None for valid ones."""
+    errors = []
+    for record in records:
+        try:
+            _, start, end = parse_batch_record(record)
+            validate_coordinates(start, end)
+            errors.append(None)
+        except Exception as e:
+            errors.append({
+                "success": False,
+                "error": str(e),
+                "type": type(e).__name__,
+                "script": "use_case_2_genomic_interval_analysis.py"
+            })
+    return errors
+
+
+def summarize_predictions(predictions: dict) -> dict:
+    """Recompute the prediction summary (score count, peak count, mean score) from the tracks."""
+    summary = {}
+    scores = predictions.get('atac_accessibility_scores')
+    peaks = predictions.get('peaks')
+    if scores is not None:
+        summary['total_scores'] = len(scores)
+    if peaks is not None:
+        summary['peaks_detected'] = len(peaks)
+    if scores is not None and len(scores):
+        summary['mean_accessibility'] = round(float(sum(scores)) / len(scores), 4)
+    return summary
+
+
+def analyze_merged_batch(records: Iterable[dict], merge_distance: int,
+                         organism: str = "human",
+                         output_types: Optional[List[str]] = None,
+                         api_key: Optional[str] = None,
+                         concurrency: int = 8) -> Iterator[dict]:
+    """
+    Analyze batch records, predicting nearby intervals as one merged window.
+
+    Intervals of the same organism and chromosome within merge_distance bp of
+    each other are clustered into a window of a supported size, each window
+    is predicted once, and every record gets its slice of the window's
+    tracks. A record whose share cannot be cut out of the window is predicted
+    on its own. Results are yielded in record order.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from _cluster import cluster_intervals, slice_predictions
+
+    results: List[Optional[dict]] = []
+    groups: Dict[str, List[tuple]] = {}
+    for index, record in enumerate(records):
+        results.append(None)
+        try:
+            chromosome, start, end = parse_batch_record(record)
+            validate_coordinates(start, end)
+        except Exception as e:
+            results[index] = {
+                "success": False,
+                "error": str(e),
+                "type": type(e).__name__,
+                "script": "use_case_2_genomic_interval_analysis.py"
+            }
+            continue
+        groups.setdefault(record.get('organism') or organism, []).append((index, chromosome, start, end))
+
+    # Cluster per organism; windows of all organisms are predicted together
+    windows = []
+    members = []
+    for group_organism, group in groups.items():
+        group_windows, mapping = cluster_intervals([item[1:] for item in group], merge_distance)
+        base = len(windows)
+        windows.extend((group_organism,) + window for window in group_windows)
+        members.extend((item, base + window_index, offset, length)
+                       for item, (window_index, offset, length) in zip(group, mapping))
+
+    def predict_window(window: tuple) -> dict:
+        window_organism, chromosome, start, end = window
+        return predict_genomic_interval(chromosome, start, end, window_organism, output_types, api_key)
+
+    def record_metadata(chromosome: str, start: int, end: int, record_organism: str,
+                        merged_window: Optional[str]) -> dict:
+        return {
+            'chromosome': chromosome,
+            'start': start,
+            'end': end,
+            'interval_size': end - start,
+            'merged_window': merged_window,
+            'organism': record_organism,
+            'output_types_requested': output_types or 'all',
+            'script': 'use_case_2_genomic_interval_analysis.py'
+        }
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        window_results = list(executor.map(predict_window, windows))
+
+        # Records whose window predictions cannot be cut to their interval
+        unsliced = []
+        for (index, chromosome, start, end), window_index, offset, length in members:
+            window_organism, _, window_start, window_end = windows[window_index]
+            result = dict(window_results[window_index])
+            if result.get('success', False) and (window_start, window_end) != (start, end):
+                window_predictions = result.get('predictions') or {}
+                predictions = slice_predictions(window_predictions, window_start, window_end,
+                                                offset, length, recomputed=('summary',))
+                if predictions is None:
+                    unsliced.append((window_organism, chromosome, start, end, index))
+                    continue
+                if 'summary' in window_predictions:
+                    predictions['summary'] = summarize_predictions(predictions)
+                result['predictions'] = predictions
+                result['interval'] = f"{chromosome}:{start}-{end}"
+                if 'interval_info' in result:
+                    result['interval_info'] = {**result['interval_info'],
+                                               'start': start, 'end': end, 'length': end - start}
+            result['metadata'] = record_metadata(chromosome, start, end, window_organism,
+                                                 f"{chromosome}:{window_start}-{window_end}")
+            results[index] = result
+
+        # Predict those on their own rather than return them with tracks missing
+        for item, result in zip(unsliced, executor.map(predict_window, [item[:4] for item in unsliced])):
+            record_organism, chromosome, start, end, index = item
+            result = dict(result)
+            result['metadata'] = record_metadata(chromosome, start, end, record_organism, None)
+            results[index] = result
+
+    return iter(results)
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -105,6 +328,15 @@ Examples:
   # Analyze with specific organism
   python %(prog)s --interval chrX:100000-102048 --organism human
 
+  # Analyze many intervals at once (JSONL/TSV with "interval" or "chromosome", "start", "end")
+  python %(prog)s --batch-file intervals.tsv --output results.jsonl --concurrency 16
+
+  # Spread a large batch over 4 worker processes (add --threads for a thread pool)
+  python %(prog)s --batch-file intervals.tsv --output results.jsonl --jobs 4
+
+  # Predict intervals within 1kb of each other as one window and slice the tracks
+  python %(prog)s --batch-file intervals.tsv --output results.jsonl --merge-distance 1000
+
 Note: The AlphaGenome API supports specific sequence lengths (2KB, 16KB, 131KB, 524KB, 1MB).
 Common 2KB interval: end = start + 2048
         """
@@ -114,6 +346,8 @@ Common 2KB interval: end = start + 2048
     input_group = parser.add_mutually_exclusive_group(required=True)
     input_group.add_argument('--interval',
                            help='Interval in format chr:start-end (e.g., chr1:1000000-1002048)')
+    input_group.add_argument('--batch-file',
+                           help='JSONL/TSV file with one interval per record; results are written as JSONL')
 
     coord_group = parser.add_argument_group('coordinate specification')
     coord_group.add_argument('--chromosome',
@@ -130,6 +364,23 @@ Common 2KB interval: end = start + 2048
                        help='Specific output types to request (e.g., atac cage dnase)')
     parser.add_argument('--all-outputs', action='store_true',
                        help='Request all available output types')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Maximum number of predictions in flight in batch mode (default: 8)')
+    parser.add_argument('--merge-distance', type=int,
+                       help='In batch mode, predict intervals within this many bp of each other '
+                            'as one merged window and slice the results')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Run batch records in N worker processes instead of threads')
+    parser.add_argument('--threads', action='store_true',
+                       help='With --jobs, use a thread pool instead of worker processes')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk result cache (~/.cache/alphagenome)')
+    parser.add_argument('--refresh-cache', action='store_true',
+                       help='Ignore cached results and store fresh ones (cached HTTP responses are revalidated)')
+    parser.add_argument('--http-cache', action='store_true',
+                       help='Also cache HTTP responses (requires requests-cache)')
+    parser.add_argument('--cache-ttl', type=float, default=_cache.DEFAULT_TTL,
+                       help=f'Maximum age of cached results in seconds (default: {_cache.DEFAULT_TTL}, 0 = no expiry)')
 
     # API options
     parser.add_argument('--api-key',
@@ -142,8 +393,44 @@ Common 2KB interval: end = start + 2048
                        help='Pretty print JSON output')
 
     args = parser.parse_args()
+    _cache.configure(enabled=not args.no_cache, ttl=args.cache_ttl, refresh=args.refresh_cache,
+                     http_cache=args.http_cache)
 
     try:
+        # Set output types
+        output_types = args.output_types if not args.all_outputs else None
+
+        # Batch mode: one JSON line per record
+        if args.batch_file:
+            from _batch import iter_batch_records, run_batch, run_batch_pool, write_results
+
+            worker = partial(analyze_batch_record, organism=args.organism,
+                             output_types=output_types, api_key=args.api_key)
+            records = iter_batch_records(args.batch_file)
+            if args.merge_distance is not None:
+                counts = write_results(
+                    analyze_merged_batch(records, args.merge_distance, args.organism,
+                                         output_types, args.api_key, args.concurrency),
+                    output_path=args.output
+                )
+            elif args.jobs:
+                counts = run_batch_pool(
+                    worker, records,
+                    output_path=args.output,
+                    jobs=args.jobs,
+                    threads=args.threads,
+                    initializer=_cache.configure,
+                    initargs=(not args.no_cache, args.cache_ttl, args.refresh_cache, args.http_cache),
+                    preflight=preflight_batch
+                )
+            else:
+                counts = run_batch(worker, records, output_path=args.output,
+                                   concurrency=args.concurrency, preflight=preflight_batch)
+            print(f"Processed {counts['total']} records ({counts['failed']} failed)", file=sys.stderr)
+            if counts['failed']:
+                sys.exit(1)
+            return
+
         # Parse interval coordinates
         if args.interval:
             chromosome, start, end = parse_interval_string(args.interval)
@@ -152,26 +439,8 @@ Common 2KB interval: end = start + 2048
                 raise ValueError("Either --interval or all of --chromosome, --start, --end must be provided")
             chromosome, start, end = args.chromosome, args.start, args.end
 
-        # Validate coordinates
-        if start < 0:
-            raise ValueError("Start position cannot be negative")
-        if start >= end:
-            raise ValueError("Start position must be less than end position")
-
-        # Calculate interval size
-        interval_size = end - start
-
-        # Common AlphaGenome interval sizes
-        supported_sizes = [2048, 16384, 131072, 524288, 1048576]  # 2KB, 16KB, 131KB, 524KB, 1MB
-        if interval_size not in supported_sizes:
-            print(f"Warning: Interval size {interval_size}bp may not be optimal.", file=sys.stderr)
-            print(f"Recommended sizes: {', '.join(f'{s}bp' for s in supported_sizes)}", file=sys.stderr)
-
-        # Set output types
-        output_types = args.output_types if not args.all_outputs else None
-
-        # Make prediction
-        result = predict_genomic_interval(
+        # Validate coordinates and make prediction
+        result = analyze_interval(
             chromosome=chromosome,
             start=start,
             end=end,
@@ -180,30 +449,10 @@ Common 2KB interval: end = start + 2048
             api_key=args.api_key
         )
 
-        # Add analysis metadata
-        result['metadata'] = {
-            'chromosome': chromosome,
-            'start': start,
-            'end': end,
-            'interval_size': interval_size,
-            'organism': args.organism,
-            'output_types_requested': output_types or 'all',
-            'script': 'use_case_2_genomic_interval_analysis.py'
-        }
-
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if prediction failed
         if not result.get('success', False):
@@ -217,12 +466,7 @@ Common 2KB interval: end = start + 2048
             "script": "use_case_2_genomic_interval_analysis.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
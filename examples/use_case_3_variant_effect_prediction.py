@@ -8,23 +8,25 @@ on genomic features and regulatory elements.
 Example usage:
     python examples/use_case_3_variant_effect_prediction.py --variant chr1:1001000A>G --interval chr1:1000000-1002048
     python examples/use_case_3_variant_effect_prediction.py --chromosome chr1 --position 1001000 --ref A --alt G --interval-start 1000000 --interval-end 1002048
+    python examples/use_case_3_variant_effect_prediction.py --batch-file variants.tsv --output results.jsonl
 """
 
 import argparse
-import json
 import sys
-import os
 import re
-from typing import List, Optional
+from functools import partial
+from typing import Iterable, Iterator, List, Optional
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
+import _cache
+import _client
+import _output
 
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+# Precompiled input formats (chr:posREF>ALT, chr:start-end)
+_VARIANT_RE = re.compile(r'^(\w+):(\d+)([ATGC]+)>([ATGC]+)$')
+_INTERVAL_RE = re.compile(r'^(\w+):(\d+)-(\d+)$')
+
+# Valid allele bases, deleted with bytes.translate to find invalid characters
+_BASES = b'ATGC'
 
 
 def parse_variant_string(variant_str: str) -> tuple:
@@ -33,8 +35,7 @@ def parse_variant_string(variant_str: str) -> tuple:
 
     Example: "chr1:1001000A>G" -> ("chr1", 1001000, "A", "G")
     """
-    pattern = r'^(\w+):(\d+)([ATGC]+)>([ATGC]+)$'
-    match = re.match(pattern, variant_str.upper())
+    match = _VARIANT_RE.match(variant_str.upper())
     if not match:
         raise ValueError(f"Invalid variant format: {variant_str}. Expected format: chr:posREF>ALT")
 
@@ -46,14 +47,37 @@ def parse_variant_string(variant_str: str) -> tuple:
     return chromosome, position, ref, alt
 
 
+def parse_variants_bulk(lines: Iterable[str]) -> "pd.DataFrame":
+    """
+    Parse many variant strings in one vectorized pass (requires pandas).
+
+    Equivalent to calling parse_variant_string on every line, but the regex
+    matching and integer conversion run in pandas instead of a Python loop.
+
+    Returns:
+        DataFrame with chromosome, position, ref and alt columns and a boolean
+        valid column; rows that do not match chr:posREF>ALT, or whose position
+        has more than 18 digits (which may not fit in int64), have valid=False
+        and position -1
+    """
+    import numpy as np
+    import pandas as pd
+
+    variants = pd.Series(list(lines), dtype=object).fillna('').astype(str).str.upper()
+    df = variants.str.extract(_VARIANT_RE)
+    df.columns = ['chromosome', 'position', 'ref', 'alt']
+    df['valid'] = df['position'].notna() & (df['position'].str.len() <= 18)
+    df['position'] = df['position'].where(df['valid'], '-1').astype(np.int64)
+    return df
+
+
 def parse_interval_string(interval_str: str) -> tuple:
     """
     Parse interval string in format chr:start-end.
 
     Example: "chr1:1000000-1002048" -> ("chr1", 1000000, 1002048)
     """
-    pattern = r'^(\w+):(\d+)-(\d+)$'
-    match = re.match(pattern, interval_str)
+    match = _INTERVAL_RE.match(interval_str)
     if not match:
         raise ValueError(f"Invalid interval format: {interval_str}. Expected format: chr:start-end")
 
@@ -89,14 +113,27 @@ def predict_variant_effect(chromosome: str, position: int, ref: str, alt: str,
     Returns:
         Dictionary with prediction results
     """
-    if not api_key:
-        # Try to get from environment
-        api_key = os.getenv('ALPHAGENOME_API_KEY')
-        if not api_key:
-            raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    api_key = _client.client_api_key(api_key)
 
     try:
-        client = AlphaGenomeClient(api_key)
+        client = _client.get_client(api_key)
+
+        # Serve repeated requests from the on-disk result cache
+        cache_key = _cache.make_key("predict_variant", {
+            "client": _client.identity(client),
+            "chromosome": chromosome,
+            "position": position,
+            "ref": ref,
+            "alt": alt,
+            "interval_start": interval_start,
+            "interval_end": interval_end,
+            "organism": organism,
+            "output_types": _cache.output_types_key(output_types)
+        })
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         result = client.predict_variant(
             chromosome=chromosome,
             position=position,
@@ -107,7 +144,6 @@ def predict_variant_effect(chromosome: str, position: int, ref: str, alt: str,
             organism=organism,
             output_types=output_types
         )
-        return result
     except Exception as e:
         return {
             "success": False,
@@ -115,6 +151,201 @@ def predict_variant_effect(chromosome: str, position: int, ref: str, alt: str,
             "type": type(e).__name__
         }
 
+    _cache.put(cache_key, result)
+    return result
+
+
+def validate_variant(position: int, ref: str, alt: str,
+                     interval_start: int, interval_end: int) -> None:
+    """Raise ValueError unless the variant lies in the interval and its (upper-case) alleles are valid."""
+    if position <= 0:
+        raise ValueError("Position must be positive (1-based)")
+    if interval_start < 0:
+        raise ValueError("Interval start cannot be negative")
+    if interval_start >= interval_end:
+        raise ValueError("Interval start must be less than end")
+
+    # Check if variant position falls within interval
+    # Note: position is 1-based, interval coordinates are 0-based
+    if not (interval_start < position <= interval_end):
+        raise ValueError(f"Variant position {position} must fall within interval [{interval_start}, {interval_end}]")
+
+    # Validate alleles (anything left after deleting A, T, G, C is invalid)
+    if (ref.encode('ascii', 'replace').translate(None, delete=_BASES)
+            or alt.encode('ascii', 'replace').translate(None, delete=_BASES)):
+        raise ValueError("Reference and alternative alleles must contain only A, T, G, C")
+
+
+def analyze_variant(chromosome: str, position: int, ref: str, alt: str,
+                    interval_start: int, interval_end: int,
+                    organism: str = "human",
+                    output_types: Optional[List[str]] = None,
+                    api_key: Optional[str] = None) -> dict:
+    """
+    Validate a variant against its interval, predict its effect and attach analysis metadata.
+
+    Raises:
+        ValueError: If the variant, alleles or interval are invalid
+    """
+    ref = ref.upper()
+    alt = alt.upper()
+    validate_variant(position, ref, alt, interval_start, interval_end)
+
+    result = predict_variant_effect(
+        chromosome=chromosome,
+        position=position,
+        ref=ref,
+        alt=alt,
+        interval_start=interval_start,
+        interval_end=interval_end,
+        organism=organism,
+        output_types=output_types,
+        api_key=api_key
+    )
+
+    # Add analysis metadata
+    result['metadata'] = {
+        'variant': f"{chromosome}:{position}{ref}>{alt}",
+        'chromosome': chromosome,
+        'position': position,
+        'ref_allele': ref,
+        'alt_allele': alt,
+        'interval': f"{chromosome}:{interval_start}-{interval_end}",
+        'interval_size': interval_end - interval_start,
+        'organism': organism,
+        'output_types_requested': output_types or 'all',
+        'script': 'use_case_3_variant_effect_prediction.py'
+    }
+    return result
+
+
+def parse_batch_variant(record: dict) -> tuple:
+    """
+    Get (chromosome, position, ref, alt) from a batch record.
+
+    Records provide either a "variant" (chr:posREF>ALT) or "chromosome", "position", "ref" and "alt".
+    """
+    if record.get('variant'):
+        return parse_variant_string(str(record['variant']).strip())
+    return record['chromosome'], int(record['position']), record['ref'], record['alt']
+
+
+def parse_batch_interval(record: dict, chromosome: str) -> tuple:
+    """
+    Get (interval_start, interval_end) from a batch record for a variant on chromosome.
+
+    Records provide either an "interval" (chr:start-end) or "interval_start" and "interval_end".
+    """
+    if record.get('interval'):
+        interval_chr, interval_start, interval_end = parse_interval_string(str(record['interval']).strip())
+        if chromosome.lower() != interval_chr.lower():
+            raise ValueError(f"Variant chromosome ({chromosome}) must match interval chromosome ({interval_chr})")
+        return interval_start, interval_end
+    if record.get('interval_start') not in (None, '') and record.get('interval_end') not in (None, ''):
+        return int(record['interval_start']), int(record['interval_end'])
+    raise ValueError("No analysis interval: provide \"interval\" or \"interval_start\" and "
+                     "\"interval_end\", or a --regions file containing the variant")
+
+
+def expand_with_regions(records: Iterable[dict], regions: "RegionIndex") -> Iterator[dict]:
+    """
+    Pair batch records without an interval with every region containing their variant.
+
+    All variants are looked up in one bulk query against the region index.
+    A record matching k regions yields k records, each with the region as its
+    "interval" and the region name as "region"; records that already have an
+    interval, fail to parse or match no region are passed through unchanged.
+    """
+    records = list(records)
+    pending = []
+    for index, record in enumerate(records):
+        if record.get('interval') or record.get('interval_start') not in (None, ''):
+            continue
+        try:
+            chromosome, position, _, _ = parse_batch_variant(record)
+        except Exception:
+            # Reported when the record itself is analyzed
+            continue
+        pending.append((index, chromosome, position))
+
+    matches = regions.find_many([item[1] for item in pending], [item[2] for item in pending])
+    region_ids = {item[0]: ids for item, ids in zip(pending, matches)}
+
+    for index, record in enumerate(records):
+        ids = region_ids.get(index)
+        if not ids:
+            yield record
+            continue
+        for region_id in ids:
+            chromosome, start, end = regions.regions[region_id]
+            yield dict(record, interval=f"{chromosome}:{start}-{end}", region=regions.names[region_id])
+
+
+def analyze_batch_record(record: dict, organism: str = "human",
+                         output_types: Optional[List[str]] = None,
+                         api_key: Optional[str] = None) -> dict:
+    """
+    Analyze one batch record, returning errors as results.
+
+    Records provide a variant (see parse_batch_variant) and an interval (see parse_batch_interval).
+    """
+    try:
+        chromosome, position, ref, alt = parse_batch_variant(record)
+        interval_start, interval_end = parse_batch_interval(record, chromosome)
+
+        result = analyze_variant(
+            chromosome=chromosome,
+            position=position,
+            ref=ref,
+            alt=alt,
+            interval_start=interval_start,
+            interval_end=interval_end,
+            organism=record.get('organism') or organism,
+            output_types=output_types,
+            api_key=api_key
+        )
+        if record.get('region'):
+            result['region'] = record['region']
+        return result
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "type": type(e).__name__,
+            "script": "use_case_3_variant_effect_prediction.py"
+        }
+
+
+def preflight_batch(records: List[dict]) -> List[Optional[dict]]:
+    """Validate a chunk of batch records before dispatch: an error result per invalid record, None for valid ones."""
+    # Parse all variant strings in one vectorized pass when pandas is available
+    try:
+        bulk = parse_variants_bulk(str(record.get('variant') or '').strip() for record in records)
+        parsed = list(zip(bulk['valid'].tolist(), bulk['chromosome'].tolist(), bulk['position'].tolist(),
+                          bulk['ref'].tolist(), bulk['alt'].tolist()))
+    except ImportError:
+        parsed = None
+
+    errors = []
+    for index, record in enumerate(records):
+        try:
+            if parsed is not None and record.get('variant') and parsed[index][0]:
+                chromosome, position, ref, alt = parsed[index][1:]
+            else:
+                # Invalid variant strings are re-parsed here to raise the usual error
+                chromosome, position, ref, alt = parse_batch_variant(record)
+            interval_start, interval_end = parse_batch_interval(record, chromosome)
+            validate_variant(position, ref.upper(), alt.upper(), interval_start, interval_end)
+            errors.append(None)
+        except Exception as e:
+            errors.append({
+                "success": False,
+                "error": str(e),
+                "type": type(e).__name__,
+                "script": "use_case_3_variant_effect_prediction.py"
+            })
+    return errors
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -133,6 +364,15 @@ Examples:
   python %(prog)s --variant chr1:1001000A>G --interval chr1:1000000-1002048 \\
                    --output-types atac cage dnase
 
+  # Analyze many variants at once (JSONL/TSV with "variant" and "interval" fields)
+  python %(prog)s --batch-file variants.tsv --output results.jsonl --concurrency 16
+
+  # Analyze each variant in every candidate region (BED) that contains it
+  python %(prog)s --batch-file variants.tsv --regions regions.bed --output results.jsonl
+
+  # Spread a large batch over 4 worker processes (add --threads for a thread pool)
+  python %(prog)s --batch-file variants.tsv --output results.jsonl --jobs 4
+
 Note: The variant position must fall within the analysis interval.
       Typical interval size is 2KB (2048bp) around the variant.
         """
@@ -142,6 +382,8 @@ Note: The variant position must fall within the analysis interval.
     variant_group = parser.add_mutually_exclusive_group()
     variant_group.add_argument('--variant',
                              help='Variant in format chr:posREF>ALT (e.g., chr1:1001000A>G)')
+    variant_group.add_argument('--batch-file',
+                             help='JSONL/TSV file with one variant per record; results are written as JSONL')
 
     # Individual variant parameters
     var_param_group = parser.add_argument_group('variant specification')
@@ -173,6 +415,23 @@ Note: The variant position must fall within the analysis interval.
                        help='Specific output types to request (e.g., atac cage dnase)')
     parser.add_argument('--all-outputs', action='store_true',
                        help='Request all available output types')
+    parser.add_argument('--concurrency', type=int, default=8,
+                       help='Maximum number of predictions in flight in batch mode (default: 8)')
+    parser.add_argument('--regions',
+                       help='BED file (or chr:start-end lines) of candidate regions; in batch mode, '
+                            'variants without an interval are analyzed in every region containing them')
+    parser.add_argument('--jobs', '-j', type=int,
+                       help='Run batch records in N worker processes instead of threads')
+    parser.add_argument('--threads', action='store_true',
+                       help='With --jobs, use a thread pool instead of worker processes')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Do not read or write the on-disk result cache (~/.cache/alphagenome)')
+    parser.add_argument('--refresh-cache', action='store_true',
+                       help='Ignore cached results and store fresh ones (cached HTTP responses are revalidated)')
+    parser.add_argument('--http-cache', action='store_true',
+                       help='Also cache HTTP responses (requires requests-cache)')
+    parser.add_argument('--cache-ttl', type=float, default=_cache.DEFAULT_TTL,
+                       help=f'Maximum age of cached results in seconds (default: {_cache.DEFAULT_TTL}, 0 = no expiry)')
 
     # API options
     parser.add_argument('--api-key',
@@ -185,8 +444,41 @@ Note: The variant position must fall within the analysis interval.
                        help='Pretty print JSON output')
 
     args = parser.parse_args()
+    _cache.configure(enabled=not args.no_cache, ttl=args.cache_ttl, refresh=args.refresh_cache,
+                     http_cache=args.http_cache)
 
     try:
+        # Set output types
+        output_types = args.output_types if not args.all_outputs else None
+
+        # Batch mode: one JSON line per record
+        if args.batch_file:
+            from _batch import iter_batch_records, run_batch, run_batch_pool
+
+            worker = partial(analyze_batch_record, organism=args.organism,
+                             output_types=output_types, api_key=args.api_key)
+            records = iter_batch_records(args.batch_file)
+            if args.regions:
+                from _intervals import load_regions
+                records = expand_with_regions(records, load_regions(args.regions))
+            if args.jobs:
+                counts = run_batch_pool(
+                    worker, records,
+                    output_path=args.output,
+                    jobs=args.jobs,
+                    threads=args.threads,
+                    initializer=_cache.configure,
+                    initargs=(not args.no_cache, args.cache_ttl, args.refresh_cache, args.http_cache),
+                    preflight=preflight_batch
+                )
+            else:
+                counts = run_batch(worker, records, output_path=args.output,
+                                   concurrency=args.concurrency, preflight=preflight_batch)
+            print(f"Processed {counts['total']} records ({counts['failed']} failed)", file=sys.stderr)
+            if counts['failed']:
+                sys.exit(1)
+            return
+
         # Parse variant information
         if args.variant:
             chromosome, position, ref, alt = parse_variant_string(args.variant)
@@ -206,33 +498,12 @@ Note: The variant position must fall within the analysis interval.
                 raise ValueError("Either --interval or both --interval-start and --interval-end must be provided")
             interval_start, interval_end = args.interval_start, args.interval_end
 
-        # Validate inputs
-        if position <= 0:
-            raise ValueError("Position must be positive (1-based)")
-        if interval_start < 0:
-            raise ValueError("Interval start cannot be negative")
-        if interval_start >= interval_end:
-            raise ValueError("Interval start must be less than end")
-
-        # Check if variant position falls within interval
-        # Note: position is 1-based, interval coordinates are 0-based
-        if not (interval_start < position <= interval_end):
-            raise ValueError(f"Variant position {position} must fall within interval [{interval_start}, {interval_end}]")
-
-        # Validate alleles
-        valid_bases = set('ATGC')
-        if not (set(ref.upper()).issubset(valid_bases) and set(alt.upper()).issubset(valid_bases)):
-            raise ValueError("Reference and alternative alleles must contain only A, T, G, C")
-
-        # Set output types
-        output_types = args.output_types if not args.all_outputs else None
-
-        # Make prediction
-        result = predict_variant_effect(
+        # Validate inputs and make prediction
+        result = analyze_variant(
             chromosome=chromosome,
             position=position,
-            ref=ref.upper(),
-            alt=alt.upper(),
+            ref=ref,
+            alt=alt,
             interval_start=interval_start,
             interval_end=interval_end,
             organism=args.organism,
@@ -240,33 +511,10 @@ Note: The variant position must fall within the analysis interval.
             api_key=args.api_key
         )
 
-        # Add analysis metadata
-        result['metadata'] = {
-            'variant': f"{chromosome}:{position}{ref}>{alt}",
-            'chromosome': chromosome,
-            'position': position,
-            'ref_allele': ref.upper(),
-            'alt_allele': alt.upper(),
-            'interval': f"{chromosome}:{interval_start}-{interval_end}",
-            'interval_size': interval_end - interval_start,
-            'organism': args.organism,
-            'output_types_requested': output_types or 'all',
-            'script': 'use_case_3_variant_effect_prediction.py'
-        }
-
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if prediction failed
         if not result.get('success', False):
@@ -280,12 +528,7 @@ Note: The variant position must fall within the analysis interval.
             "script": "use_case_3_variant_effect_prediction.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
@@ -8,23 +8,26 @@ their potential functional impact and pathogenicity.
 Example usage:
     python examples/use_case_4_variant_scoring.py --variant chr1:1001000A>G --interval chr1:1000000-1002048
     python examples/use_case_4_variant_scoring.py --chromosome chr1 --position 1001000 --ref A --alt G --interval-start 1000000 --interval-end 1002048
+    python examples/use_case_4_variant_scoring.py --variants-file variants.tsv --interval chr1:1000000-1002048
 """
 
 import argparse
-import json
+import asyncio
 import sys
-import os
 import re
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
+import _client
+import _output
 
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+# Precompiled input formats (chr:posREF>ALT, chr:start-end)
+_VARIANT_RE = re.compile(r'^(\w+):(\d+)([ATGC]+)>([ATGC]+)$')
+_INTERVAL_RE = re.compile(r'^(\w+):(\d+)-(\d+)$')
+
+# Valid allele bases, deleted with bytes.translate to find invalid characters
+_BASES = b'ATGC'
 
 
 def parse_variant_string(variant_str: str) -> tuple:
@@ -33,8 +36,7 @@ def parse_variant_string(variant_str: str) -> tuple:
 
     Example: "chr1:1001000A>G" -> ("chr1", 1001000, "A", "G")
     """
-    pattern = r'^(\w+):(\d+)([ATGC]+)>([ATGC]+)$'
-    match = re.match(pattern, variant_str.upper())
+    match = _VARIANT_RE.match(variant_str.upper())
     if not match:
         raise ValueError(f"Invalid variant format: {variant_str}. Expected format: chr:posREF>ALT")
 
@@ -46,14 +48,124 @@ def parse_variant_string(variant_str: str) -> tuple:
     return chromosome, position, ref, alt
 
 
+def parse_variant_strings(variant_strs: List[str]) -> List[tuple]:
+    """
+    Parse many variant strings at once, with the same results as parse_variant_string.
+
+    When numba is installed, all strings are scanned in one compiled pass
+    over their concatenated bytes instead of one regex match per string;
+    otherwise (or for non-ASCII input) each string goes through the regex.
+
+    Raises:
+        ValueError: For the first string that is not a valid chr:posREF>ALT
+    """
+    kernel = _variant_kernel()
+    if kernel is None or not variant_strs:
+        return [parse_variant_string(v) for v in variant_strs]
+
+    texts = [v.upper() for v in variant_strs]
+    try:
+        encoded = [t.encode('ascii') for t in texts]
+    except UnicodeEncodeError:
+        return [parse_variant_string(v) for v in variant_strs]
+
+    import numpy as np
+
+    ends = np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)))
+    starts = ends - np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    fields = np.empty((len(encoded), 4), dtype=np.int64)
+    kernel(np.frombuffer(b''.join(encoded), dtype=np.uint8), starts, ends, fields)
+
+    parsed = []
+    for variant_str, text, (chrom_end, digits_end, ref_end, position) in zip(variant_strs, texts, fields.tolist()):
+        if chrom_end < 0:
+            # Invalid, or a position too long for int64: let the regex decide
+            parsed.append(parse_variant_string(variant_str))
+        else:
+            parsed.append((text[:chrom_end], position, text[digits_end:ref_end], text[ref_end + 1:].rstrip('\n')))
+    return parsed
+
+
+def _scan_variants(buf, starts, ends, fields):
+    """
+    Scan chr:posREF>ALT records in buf[starts[k]:ends[k]] (upper-case ASCII).
+
+    Written for numba's nopython mode. For every record, fields[k] receives
+    the chromosome end, the position digits end and the ref allele end (as
+    offsets into the record) and the position, or -1 as chromosome end if
+    the record does not match _VARIANT_RE.
+    """
+    for k in range(len(starts)):
+        start = starts[k]
+        end = ends[k]
+        fields[k, 0] = -1
+        # $ also matches before one trailing newline
+        if end > start and buf[end - 1] == 10:
+            end -= 1
+
+        # Chromosome: one or more word characters up to ':'
+        i = start
+        while i < end and (65 <= buf[i] <= 90 or 48 <= buf[i] <= 57 or buf[i] == 95):
+            i += 1
+        if i == start or i >= end or buf[i] != 58:
+            continue
+        chrom_end = i - start
+
+        # Position: decimal digits (at most 18, so it fits an int64)
+        i += 1
+        digits_start = i
+        position = 0
+        while i < end and 48 <= buf[i] <= 57:
+            position = position * 10 + (int(buf[i]) - 48)
+            i += 1
+        if i == digits_start or i - digits_start > 18:
+            continue
+        digits_end = i - start
+
+        # Ref allele, '>', alt allele: one or more of A, C, G, T each
+        ref_start = i
+        while i < end and (buf[i] == 65 or buf[i] == 67 or buf[i] == 71 or buf[i] == 84):
+            i += 1
+        if i == ref_start or i >= end or buf[i] != 62:
+            continue
+        ref_end = i - start
+        i += 1
+        alt_start = i
+        while i < end and (buf[i] == 65 or buf[i] == 67 or buf[i] == 71 or buf[i] == 84):
+            i += 1
+        if i == alt_start or i != end:
+            continue
+
+        fields[k, 0] = chrom_end
+        fields[k, 1] = digits_end
+        fields[k, 2] = ref_end
+        fields[k, 3] = position
+
+
+@lru_cache(maxsize=1)
+def _variant_kernel():
+    """Compile _scan_variants with numba on first use; None if numba is not installed."""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    kernel = njit(cache=True)(_scan_variants)
+    # Warm up so the first real batch does not pay for compilation
+    sample = np.frombuffer(b'CHR1:1A>G', dtype=np.uint8)
+    kernel(sample, np.zeros(1, dtype=np.int64), np.full(1, len(sample), dtype=np.int64),
+           np.empty((1, 4), dtype=np.int64))
+    return kernel
+
+
 def parse_interval_string(interval_str: str) -> tuple:
     """
     Parse interval string in format chr:start-end.
 
     Example: "chr1:1000000-1002048" -> ("chr1", 1000000, 1002048)
     """
-    pattern = r'^(\w+):(\d+)-(\d+)$'
-    match = re.match(pattern, interval_str)
+    match = _INTERVAL_RE.match(interval_str)
     if not match:
         raise ValueError(f"Invalid interval format: {interval_str}. Expected format: chr:start-end")
 
@@ -67,6 +179,78 @@ def parse_interval_string(interval_str: str) -> tuple:
     return chromosome, start, end
 
 
+def validate_variant(position: int, ref: str, alt: str,
+                     interval_start: int, interval_end: int) -> None:
+    """Raise ValueError unless the variant lies in the interval and its (upper-case) alleles are valid."""
+    if position <= 0:
+        raise ValueError("Position must be positive (1-based)")
+    if interval_start < 0:
+        raise ValueError("Interval start cannot be negative")
+    if interval_start >= interval_end:
+        raise ValueError("Interval start must be less than end")
+
+    # Check if variant position falls within interval
+    # Note: position is 1-based, interval coordinates are 0-based
+    if not (interval_start < position <= interval_end):
+        raise ValueError(f"Variant position {position} must fall within interval [{interval_start}, {interval_end}]")
+
+    # Validate alleles (anything left after deleting A, T, G, C is invalid)
+    if (ref.encode('ascii', 'replace').translate(None, delete=_BASES)
+            or alt.encode('ascii', 'replace').translate(None, delete=_BASES)):
+        raise ValueError("Reference and alternative alleles must contain only A, T, G, C")
+
+
+def load_variants_file(file_path: str,
+                       default_interval: Optional[Tuple[Optional[str], int, int]] = None) -> List[Dict[str, Any]]:
+    """
+    Load and validate variants from a file with one chr:posREF>ALT per line.
+
+    An optional second column (tab or whitespace separated) gives the
+    analysis interval as chr:start-end; variants without one use
+    default_interval, a (chromosome or None, start, end) tuple.
+    Empty lines and lines starting with # are skipped.
+
+    Returns:
+        List of score_variant keyword arguments, one dictionary per variant
+
+    Raises:
+        ValueError: For the first invalid variant or interval
+    """
+    variant_strs = []
+    interval_strs = []
+    with open(file_path, 'r') as f:
+        for line in f:
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            variant_strs.append(fields[0])
+            interval_strs.append(fields[1] if len(fields) > 1 else None)
+
+    variants = []
+    for (chromosome, position, ref, alt), interval_str in zip(parse_variant_strings(variant_strs), interval_strs):
+        if interval_str is not None:
+            interval_chr, interval_start, interval_end = parse_interval_string(interval_str)
+        elif default_interval is not None:
+            interval_chr, interval_start, interval_end = default_interval
+        else:
+            raise ValueError(f"No interval for variant {chromosome}:{position}{ref}>{alt}: "
+                             "add a second column or use --interval")
+
+        if interval_chr is not None and chromosome.lower() != interval_chr.lower():
+            raise ValueError(f"Variant chromosome ({chromosome}) must match interval chromosome ({interval_chr})")
+        validate_variant(position, ref, alt, interval_start, interval_end)
+
+        variants.append({
+            "chromosome": chromosome,
+            "position": position,
+            "ref": ref,
+            "alt": alt,
+            "interval_start": interval_start,
+            "interval_end": interval_end
+        })
+    return variants
+
+
 def score_variant(chromosome: str, position: int, ref: str, alt: str,
                  interval_start: int, interval_end: int,
                  organism: str = "human",
@@ -87,20 +271,10 @@ def score_variant(chromosome: str, position: int, ref: str, alt: str,
     Returns:
         Dictionary with scoring results
     """
-    # Check if using mock mode first
-    use_mock = os.getenv('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
-
-    if not use_mock:
-        if not api_key:
-            # Try to get from environment
-            api_key = os.getenv('ALPHAGENOME_API_KEY')
-            if not api_key:
-                raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    client_api_key = _client.client_api_key(api_key)
 
     try:
-        # Use dummy key for mock mode
-        client_api_key = api_key if not use_mock else "mock_key"
-        client = AlphaGenomeClient(client_api_key)
+        client = _client.get_client(client_api_key)
         result = client.score_variant(
             chromosome=chromosome,
             position=position,
@@ -119,6 +293,46 @@ def score_variant(chromosome: str, position: int, ref: str, alt: str,
         }
 
 
+def score_variants_batch(variants: List[Dict[str, Any]], organism: str = "human",
+                         concurrency: int = 32,
+                         api_key: Optional[str] = None) -> List[dict]:
+    """
+    Score many variants as concurrent requests through one shared client.
+
+    Each variant is scored as its own request from an asyncio event loop
+    with up to `concurrency` requests in flight, so a large variant list
+    costs about len(variants) / concurrency round-trips instead of one
+    per variant.
+
+    Args:
+        variants: score_variant keyword arguments (chromosome, position, ref, alt,
+            interval_start, interval_end and optionally organism), one dictionary per variant
+        organism: Target organism for variants that do not specify one (default: "human")
+        concurrency: Maximum number of requests in flight
+        api_key: AlphaGenome API key
+
+    Returns:
+        List of scoring results in the order of variants
+    """
+    client = _client.get_client(_client.client_api_key(api_key))
+    return asyncio.run(_score_all(client, variants, organism, max(1, concurrency)))
+
+
+async def _score_all(client, variants: List[Dict[str, Any]], organism: str, concurrency: int) -> List[dict]:
+    # The default executor is capped at 32 threads; size it to the concurrency
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def score_one(variant: Dict[str, Any]) -> dict:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(client.score_variant, **{"organism": organism, **variant})
+            except Exception as e:
+                return {"success": False, "error": str(e), "type": type(e).__name__}
+
+    return await asyncio.gather(*(score_one(v) for v in variants))
+
+
 def interpret_scores(scores: dict) -> dict:
     """
     Interpret variant scores and provide summary.
@@ -142,6 +356,46 @@ def interpret_scores(scores: dict) -> dict:
     return interpretation
 
 
+def score_variants_file(args) -> dict:
+    """Score all variants of --variants-file and collect the results with batch metadata."""
+    if args.interval:
+        default_interval = parse_interval_string(args.interval)
+    elif args.interval_start is not None and args.interval_end is not None:
+        default_interval = (None, args.interval_start, args.interval_end)
+    else:
+        default_interval = None
+
+    variants = load_variants_file(args.variants_file, default_interval)
+    results = score_variants_batch(variants, organism=args.organism,
+                                   concurrency=args.concurrency, api_key=args.api_key)
+
+    for variant, result in zip(variants, results):
+        result['variant'] = (f"{variant['chromosome']}:{variant['position']}"
+                             f"{variant['ref']}>{variant['alt']}")
+        if args.interpret and result.get('success') and 'result' in result:
+            result['interpretation'] = interpret_scores(result['result'])
+
+    return {
+        "success": True,
+        "batch_info": {
+            "total_variants": len(variants),
+            "processed": len(results),
+            "failed": sum(not r.get('success', False) for r in results),
+            "organism": args.organism
+        },
+        "results": results,
+        "metadata": {
+            'input_source': args.variants_file,
+            'variant_count': len(variants),
+            'organism': args.organism,
+            'concurrency': args.concurrency,
+            'scoring_algorithms': 19,
+            'interpretation_included': args.interpret,
+            'script': 'use_case_4_variant_scoring.py'
+        }
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Score genetic variants using AlphaGenome's 19 scoring algorithms",
@@ -158,6 +412,10 @@ Examples:
   # Score with interpretation
   python %(prog)s --variant chr1:1001000A>G --interval chr1:1000000-1002048 --interpret
 
+  # Score every variant in a file (one chr:posREF>ALT per line, optionally
+  # followed by its own chr:start-end interval) concurrently
+  python %(prog)s --variants-file variants.tsv --interval chr1:1000000-1002048
+
 Note: Variant scoring uses 19 different algorithms to assess functional impact.
       The variant position must fall within the analysis interval.
         """
@@ -167,6 +425,8 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
     variant_group = parser.add_mutually_exclusive_group()
     variant_group.add_argument('--variant',
                              help='Variant in format chr:posREF>ALT (e.g., chr1:1001000A>G)')
+    variant_group.add_argument('--variants-file',
+                             help='File with one variant per line, optionally followed by its interval')
 
     # Individual variant parameters
     var_param_group = parser.add_argument_group('variant specification')
@@ -196,6 +456,8 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
                        help='Target organism (default: human)')
     parser.add_argument('--interpret', action='store_true',
                        help='Include score interpretation')
+    parser.add_argument('--concurrency', type=int, default=32,
+                       help='Maximum number of requests in flight with --variants-file (default: 32)')
 
     # API options
     parser.add_argument('--api-key',
@@ -210,6 +472,15 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
     args = parser.parse_args()
 
     try:
+        if args.variants_file:
+            result = score_variants_file(args)
+            _output.emit(result, args)
+            if args.output:
+                print(f"Results written to {args.output}")
+            if result['batch_info']['failed']:
+                sys.exit(1)
+            return
+
         # Parse variant information
         if args.variant:
             chromosome, position, ref, alt = parse_variant_string(args.variant)
@@ -230,22 +501,7 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
             interval_start, interval_end = args.interval_start, args.interval_end
 
         # Validate inputs
-        if position <= 0:
-            raise ValueError("Position must be positive (1-based)")
-        if interval_start < 0:
-            raise ValueError("Interval start cannot be negative")
-        if interval_start >= interval_end:
-            raise ValueError("Interval start must be less than end")
-
-        # Check if variant position falls within interval
-        # Note: position is 1-based, interval coordinates are 0-based
-        if not (interval_start < position <= interval_end):
-            raise ValueError(f"Variant position {position} must fall within interval [{interval_start}, {interval_end}]")
-
-        # Validate alleles
-        valid_bases = set('ATGC')
-        if not (set(ref.upper()).issubset(valid_bases) and set(alt.upper()).issubset(valid_bases)):
-            raise ValueError("Reference and alternative alleles must contain only A, T, G, C")
+        validate_variant(position, ref.upper(), alt.upper(), interval_start, interval_end)
 
         # Score variant
         result = score_variant(
@@ -279,19 +535,10 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
             'script': 'use_case_4_variant_scoring.py'
         }
 
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if scoring failed
         if not result.get('success', False):
@@ -305,12 +552,7 @@ Note: Variant scoring uses 19 different algorithms to assess functional impact.
             "script": "use_case_4_variant_scoring.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
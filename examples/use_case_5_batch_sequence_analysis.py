@@ -11,19 +11,75 @@ Example usage:
 """
 
 import argparse
-import json
+import asyncio
+import mmap
 import sys
 import os
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, List, Optional
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
+import _client
+import _output
 
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+# Byte tables for sequence cleaning: upper-case a/t/g/c/n and drop everything else
+_UPPER = bytes.maketrans(b'atgcn', b'ATGCN')
+_DELETE = bytes(b for b in range(256) if chr(b).upper() not in 'ATGCN')
+
+
+# Files at least this large are memory-mapped and split with numpy
+_MMAP_THRESHOLD = 1 << 20
+
+
+@lru_cache(maxsize=1)
+def _numpy():
+    """Import numpy on first use; None if it is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=1)
+def _valid_lut():
+    """
+    Return a numpy lookup table of the valid byte values, or None without numpy.
+
+    Valid are ATGCN and the newline used to join sequences for validation.
+    """
+    np = _numpy()
+    if np is None:
+        return None
+    lut = np.zeros(256, dtype=bool)
+    lut[np.frombuffer(b'ATGCN\n', dtype=np.uint8)] = True
+    return lut
+
+
+def _iter_lines(file_path: str) -> Iterator[bytes]:
+    """
+    Yield the raw lines of a file.
+
+    Large files are memory-mapped and split at newline offsets found in one
+    numpy scan, instead of going through a buffered line iterator.
+    """
+    with open(file_path, 'rb') as f:
+        np = _numpy()
+        if np is None or os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield from f
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            newlines = np.flatnonzero(buf == 0x0A).tolist()
+            del buf  # release the buffer export so the map can be closed
+
+            start = 0
+            for end in newlines:
+                yield mm[start:end]
+                start = end + 1
+            yield mm[start:]
 
 
 def load_sequences_from_file(file_path: str) -> List[str]:
@@ -34,18 +90,18 @@ def load_sequences_from_file(file_path: str) -> List[str]:
     """
     try:
         sequences = []
-        with open(file_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                if not line or line.startswith('#'):  # Skip empty lines and comments
-                    continue
-
-                # Remove any non-DNA characters
-                sequence = ''.join(c.upper() for c in line if c.upper() in 'ATGCN')
-                if sequence:
-                    sequences.append(sequence)
-                else:
-                    print(f"Warning: No valid DNA sequence found on line {line_num}: {line}", file=sys.stderr)
+        for line_num, line in enumerate(_iter_lines(file_path), 1):
+            line = line.strip()
+            if not line or line.startswith(b'#'):  # Skip empty lines and comments
+                continue
+
+            # Upper-case and remove any non-DNA characters
+            sequence = line.translate(_UPPER, delete=_DELETE).decode('ascii')
+            if sequence:
+                sequences.append(sequence)
+            else:
+                print(f"Warning: No valid DNA sequence found on line {line_num}: "
+                      f"{line.decode('utf-8', 'replace')}", file=sys.stderr)
 
         return sequences
     except Exception as e:
@@ -69,20 +125,10 @@ def predict_sequences(sequences: List[str], organism: str = "human",
     Returns:
         Dictionary with prediction results
     """
-    # Check if using mock mode first
-    use_mock = os.getenv('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
-
-    if not use_mock:
-        if not api_key:
-            # Try to get from environment
-            api_key = os.getenv('ALPHAGENOME_API_KEY')
-            if not api_key:
-                raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    client_api_key = _client.client_api_key(api_key)
 
     try:
-        # Use dummy key for mock mode
-        client_api_key = api_key if not use_mock else "mock_key"
-        client = AlphaGenomeClient(client_api_key)
+        client = _client.get_client(client_api_key)
         result = client.predict_sequences(
             sequences=sequences,
             organism=organism,
@@ -98,6 +144,71 @@ def predict_sequences(sequences: List[str], organism: str = "human",
         }
 
 
+def predict_sequences_async(sequences: List[str], organism: str = "human",
+                            output_types: Optional[List[str]] = None,
+                            concurrency: int = 32,
+                            api_key: Optional[str] = None) -> dict:
+    """
+    Predict genomic features for multiple DNA sequences as concurrent requests.
+
+    Each sequence is submitted as its own prediction from an asyncio event
+    loop with up to `concurrency` requests in flight, rather than through
+    the client's fixed max_workers pool. Results use the same schema as
+    predict_sequences.
+
+    Args:
+        sequences: List of DNA sequence strings
+        organism: Target organism (default: "human")
+        output_types: List of output types to request (e.g., ["atac", "cage", "dnase"])
+        concurrency: Maximum number of requests in flight
+        api_key: AlphaGenome API key
+
+    Returns:
+        Dictionary with prediction results
+    """
+    client_api_key = _client.client_api_key(api_key)
+
+    try:
+        client = _client.get_client(client_api_key)
+        results = asyncio.run(_predict_all(client, sequences, organism, output_types, max(1, concurrency)))
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "type": type(e).__name__
+        }
+
+    return {
+        "success": True,
+        "batch_info": {
+            "total_sequences": len(sequences),
+            "processed": len(results),
+            "failed": sum(not r.get('success', False) for r in results),
+            "organism": organism
+        },
+        "results": results
+    }
+
+
+async def _predict_all(client, sequences: List[str], organism: str,
+                       output_types: Optional[List[str]], concurrency: int) -> List[dict]:
+    # The default executor is capped at 32 threads; size it to the concurrency
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def predict_one(index: int, sequence: str) -> dict:
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(client.predict_sequence, sequence=sequence,
+                                                 organism=organism, output_types=output_types)
+            except Exception as e:
+                result = {"success": False, "error": str(e), "type": type(e).__name__}
+        result['sequence_index'] = index
+        return result
+
+    return await asyncio.gather(*(predict_one(i, seq) for i, seq in enumerate(sequences)))
+
+
 def validate_sequences(sequences: List[str]) -> List[str]:
     """
     Validate and clean up DNA sequences.
@@ -114,21 +225,72 @@ def validate_sequences(sequences: List[str]) -> List[str]:
     if not sequences:
         raise ValueError("No sequences provided")
 
-    validated = []
-    valid_chars = set('ATGCN')
+    # Sequences before the first empty one are checked for invalid characters first
+    count = next((i for i, seq in enumerate(sequences) if not seq or not isinstance(seq, str)), len(sequences))
+    validated = [seq.upper().strip() for seq in sequences[:count]]
 
-    for i, seq in enumerate(sequences):
-        if not seq or not isinstance(seq, str):
-            raise ValueError(f"Sequence {i+1} is empty or invalid")
+    first_invalid = _first_invalid_sequence(validated)
+    if first_invalid is not None:
+        invalid_chars = set(validated[first_invalid]) - set('ATGCN')
+        raise ValueError(f"Sequence {first_invalid+1} contains invalid characters: {invalid_chars}")
+    if count < len(sequences):
+        raise ValueError(f"Sequence {count+1} is empty or invalid")
 
-        seq_upper = seq.upper().strip()
-        invalid_chars = set(seq_upper) - valid_chars
-        if invalid_chars:
-            raise ValueError(f"Sequence {i+1} contains invalid characters: {invalid_chars}")
+    return validated
 
-        validated.append(seq_upper)
 
-    return validated
+def _first_invalid_sequence(sequences: List[str]) -> Optional[int]:
+    """
+    Return the index of the first sequence containing anything but ATGCN, or None.
+
+    All sequences are joined with newlines and scanned in one pass; the
+    offending sequence is then found by counting newlines before the first
+    invalid byte.
+    """
+    joined = '\n'.join(sequences).encode('ascii', 'replace')
+    if joined.count(b'\n') != len(sequences) - 1:
+        # A sequence contains a newline itself, so check them one by one
+        return next((i for i, seq in enumerate(sequences)
+                     if seq.encode('ascii', 'replace').translate(None, delete=b'ATGCN')), None)
+
+    np = _numpy()
+    lut = _valid_lut()
+    if lut is None:
+        if not joined.translate(None, delete=b'ATGCN\n'):
+            return None
+        first_bad = next(i for i, byte in enumerate(joined) if byte not in b'ATGCN\n')
+    else:
+        valid = lut[np.frombuffer(joined, dtype=np.uint8)]
+        if valid.all():
+            return None
+        first_bad = int(valid.argmin())
+    return joined.count(b'\n', 0, first_bad)
+
+
+def summarize_sequences(sequences: List[str]) -> dict:
+    """Compute sequence length statistics, vectorized with numpy when it is available."""
+    np = _numpy()
+    if np is None:
+        lengths = [len(seq) for seq in sequences]
+        total = sum(lengths)
+        return {
+            'total_sequences': len(sequences),
+            'sequence_lengths': lengths,
+            'avg_sequence_length': total / len(lengths),
+            'min_sequence_length': min(lengths),
+            'max_sequence_length': max(lengths),
+            'total_bases': total
+        }
+
+    lengths = np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+    return {
+        'total_sequences': len(sequences),
+        'sequence_lengths': lengths.tolist(),
+        'avg_sequence_length': float(lengths.mean()),
+        'min_sequence_length': int(lengths.min()),
+        'max_sequence_length': int(lengths.max()),
+        'total_bases': int(lengths.sum())
+    }
 
 
 def main():
@@ -147,6 +309,9 @@ Examples:
   python %(prog)s --sequences "ATGCGATCG" "GGCCTTAAC" \\
                    --output-types atac cage dnase --organism human
 
+  # Submit each sequence as its own request, up to 64 at a time
+  python %(prog)s --input examples/data/sequences.txt --async --concurrency 64
+
 File format for --input:
   One sequence per line
   Lines starting with # are treated as comments
@@ -170,6 +335,10 @@ File format for --input:
                        help='Request all available output types')
     parser.add_argument('--max-workers', type=int, default=5,
                        help='Maximum number of parallel workers (default: 5)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Submit every sequence as its own concurrent request instead of one batch call')
+    parser.add_argument('--concurrency', type=int, default=32,
+                       help='Maximum number of requests in flight with --async (default: 32)')
 
     # API options
     parser.add_argument('--api-key',
@@ -198,31 +367,33 @@ File format for --input:
         if len(sequences) == 0:
             raise ValueError("No valid sequences found")
 
-        print(f"Processing {len(sequences)} sequences with {args.max_workers} workers...", file=sys.stderr)
-
         # Set output types
         output_types = args.output_types if not args.all_outputs else None
 
         # Make predictions
-        result = predict_sequences(
-            sequences=sequences,
-            organism=args.organism,
-            output_types=output_types,
-            max_workers=args.max_workers,
-            api_key=args.api_key
-        )
+        if args.use_async:
+            print(f"Processing {len(sequences)} sequences with up to {args.concurrency} concurrent requests...",
+                  file=sys.stderr)
+            result = predict_sequences_async(
+                sequences=sequences,
+                organism=args.organism,
+                output_types=output_types,
+                concurrency=args.concurrency,
+                api_key=args.api_key
+            )
+        else:
+            print(f"Processing {len(sequences)} sequences with {args.max_workers} workers...", file=sys.stderr)
+            result = predict_sequences(
+                sequences=sequences,
+                organism=args.organism,
+                output_types=output_types,
+                max_workers=args.max_workers,
+                api_key=args.api_key
+            )
 
         # Add summary statistics if requested
         if args.summary and result.get('success'):
-            summary = {
-                'total_sequences': len(sequences),
-                'sequence_lengths': [len(seq) for seq in sequences],
-                'avg_sequence_length': sum(len(seq) for seq in sequences) / len(sequences),
-                'min_sequence_length': min(len(seq) for seq in sequences),
-                'max_sequence_length': max(len(seq) for seq in sequences),
-                'total_bases': sum(len(seq) for seq in sequences)
-            }
-            result['summary'] = summary
+            result['summary'] = summarize_sequences(sequences)
 
         # Add analysis metadata
         result['metadata'] = {
@@ -235,19 +406,10 @@ File format for --input:
             'script': 'use_case_5_batch_sequence_analysis.py'
         }
 
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if prediction failed
         if not result.get('success', False):
@@ -263,12 +425,7 @@ File format for --input:
             "script": "use_case_5_batch_sequence_analysis.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
@@ -11,19 +11,11 @@ Example usage:
 """
 
 import argparse
-import json
 import sys
-import os
 from typing import Optional
 
-# Add the repo directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'repo', 'AlphaGenome-MCP-Server'))
-
-try:
-    from alphagenome_client import AlphaGenomeClient
-except ImportError:
-    print("Error: Could not import AlphaGenome client. Please ensure the environment is set up correctly.")
-    sys.exit(1)
+import _client
+import _output
 
 
 def get_output_metadata(organism: str = "human", api_key: Optional[str] = None) -> dict:
@@ -37,20 +29,10 @@ def get_output_metadata(organism: str = "human", api_key: Optional[str] = None)
     Returns:
         Dictionary with metadata results
     """
-    # Check if using mock mode first
-    use_mock = os.getenv('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
-
-    if not use_mock:
-        if not api_key:
-            # Try to get from environment
-            api_key = os.getenv('ALPHAGENOME_API_KEY')
-            if not api_key:
-                raise ValueError("API key required. Set ALPHAGENOME_API_KEY environment variable or use --api-key")
+    client_api_key = _client.client_api_key(api_key)
 
     try:
-        # Use dummy key for mock mode
-        client_api_key = api_key if not use_mock else "mock_key"
-        client = AlphaGenomeClient(client_api_key)
+        client = _client.get_client(client_api_key)
         result = client.get_output_metadata(organism=organism)
         return result
     except Exception as e:
@@ -102,66 +84,69 @@ def parse_metadata(metadata: dict) -> dict:
     return parsed
 
 
+# Known output types from documentation; static, so built once at import
+_KNOWN_OUTPUTS = {
+    "summary": "Known AlphaGenome output types",
+    "output_types": [
+        {
+            "name": "ATAC",
+            "description": "ATAC-seq chromatin accessibility data",
+            "usage": "atac"
+        },
+        {
+            "name": "CAGE",
+            "description": "CAGE transcription start site data",
+            "usage": "cage"
+        },
+        {
+            "name": "DNASE",
+            "description": "DNase hypersensitivity data",
+            "usage": "dnase"
+        },
+        {
+            "name": "HISTONE_MARKS",
+            "description": "ChIP-seq histone modification data",
+            "usage": "histone_marks"
+        },
+        {
+            "name": "GENE_EXPRESSION",
+            "description": "RNA-seq gene expression data",
+            "usage": "gene_expression"
+        },
+        {
+            "name": "CONTACT_MAPS",
+            "description": "3D chromatin contact maps",
+            "usage": "contact_maps"
+        },
+        {
+            "name": "SPLICE_JUNCTIONS",
+            "description": "Splice junction predictions",
+            "usage": "splice_junctions"
+        }
+    ],
+    "constraints": {
+        "max_sequence_length": "1M base pairs",
+        "max_interval_size": "1M base pairs",
+        "supported_lengths": ["2KB", "16KB", "131KB", "524KB", "1MB"],
+        "max_parallel_workers": 10,
+        "variant_scoring_algorithms": 19
+    },
+    "organisms": {
+        "supported": ["human", "homo_sapiens"],
+        "default": "human"
+    }
+}
+
+
 def list_known_outputs() -> dict:
     """
     List known output types from documentation.
 
     Returns:
-        Dictionary with known output types
+        Dictionary with known output types (a shallow copy, so callers
+        can add top-level keys such as "metadata")
     """
-    known_outputs = {
-        "summary": "Known AlphaGenome output types",
-        "output_types": [
-            {
-                "name": "ATAC",
-                "description": "ATAC-seq chromatin accessibility data",
-                "usage": "atac"
-            },
-            {
-                "name": "CAGE",
-                "description": "CAGE transcription start site data",
-                "usage": "cage"
-            },
-            {
-                "name": "DNASE",
-                "description": "DNase hypersensitivity data",
-                "usage": "dnase"
-            },
-            {
-                "name": "HISTONE_MARKS",
-                "description": "ChIP-seq histone modification data",
-                "usage": "histone_marks"
-            },
-            {
-                "name": "GENE_EXPRESSION",
-                "description": "RNA-seq gene expression data",
-                "usage": "gene_expression"
-            },
-            {
-                "name": "CONTACT_MAPS",
-                "description": "3D chromatin contact maps",
-                "usage": "contact_maps"
-            },
-            {
-                "name": "SPLICE_JUNCTIONS",
-                "description": "Splice junction predictions",
-                "usage": "splice_junctions"
-            }
-        ],
-        "constraints": {
-            "max_sequence_length": "1M base pairs",
-            "max_interval_size": "1M base pairs",
-            "supported_lengths": ["2KB", "16KB", "131KB", "524KB", "1MB"],
-            "max_parallel_workers": 10,
-            "variant_scoring_algorithms": 19
-        },
-        "organisms": {
-            "supported": ["human", "homo_sapiens"],
-            "default": "human"
-        }
-    }
-
-    return known_outputs
+    return dict(_KNOWN_OUTPUTS)
 
 
 def main():
@@ -225,19 +210,10 @@ Examples:
             'script': 'use_case_6_output_metadata.py'
         }
 
-        # Format output
-        if args.pretty:
-            output_str = json.dumps(result, indent=2)
-        else:
-            output_str = json.dumps(result)
-
         # Write output
+        _output.emit(result, args)
         if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
             print(f"Results written to {args.output}")
-        else:
-            print(output_str)
 
         # Exit with error code if API call failed (but not for list-outputs)
         if not args.list_outputs and not result.get('success', False):
@@ -251,12 +227,7 @@ Examples:
             "script": "use_case_6_output_metadata.py"
         }
 
-        output_str = json.dumps(error_result, indent=2 if args.pretty else None)
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(output_str)
-        else:
-            print(output_str)
+        _output.emit(error_result, args)
 
         sys.exit(1)
 
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Script: ag_cli.py
+Description: Single entry point for the AlphaGenome prediction scripts
+
+Each subcommand takes the same options as the corresponding script:
+    dna       dna_sequence_prediction.py
+    interval  genomic_interval_analysis.py
+    batch     batch_sequence_analysis.py
+
+Usage:
+    python scripts/ag_cli.py <command> [options]
+
+Example:
+    python scripts/ag_cli.py dna --sequence "ATGCGATCGATCGATC" --pretty
+    python scripts/ag_cli.py interval --interval "chr1:1000000-1002048" --output results/interval.json
+    python scripts/ag_cli.py batch --input examples/data/sequences.txt --max-workers 10
+"""
+
+import sys
+from pathlib import Path
+
+# Add this directory (for the scripts) and lib (for our simplified modules) to the path
+for _path in (str(Path(__file__).parent), str(Path(__file__).parent / "lib")):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import cli
+
+if __name__ == '__main__':
+    sys.exit(cli.main())
@@ -17,17 +17,21 @@ Example:
 # ==============================================================================
 # Minimal Imports (only essential packages)
 # ==============================================================================
-import argparse
 import sys
 from pathlib import Path
-from typing import Union, Optional, Dict, Any, List
+from typing import Union, Optional, Dict, Any, List, Tuple
 
 # Add lib directory to path for our simplified modules
-sys.path.insert(0, str(Path(__file__).parent / "lib"))
+_LIB_DIR = str(Path(__file__).parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
-from alphagenome_client import AlphaGenomeClient
-from file_io import load_sequences_from_file, write_output
-from utils import get_api_key, handle_error, add_metadata, validate_output_types
+import cli
+from utils import (get_api_key, handle_error, ExecMetadata, as_path, length_statistics,
+                   validate_output_types)
+
+# Heavier modules (client, file I/O) are imported on first use inside run_*,
+# so --help and argument errors return without loading them
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -39,6 +43,113 @@ DEFAULT_CONFIG = {
     "max_workers": 5
 }
 
+# ==============================================================================
+# Concurrent Prediction
+# ==============================================================================
+async def _predict_many(
+    client: "AlphaGenomeClient",
+    sequences: List[Union[str, bytes]],
+    organism: str,
+    output_types: Optional[List[str]],
+    max_workers: int
+) -> Dict[str, Any]:
+    """
+    Predict every sequence as its own request with up to max_workers in flight.
+
+    Network round-trips of independent sequences overlap instead of adding
+    up, so a batch takes about len(sequences) / max_workers round-trips.
+    Returns the same shape as AlphaGenomeClient.predict_sequences; a failed
+    sequence is reported in its own result instead of failing the batch.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    # The default executor is capped at 32 threads; size it to max_workers
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def predict_one(index: int, sequence: Union[str, bytes]) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                result = await asyncio.to_thread(client.predict_sequence, sequence=sequence,
+                                                 organism=organism, output_types=output_types)
+            except Exception as e:
+                result = {"success": False, "error": str(e), "type": type(e).__name__}
+        result["sequence_index"] = index
+        return result
+
+    results = await asyncio.gather(*(predict_one(i, seq) for i, seq in enumerate(sequences)))
+
+    # Reported by the client in every successful result
+    model_version = next((r["metadata"]["model_version"] for r in results
+                          if "model_version" in (r.get("metadata") or {})), None)
+
+    return {
+        "success": True,
+        "batch_info": {
+            "total_sequences": len(sequences),
+            "processed": len(results),
+            "failed": sum(not r.get('success', False) for r in results),
+            "organism": organism
+        },
+        "results": results,
+        "metadata": {
+            "model_version": model_version,
+            "output_types": output_types or DEFAULT_CONFIG["default_output_types"]
+        }
+    }
+
+
+def _run_coroutine(coroutine: Any) -> Any:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run cannot be called from a thread whose event loop is running
+    (e.g. when an async server calls run_batch_sequence_analysis directly);
+    the coroutine then runs in its own loop on a worker thread.
+    """
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def _deduplicate(sequences: List[Any]) -> Tuple[List[Any], List[int]]:
+    """
+    Collapse identical sequences.
+
+    Returns the unique sequences in first-occurrence order and, for every
+    input sequence, the index of its unique sequence.
+    """
+    first_index: Dict[Any, int] = {}
+    positions = [first_index.setdefault(seq, len(first_index)) for seq in sequences]
+    return list(first_index), positions
+
+
+def _expand_results(batch_result: Dict[str, Any], positions: List[int]) -> Dict[str, Any]:
+    """Fan the results of the unique sequences back out to every input sequence."""
+    unique_results = batch_result["results"]
+    results = []
+    for index, position in enumerate(positions):
+        result = dict(unique_results[position])
+        result["sequence_index"] = index
+        results.append(result)
+
+    batch_result["results"] = results
+    batch_result["batch_info"].update({
+        "total_sequences": len(results),
+        "processed": len(results),
+        "failed": sum(not r.get('success', False) for r in results),
+        "unique_sequences": len(unique_results)
+    })
+    return batch_result
+
+
 # ==============================================================================
 # Core Function (main logic extracted from use case)
 # ==============================================================================
@@ -51,6 +162,7 @@ def run_batch_sequence_analysis(
     api_key: Optional[str] = None,
     max_workers: int = 5,
     pretty: bool = False,
+    async_write: bool = False,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -63,8 +175,10 @@ def run_batch_sequence_analysis(
         output_types: List of output types to request (e.g., ["atac", "cage", "dnase"])
         all_outputs: Request all available output types
         api_key: AlphaGenome API key (optional, reads from env)
-        max_workers: Maximum number of parallel workers (for future use)
+        max_workers: Maximum number of prediction requests in flight
         pretty: Pretty print JSON output
+        async_write: Write output_file on a background thread and return its
+            Future as result["_write_future"] instead of waiting for the write
         **kwargs: Override specific config parameters
 
     Returns:
@@ -85,13 +199,18 @@ def run_batch_sequence_analysis(
     script_name = "batch_sequence_analysis.py"
 
     try:
+        from alphagenome_client import get_cached_client
+        from file_io import ensure_parent, load_sequences_with_lengths, write_output, write_output_async
+
         # Validate input file
-        input_path = Path(input_file)
+        input_path = as_path(input_file)
+        input_str = str(input_path)
         if not input_path.exists():
-            raise FileNotFoundError(f"Input file not found: {input_file}")
+            raise FileNotFoundError(f"Input file not found: {input_str}")
 
-        # Load sequences from file
-        sequences = load_sequences_from_file(input_path)
+        # Load sequences from file as ASCII bytes (the client accepts them as
+        # is), with their lengths for the statistics below
+        sequences, lengths = load_sequences_with_lengths(input_path, as_bytes=True)
 
         if not sequences:
             raise ValueError("No valid sequences found in input file")
@@ -105,27 +224,29 @@ def run_batch_sequence_analysis(
         # Get API key
         client_api_key = get_api_key(api_key)
 
-        # Initialize client
-        client = AlphaGenomeClient(client_api_key)
+        # Get the shared client for this key
+        client = get_cached_client(client_api_key)
 
-        # Make batch prediction
-        batch_result = client.predict_sequences(
-            sequences=sequences,
-            organism=organism,
-            output_types=requested_output_types
-        )
+        # Predict each distinct sequence once, one concurrent request per sequence
+        unique_sequences, positions = _deduplicate(sequences)
+        batch_result = _run_coroutine(_predict_many(
+            client, unique_sequences, organism, requested_output_types, max(1, max_workers)
+        ))
 
         # Check if prediction was successful
         if not batch_result.get('success', False):
             return batch_result
+        batch_result = _expand_results(batch_result, positions)
 
         # Create enhanced result with metadata
         result = {
             "success": True,
             "result": batch_result,
             "metadata": {
-                "input_file": str(input_path),
+                "input_file": input_str,
                 "total_sequences": len(sequences),
+                "unique_sequences": len(unique_sequences),
+                "duplicate_ratio": round(1 - len(unique_sequences) / len(sequences), 4),
                 "organism": organism,
                 "output_types_requested": requested_output_types or 'all',
                 "max_workers": max_workers
@@ -134,24 +255,21 @@ def run_batch_sequence_analysis(
         }
 
         # Add script metadata
-        add_metadata(result, script_name,
-                    pretty_output=pretty)
+        result['metadata'] |= ExecMetadata(script_name, pretty_output=pretty).to_dict()
 
         # Add sequence statistics to metadata
-        sequence_lengths = [len(seq) for seq in sequences]
         result['metadata'].update({
-            "sequence_statistics": {
-                "min_length": min(sequence_lengths),
-                "max_length": max(sequence_lengths),
-                "mean_length": round(sum(sequence_lengths) / len(sequence_lengths), 1)
-            }
+            "sequence_statistics": length_statistics(lengths)
         })
 
         # Save output if requested
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            write_output(result, output_path, pretty)
+            output_path = ensure_parent(output_file)
+            if async_write:
+                # Snapshot the top level, which is still modified below
+                result["_write_future"] = write_output_async(dict(result), output_path, pretty)
+            else:
+                write_output(result, output_path, pretty)
             result["output_file"] = str(output_path)
 
         return result
@@ -163,85 +281,9 @@ def run_batch_sequence_analysis(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
-    parser = argparse.ArgumentParser(
-        description=__doc__,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Analyze sequences from file with default outputs
-  python %(prog)s --input examples/data/sequences.txt
-
-  # Analyze with specific output types
-  python %(prog)s --input examples/data/sequences.txt --output-types atac cage
-
-  # Save results with pretty formatting
-  python %(prog)s --input examples/data/sequences.txt --output results/batch.json --pretty
-
-  # Analyze all output types with parallel processing
-  python %(prog)s --input examples/data/sequences.txt --all-outputs --max-workers 10
-        """
-    )
-
-    # Input options
-    parser.add_argument('--input', '-i', required=True,
-                       help='Path to text file containing DNA sequences (one per line)')
-
-    # Analysis options
-    parser.add_argument('--organism', default=DEFAULT_CONFIG["organism"],
-                       help=f'Target organism (default: {DEFAULT_CONFIG["organism"]})')
-    parser.add_argument('--output-types', nargs='*',
-                       help='Specific output types to request (e.g., atac cage dnase)')
-    parser.add_argument('--all-outputs', action='store_true',
-                       help='Request all available output types')
-    parser.add_argument('--max-workers', type=int, default=DEFAULT_CONFIG["max_workers"],
-                       help=f'Maximum number of parallel workers (default: {DEFAULT_CONFIG["max_workers"]})')
-
-    # API options
-    parser.add_argument('--api-key',
-                       help='AlphaGenome API key (or set ALPHAGENOME_API_KEY env var)')
-
-    # Output options
-    parser.add_argument('--output', '-o',
-                       help='Output file path (default: stdout)')
-    parser.add_argument('--pretty', action='store_true',
-                       help='Pretty print JSON output')
-
-    args = parser.parse_args()
-
-    try:
-        # Run batch analysis
-        result = run_batch_sequence_analysis(
-            input_file=args.input,
-            output_file=args.output,
-            organism=args.organism,
-            output_types=args.output_types,
-            all_outputs=args.all_outputs,
-            api_key=args.api_key,
-            max_workers=args.max_workers,
-            pretty=args.pretty
-        )
-
-        # Output results if not saved to file
-        if not args.output:
-            write_output(result, pretty=args.pretty)
-        else:
-            print(f"✅ Success: {result.get('output_file', 'Completed')}")
-
-        # Exit with error code if analysis failed
-        if not result.get('success', False):
-            sys.exit(1)
-
-        return result
-
-    except KeyboardInterrupt:
-        print("\n⚠️  Operation cancelled by user")
-        sys.exit(1)
-    except Exception as e:
-        error_result = handle_error(e, "batch_sequence_analysis.py")
-        write_output(error_result, pretty=args.pretty)
-        sys.exit(1)
+def main() -> int:
+    return cli.run_command("batch", run_batch_sequence_analysis, description=__doc__)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
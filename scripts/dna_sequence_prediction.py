@@ -17,17 +17,21 @@ Example:
 # ==============================================================================
 # Minimal Imports (only essential packages)
 # ==============================================================================
-import argparse
 import sys
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List
 
 # Add lib directory to path for our simplified modules
-sys.path.insert(0, str(Path(__file__).parent / "lib"))
+_LIB_DIR = str(Path(__file__).parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
-from alphagenome_client import AlphaGenomeClient
-from file_io import load_sequence_from_file, write_output
-from utils import get_api_key, handle_error, add_metadata, create_sequence_metadata, validate_output_types
+import cli
+from utils import (get_api_key, handle_error, ExecMetadata, as_path, create_sequence_metadata,
+                   find_invalid_dna, invalid_dna_characters, validate_output_types)
+
+# Heavier modules (client, file I/O) are imported on first use inside run_*,
+# so --help and argument errors return without loading them
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -50,6 +54,7 @@ def run_dna_sequence_prediction(
     all_outputs: bool = False,
     api_key: Optional[str] = None,
     pretty: bool = False,
+    async_write: bool = False,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -64,6 +69,8 @@ def run_dna_sequence_prediction(
         all_outputs: Request all available output types
         api_key: AlphaGenome API key (optional, reads from env)
         pretty: Pretty print JSON output
+        async_write: Write output_file on a background thread and return its
+            Future as result["_write_future"] instead of waiting for the write
         **kwargs: Override specific config parameters
 
     Returns:
@@ -81,6 +88,9 @@ def run_dna_sequence_prediction(
     script_name = "dna_sequence_prediction.py"
 
     try:
+        from alphagenome_client import get_cached_client
+        from file_io import ensure_parent, load_sequence_from_file, write_output, write_output_async
+
         # Input validation and loading
         if input_sequence and input_file:
             raise ValueError("Specify either input_sequence or input_file, not both")
@@ -92,7 +102,7 @@ def run_dna_sequence_prediction(
         if input_sequence:
             sequence = input_sequence.strip()
         else:
-            input_file = Path(input_file)
+            input_file = as_path(input_file)
             if not input_file.exists():
                 raise FileNotFoundError(f"Input file not found: {input_file}")
             sequence = load_sequence_from_file(input_file)
@@ -101,11 +111,12 @@ def run_dna_sequence_prediction(
         if not sequence:
             raise ValueError("DNA sequence cannot be empty")
 
-        # Check for valid DNA characters (inlined validation)
-        valid_chars = set('ATGCN')
-        invalid_chars = set(sequence.upper()) - valid_chars
-        if invalid_chars:
-            raise ValueError(f"Invalid DNA characters found: {invalid_chars}. Only A, T, G, C, N are allowed")
+        # Check for valid DNA characters
+        invalid_at = find_invalid_dna(sequence)
+        if invalid_at is not None:
+            invalid_chars = invalid_dna_characters(sequence)
+            raise ValueError(f"Invalid DNA characters found: {invalid_chars} (first at position {invalid_at}). "
+                             "Only A, T, G, C, N are allowed")
 
         # Set output types
         if all_outputs:
@@ -116,8 +127,8 @@ def run_dna_sequence_prediction(
         # Get API key
         client_api_key = get_api_key(api_key)
 
-        # Initialize client
-        client = AlphaGenomeClient(client_api_key)
+        # Get the shared client for this key
+        client = get_cached_client(client_api_key)
 
         # Make prediction
         prediction_result = client.predict_sequence(
@@ -139,15 +150,17 @@ def run_dna_sequence_prediction(
         }
 
         # Add script metadata
-        add_metadata(result, script_name,
-                    input_file=str(input_file) if input_file else None,
-                    pretty_output=pretty)
+        result['metadata'] |= ExecMetadata(script_name, pretty_output=pretty).to_dict()
+        result['metadata']['input_file'] = str(input_file) if input_file else None
 
         # Save output if requested
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            write_output(result, output_path, pretty)
+            output_path = ensure_parent(output_file)
+            if async_write:
+                # Snapshot the top level, which is still modified below
+                result["_write_future"] = write_output_async(dict(result), output_path, pretty)
+            else:
+                write_output(result, output_path, pretty)
             result["output_file"] = str(output_path)
 
         return result
@@ -159,86 +172,9 @@ def run_dna_sequence_prediction(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
-    parser = argparse.ArgumentParser(
-        description=__doc__,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Analyze a DNA sequence with specific output types
-  python %(prog)s --sequence "ATGCGATCGTAGCTAGCATGCAAATTTGGGCCC" --output-types atac cage dnase
-
-  # Load sequence from file
-  python %(prog)s --input examples/data/sample_sequence.txt --organism human
-
-  # Generate all available outputs
-  python %(prog)s --sequence "ATGCGATCGTAGCTAGCATGC" --all-outputs
-
-  # Save results to file with pretty formatting
-  python %(prog)s --sequence "ATGCGATCGATCGATC" --output results/pred.json --pretty
-        """
-    )
-
-    # Input options
-    input_group = parser.add_mutually_exclusive_group(required=True)
-    input_group.add_argument('--sequence', '-s',
-                           help='DNA sequence string (A, T, G, C, N)')
-    input_group.add_argument('--input', '-i',
-                           help='Path to text file containing DNA sequence')
-
-    # Analysis options
-    parser.add_argument('--organism', default=DEFAULT_CONFIG["organism"],
-                       help=f'Target organism (default: {DEFAULT_CONFIG["organism"]})')
-    parser.add_argument('--output-types', nargs='*',
-                       help='Specific output types to request (e.g., atac cage dnase)')
-    parser.add_argument('--all-outputs', action='store_true',
-                       help='Request all available output types')
-
-    # API options
-    parser.add_argument('--api-key',
-                       help='AlphaGenome API key (or set ALPHAGENOME_API_KEY env var)')
-
-    # Output options
-    parser.add_argument('--output', '-o',
-                       help='Output file path (default: stdout)')
-    parser.add_argument('--pretty', action='store_true',
-                       help='Pretty print JSON output')
-
-    args = parser.parse_args()
-
-    try:
-        # Run prediction
-        result = run_dna_sequence_prediction(
-            input_sequence=args.sequence,
-            input_file=args.input,
-            output_file=args.output,
-            organism=args.organism,
-            output_types=args.output_types,
-            all_outputs=args.all_outputs,
-            api_key=args.api_key,
-            pretty=args.pretty
-        )
-
-        # Output results if not saved to file
-        if not args.output:
-            write_output(result, pretty=args.pretty)
-        else:
-            print(f"✅ Success: {result.get('output_file', 'Completed')}")
-
-        # Exit with error code if prediction failed
-        if not result.get('success', False):
-            sys.exit(1)
-
-        return result
-
-    except KeyboardInterrupt:
-        print("\n⚠️  Operation cancelled by user")
-        sys.exit(1)
-    except Exception as e:
-        error_result = handle_error(e, "dna_sequence_prediction.py")
-        write_output(error_result, pretty=args.pretty)
-        sys.exit(1)
+def main() -> int:
+    return cli.run_command("dna", run_dna_sequence_prediction, description=__doc__)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -17,18 +17,21 @@ Example:
 # ==============================================================================
 # Minimal Imports (only essential packages)
 # ==============================================================================
-import argparse
 import sys
 from pathlib import Path
 from typing import Union, Optional, Dict, Any, List
 
 # Add lib directory to path for our simplified modules
-sys.path.insert(0, str(Path(__file__).parent / "lib"))
+_LIB_DIR = str(Path(__file__).parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
-from alphagenome_client import AlphaGenomeClient
-from file_io import write_output
+import cli
 from parsers import parse_interval_string, validate_genomic_coordinates
-from utils import get_api_key, handle_error, add_metadata, validate_output_types
+from utils import get_api_key, handle_error, ExecMetadata, validate_output_types
+
+# Heavier modules (client, file I/O) are imported on first use inside run_*,
+# so --help and argument errors return without loading them
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -50,6 +53,7 @@ def run_genomic_interval_analysis(
     all_outputs: bool = False,
     api_key: Optional[str] = None,
     pretty: bool = False,
+    async_write: bool = False,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -63,6 +67,8 @@ def run_genomic_interval_analysis(
         all_outputs: Request all available output types
         api_key: AlphaGenome API key (optional, reads from env)
         pretty: Pretty print JSON output
+        async_write: Write output_file on a background thread and return its
+            Future as result["_write_future"] instead of waiting for the write
         **kwargs: Override specific config parameters
 
     Returns:
@@ -80,6 +86,9 @@ def run_genomic_interval_analysis(
     script_name = "genomic_interval_analysis.py"
 
     try:
+        from alphagenome_client import get_cached_client
+        from file_io import ensure_parent, write_output, write_output_async
+
         # Parse and validate interval
         chromosome, start, end = parse_interval_string(interval)
         validate_genomic_coordinates(chromosome, start, end)
@@ -93,8 +102,8 @@ def run_genomic_interval_analysis(
         # Get API key
         client_api_key = get_api_key(api_key)
 
-        # Initialize client
-        client = AlphaGenomeClient(client_api_key)
+        # Get the shared client for this key
+        client = get_cached_client(client_api_key)
 
         # Make prediction
         prediction_result = client.predict_interval(
@@ -126,14 +135,16 @@ def run_genomic_interval_analysis(
         }
 
         # Add script metadata
-        add_metadata(result, script_name,
-                    pretty_output=pretty)
+        result['metadata'] |= ExecMetadata(script_name, pretty_output=pretty).to_dict()
 
         # Save output if requested
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            write_output(result, output_path, pretty)
+            output_path = ensure_parent(output_file)
+            if async_write:
+                # Snapshot the top level, which is still modified below
+                result["_write_future"] = write_output_async(dict(result), output_path, pretty)
+            else:
+                write_output(result, output_path, pretty)
             result["output_file"] = str(output_path)
 
         return result
@@ -145,82 +156,9 @@ def run_genomic_interval_analysis(
 # ==============================================================================
 # CLI Interface
 # ==============================================================================
-def main():
-    parser = argparse.ArgumentParser(
-        description=__doc__,
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # Analyze a genomic interval with default ATAC output
-  python %(prog)s --interval "chr1:1000000-1002048"
-
-  # Analyze interval with specific output types
-  python %(prog)s --interval "chr1:1000000-1002048" --output-types atac cage dnase
-
-  # Generate all available outputs with pretty formatting
-  python %(prog)s --interval "chr1:1000000-1002048" --all-outputs --pretty
-
-  # Save results to file
-  python %(prog)s --interval "chr1:1000000-1002048" --output results/interval.json
-        """
-    )
-
-    # Input options
-    parser.add_argument('--interval', '-i', required=True,
-                       help='Genomic interval in format chr:start-end (e.g., chr1:1000000-2000000)')
-
-    # Analysis options
-    parser.add_argument('--organism', default=DEFAULT_CONFIG["organism"],
-                       help=f'Target organism (default: {DEFAULT_CONFIG["organism"]})')
-    parser.add_argument('--output-types', nargs='*',
-                       help='Specific output types to request (e.g., atac cage dnase)')
-    parser.add_argument('--all-outputs', action='store_true',
-                       help='Request all available output types')
-
-    # API options
-    parser.add_argument('--api-key',
-                       help='AlphaGenome API key (or set ALPHAGENOME_API_KEY env var)')
-
-    # Output options
-    parser.add_argument('--output', '-o',
-                       help='Output file path (default: stdout)')
-    parser.add_argument('--pretty', action='store_true',
-                       help='Pretty print JSON output')
-
-    args = parser.parse_args()
-
-    try:
-        # Run analysis
-        result = run_genomic_interval_analysis(
-            interval=args.interval,
-            output_file=args.output,
-            organism=args.organism,
-            output_types=args.output_types,
-            all_outputs=args.all_outputs,
-            api_key=args.api_key,
-            pretty=args.pretty
-        )
-
-        # Output results if not saved to file
-        if not args.output:
-            write_output(result, pretty=args.pretty)
-        else:
-            print(f"✅ Success: {result.get('output_file', 'Completed')}")
-
-        # Exit with error code if analysis failed
-        if not result.get('success', False):
-            sys.exit(1)
-
-        return result
-
-    except KeyboardInterrupt:
-        print("\n⚠️  Operation cancelled by user")
-        sys.exit(1)
-    except Exception as e:
-        error_result = handle_error(e, "genomic_interval_analysis.py")
-        write_output(error_result, pretty=args.pretty)
-        sys.exit(1)
+def main() -> int:
+    return cli.run_command("interval", run_genomic_interval_analysis, description=__doc__)
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
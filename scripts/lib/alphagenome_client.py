@@ -8,15 +8,62 @@ repo/AlphaGenome-MCP-Server/mock_alphagenome_client.py
 Supports both mock and real API modes.
 """
 
+import copy
+import hashlib
 import json
 import os
+import threading
 import time
 import random
-from typing import Dict, List, Any, Optional
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Union
+
+from utils import invalid_dna_characters
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Check if we should use mock mode for testing
 USE_MOCK = os.getenv('ALPHAGENOME_USE_MOCK', 'false').lower() == 'true'
 
+# Maximum number of clients kept by get_cached_client
+CLIENT_CACHE_SIZE = 8
+
+# Simulated network delay of each mock call in seconds (off by default)
+_MOCK_LATENCY = float(os.getenv('ALPHAGENOME_MOCK_LATENCY_MS', '0')) / 1000.0
+
+# Random generators for the mock predictions: one NumPy Generator per thread,
+# each seeded from its own child of one root SeedSequence
+_SEED_SEQUENCE = np.random.SeedSequence() if np is not None else None
+_seed_lock = threading.Lock()
+_thread_state = threading.local()
+
+# Mock variant tracks: reference value range and maximum alternate allele change
+_VARIANT_TRACKS = ("atac_accessibility", "cage_tss", "dnase_hypersensitivity")
+_VARIANT_EFFECTS = ("atac_change", "cage_change", "dnase_change")
+_VARIANT_REF_LOW = (0.2, 0.1, 0.3)
+_VARIANT_REF_HIGH = (0.8, 0.7, 0.9)
+_VARIANT_SPREAD = (0.3, 0.2, 0.4)
+
+
+def _rng_for_thread():
+    """
+    Return the calling thread's NumPy random Generator, or None without NumPy.
+
+    A Generator is not meant to be shared between threads (e.g. the batch
+    script's worker threads), so every thread gets its own, created on first
+    use with a statistically independent seed.
+    """
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None and np is not None:
+        with _seed_lock:
+            seed = _SEED_SEQUENCE.spawn(1)[0]
+        rng = _thread_state.rng = np.random.default_rng(seed)
+    return rng
+
 
 class MockAlphaGenomeClient:
     """
@@ -29,18 +76,43 @@ class MockAlphaGenomeClient:
         self.api_key = api_key
         self.model_version = "v1.0"
 
+        # Static parts of the result metadata, built once instead of per call;
+        # each result gets its own list of the default output types
+        self._meta_skeleton = {"model_version": self.model_version}
+        self._default_output_types = ("atac", "cage", "dnase")
+        self._default_interval_output_types = ("atac",)
+
     def predict_sequence(self, sequence: str, organism: str = "human",
                         output_types: Optional[List[str]] = None,
                         ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock sequence prediction with realistic data."""
-        time.sleep(0.1)  # Simulate network delay
-
+        if _MOCK_LATENCY:
+            time.sleep(_MOCK_LATENCY)  # Simulate network delay
+        return self._predict_sequence(sequence, organism, output_types)
+
+    def _predict_sequence(self, sequence: str, organism: str,
+                          output_types: Optional[List[str]],
+                          tracks: Optional[tuple] = None) -> Dict[str, Any]:
+        # tracks: precomputed (atac, cage, dnase) predictions, see predict_sequences
         sequence_length = len(sequence)
-        gc_content = (sequence.count('G') + sequence.count('C')) / sequence_length * 100
 
         # Generate mock genomic predictions
         num_predictions = max(1, sequence_length // 20)
 
+        rng = _rng_for_thread()
+        if rng is not None:
+            # One pass over the sequence bytes and one PRNG call per track
+            buf = np.frombuffer(sequence.encode('ascii', 'replace'), dtype=np.uint8)
+            gc_count = int(np.count_nonzero((buf == ord('G')) | (buf == ord('C'))))
+            if tracks is None:
+                tracks = (np.round(rng.random(num_predictions), 4).tolist() for _ in range(3))
+            atac, cage, dnase = tracks
+        else:
+            gc_count = sequence.count('G') + sequence.count('C')
+            atac, cage, dnase = ([round(random.uniform(0.0, 1.0), 4) for _ in range(num_predictions)]
+                                 for _ in range(3))
+        gc_content = gc_count / sequence_length * 100
+
         result = {
             "success": True,
             "sequence_info": {
@@ -49,14 +121,14 @@ class MockAlphaGenomeClient:
                 "gc_content": round(gc_content, 2)
             },
             "predictions": {
-                "atac_accessibility": [round(random.uniform(0.0, 1.0), 4) for _ in range(num_predictions)],
-                "cage_tss": [round(random.uniform(0.0, 1.0), 4) for _ in range(num_predictions)],
-                "dnase_hypersensitivity": [round(random.uniform(0.0, 1.0), 4) for _ in range(num_predictions)]
+                "atac_accessibility": atac,
+                "cage_tss": cage,
+                "dnase_hypersensitivity": dnase
             },
             "metadata": {
                 "organism": organism,
-                "model_version": self.model_version,
-                "output_types": output_types or ["atac", "cage", "dnase"]
+                **self._meta_skeleton,
+                "output_types": list(output_types or self._default_output_types)
             }
         }
         return result
@@ -66,19 +138,28 @@ class MockAlphaGenomeClient:
                         output_types: Optional[List[str]] = None,
                         ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock interval prediction with peak detection."""
-        time.sleep(0.1)
+        if _MOCK_LATENCY:
+            time.sleep(_MOCK_LATENCY)
 
         interval_length = end - start
         num_scores = max(10, interval_length // 1000)
 
-        # Generate accessibility scores
-        scores = [round(random.uniform(0.1, 0.9), 4) for _ in range(num_scores)]
-
-        # Identify peaks (scores > threshold)
+        # Generate accessibility scores and identify peaks (scores > threshold)
         threshold = 0.7
-        peaks = [{"position": start + i * (interval_length // num_scores),
-                 "score": score}
-                for i, score in enumerate(scores) if score > threshold]
+        step = interval_length // num_scores
+        rng = _rng_for_thread()
+        if rng is not None:
+            score_array = np.round(rng.uniform(0.1, 0.9, num_scores), 4)
+            peak_indices = np.flatnonzero(score_array > threshold)
+            peaks = [{"position": start + i * step, "score": score}
+                     for i, score in zip(peak_indices.tolist(), score_array[peak_indices].tolist())]
+            mean_accessibility = round(float(score_array.mean()), 4)
+            scores = score_array.tolist()
+        else:
+            scores = [round(random.uniform(0.1, 0.9), 4) for _ in range(num_scores)]
+            peaks = [{"position": start + i * step, "score": score}
+                     for i, score in enumerate(scores) if score > threshold]
+            mean_accessibility = round(sum(scores) / len(scores), 4)
 
         result = {
             "success": True,
@@ -96,12 +177,12 @@ class MockAlphaGenomeClient:
                 "summary": {
                     "total_scores": len(scores),
                     "peaks_detected": len(peaks),
-                    "mean_accessibility": round(sum(scores) / len(scores), 4)
+                    "mean_accessibility": mean_accessibility
                 }
             },
             "metadata": {
-                "model_version": self.model_version,
-                "output_types": output_types or ["atac"]
+                **self._meta_skeleton,
+                "output_types": list(output_types or self._default_interval_output_types)
             }
         }
         return result
@@ -112,24 +193,28 @@ class MockAlphaGenomeClient:
                        output_types: Optional[List[str]] = None,
                        ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock variant effect prediction."""
-        time.sleep(0.1)
-
-        # Generate mock predictions for reference and alternate
-        ref_predictions = {
-            "atac_accessibility": round(random.uniform(0.2, 0.8), 4),
-            "cage_tss": round(random.uniform(0.1, 0.7), 4),
-            "dnase_hypersensitivity": round(random.uniform(0.3, 0.9), 4)
-        }
-
-        alt_predictions = {
-            "atac_accessibility": round(ref_predictions["atac_accessibility"] + random.uniform(-0.3, 0.3), 4),
-            "cage_tss": round(ref_predictions["cage_tss"] + random.uniform(-0.2, 0.2), 4),
-            "dnase_hypersensitivity": round(ref_predictions["dnase_hypersensitivity"] + random.uniform(-0.4, 0.4), 4)
-        }
+        if _MOCK_LATENCY:
+            time.sleep(_MOCK_LATENCY)
+
+        # Generate mock predictions for reference and alternate, with the
+        # alternate values clamped to [0, 1]
+        rng = _rng_for_thread()
+        if rng is not None:
+            ref_values = np.round(rng.uniform(_VARIANT_REF_LOW, _VARIANT_REF_HIGH), 4)
+            spread = np.asarray(_VARIANT_SPREAD)
+            alt_values = np.clip(np.round(ref_values + rng.uniform(-spread, spread), 4), 0.0, 1.0)
+            effect_values = np.round(alt_values - ref_values, 4).tolist()
+            ref_values, alt_values = ref_values.tolist(), alt_values.tolist()
+        else:
+            ref_values = [round(random.uniform(low, high), 4)
+                          for low, high in zip(_VARIANT_REF_LOW, _VARIANT_REF_HIGH)]
+            alt_values = [min(1.0, max(0.0, round(value + random.uniform(-spread, spread), 4)))
+                          for value, spread in zip(ref_values, _VARIANT_SPREAD)]
+            effect_values = [round(alt_value - ref_value, 4)
+                             for alt_value, ref_value in zip(alt_values, ref_values)]
 
-        # Clamp values to [0, 1]
-        for key in alt_predictions:
-            alt_predictions[key] = max(0, min(1, alt_predictions[key]))
+        ref_predictions = dict(zip(_VARIANT_TRACKS, ref_values))
+        alt_predictions = dict(zip(_VARIANT_TRACKS, alt_values))
 
         result = {
             "success": True,
@@ -145,24 +230,21 @@ class MockAlphaGenomeClient:
             "predictions": {
                 "reference": ref_predictions,
                 "alternate": alt_predictions,
-                "effects": {
-                    "atac_change": round(alt_predictions["atac_accessibility"] - ref_predictions["atac_accessibility"], 4),
-                    "cage_change": round(alt_predictions["cage_tss"] - ref_predictions["cage_tss"], 4),
-                    "dnase_change": round(alt_predictions["dnase_hypersensitivity"] - ref_predictions["dnase_hypersensitivity"], 4)
-                }
+                "effects": dict(zip(_VARIANT_EFFECTS, effect_values))
             },
             "metadata": {
-                "model_version": self.model_version,
-                "output_types": output_types or ["atac", "cage", "dnase"]
+                **self._meta_skeleton,
+                "output_types": list(output_types or self._default_output_types)
             }
         }
         return result
 
     def score_variant(self, chromosome: str, position: int, ref: str, alt: str,
                      interval_start: int, interval_end: int,
-                     organism: str = "human") -> Dict[str, Any]:
-        """Mock variant scoring with multiple algorithms."""
-        time.sleep(0.1)
+                     organism: str = "human", soa: bool = False) -> Dict[str, Any]:
+        """Mock variant scoring with multiple algorithms (soa: also return "scores_soa")."""
+        if _MOCK_LATENCY:
+            time.sleep(_MOCK_LATENCY)
 
         # Mock scores for different algorithms
         algorithms = [
@@ -172,22 +254,37 @@ class MockAlphaGenomeClient:
             "fitCons", "PhyloP"
         ]
 
-        scores = {}
-        for algo in algorithms:
-            scores[algo] = {
-                "score": round(random.uniform(0.0, 1.0), 4),
-                "prediction": random.choice(["pathogenic", "benign", "uncertain"])
-            }
+        categories = ["pathogenic", "benign", "uncertain"]
+
+        rng = _rng_for_thread()
+        if rng is not None:
+            # Draw all scores and category codes at once and reduce the arrays
+            values = np.round(rng.random(len(algorithms)), 4)
+            codes = rng.integers(0, len(categories), len(algorithms))
+            predictions = [categories[code] for code in codes.tolist()]
+            pathogenic_count, benign_count, uncertain_count = np.bincount(codes, minlength=3).tolist()
+            score_values = values.tolist()
+            mean_score = round(float(values.mean()), 4)
+        else:
+            score_values = [round(random.uniform(0.0, 1.0), 4) for _ in algorithms]
+            predictions = [random.choice(categories) for _ in algorithms]
+            prediction_counts = Counter(predictions)
+            pathogenic_count, benign_count, uncertain_count = (prediction_counts[c] for c in categories)
+            mean_score = round(sum(score_values) / len(score_values), 4)
+
+        # Per-algorithm records; with soa=True the same data is also returned
+        # column-wise as "scores_soa" (parallel lists per field)
+        scores = {algo: {"score": score, "prediction": prediction}
+                  for algo, score, prediction in zip(algorithms, score_values, predictions)}
 
         # Calculate summary statistics
-        score_values = [s["score"] for s in scores.values()]
         summary = {
-            "mean_score": round(sum(score_values) / len(score_values), 4),
+            "mean_score": mean_score,
             "max_score": max(score_values),
             "min_score": min(score_values),
-            "pathogenic_count": sum(1 for s in scores.values() if s["prediction"] == "pathogenic"),
-            "benign_count": sum(1 for s in scores.values() if s["prediction"] == "benign"),
-            "uncertain_count": sum(1 for s in scores.values() if s["prediction"] == "uncertain")
+            "pathogenic_count": pathogenic_count,
+            "benign_count": benign_count,
+            "uncertain_count": uncertain_count
         }
 
         result = {
@@ -212,17 +309,39 @@ class MockAlphaGenomeClient:
                 "model_version": self.model_version
             }
         }
+        if soa:
+            result["scores_soa"] = {
+                "algorithms": algorithms,
+                "score": score_values,
+                "prediction": predictions
+            }
         return result
 
     def predict_sequences(self, sequences: List[str], organism: str = "human",
                          output_types: Optional[List[str]] = None,
                          ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
         """Mock batch sequence prediction."""
-        time.sleep(0.2)
+        # One simulated round-trip for the whole batch, not one per sequence
+        if _MOCK_LATENCY:
+            time.sleep(2 * _MOCK_LATENCY)
+
+        rng = _rng_for_thread()
+        if rng is not None and sequences:
+            # Draw the predictions of the whole batch at once, three PRNG calls
+            # in total, and slice each sequence's share out of them
+            counts = np.fromiter((max(1, len(sequence) // 20) for sequence in sequences),
+                                 dtype=np.int64, count=len(sequences))
+            offsets = np.concatenate(([0], np.cumsum(counts))).tolist()
+            total = offsets[-1]
+            draws = [np.round(rng.random(total), 4).tolist() for _ in range(3)]
+            batch_tracks = [tuple(track[offsets[i]:offsets[i + 1]] for track in draws)
+                            for i in range(len(sequences))]
+        else:
+            batch_tracks = [None] * len(sequences)
 
         results = []
         for i, sequence in enumerate(sequences):
-            result = self.predict_sequence(sequence, organism, output_types, ontology_terms)
+            result = self._predict_sequence(sequence, organism, output_types, batch_tracks[i])
             result["sequence_index"] = i
             results.append(result)
 
@@ -235,63 +354,75 @@ class MockAlphaGenomeClient:
             },
             "results": results,
             "metadata": {
-                "model_version": self.model_version,
-                "output_types": output_types or ["atac", "cage", "dnase"]
+                **self._meta_skeleton,
+                "output_types": list(output_types or self._default_output_types)
             }
         }
 
     def get_output_metadata(self, organism: str = "human") -> Dict[str, Any]:
-        """Mock output metadata."""
-        time.sleep(0.1)
-
-        output_types = {
-            "ATAC": {
-                "description": "Chromatin accessibility predictions",
-                "data_type": "float",
-                "range": "[0.0, 1.0]",
-                "units": "accessibility_score"
-            },
-            "CAGE": {
-                "description": "Transcription start site predictions",
-                "data_type": "float",
-                "range": "[0.0, 1.0]",
-                "units": "tss_score"
-            },
-            "DNASE": {
-                "description": "DNase hypersensitivity predictions",
-                "data_type": "float",
-                "range": "[0.0, 1.0]",
-                "units": "hypersensitivity_score"
-            },
-            "HISTONE_MARKS": {
-                "description": "Histone modification predictions",
-                "data_type": "float",
-                "range": "[0.0, 1.0]",
-                "units": "modification_score"
-            },
-            "GENE_EXPRESSION": {
-                "description": "Gene expression predictions",
-                "data_type": "float",
-                "range": "[0.0, inf]",
-                "units": "expression_level"
-            }
-        }
+        """Mock output metadata (built once per organism, see _build_output_metadata)."""
+        if _MOCK_LATENCY:
+            time.sleep(_MOCK_LATENCY)
 
-        return {
-            "success": True,
-            "organism": organism,
-            "available_outputs": list(output_types.keys()),
-            "output_descriptions": output_types,
-            "model_info": {
-                "version": self.model_version,
-                "type": "mock_model",
-                "supported_organisms": ["human", "mouse", "fly"]
-            },
-            "metadata": {
-                "api_version": "mock_v1.0",
-                "last_updated": "2024-12-25"
-            }
+        return copy.deepcopy(_build_output_metadata(organism, self.model_version))
+
+
+@lru_cache(maxsize=8)
+def _build_output_metadata(organism: str, model_version: str) -> Dict[str, Any]:
+    """
+    Build the static mock output metadata for an organism.
+
+    The result is cached and must not be modified; get_output_metadata
+    hands out deep copies.
+    """
+    output_types = {
+        "ATAC": {
+            "description": "Chromatin accessibility predictions",
+            "data_type": "float",
+            "range": "[0.0, 1.0]",
+            "units": "accessibility_score"
+        },
+        "CAGE": {
+            "description": "Transcription start site predictions",
+            "data_type": "float",
+            "range": "[0.0, 1.0]",
+            "units": "tss_score"
+        },
+        "DNASE": {
+            "description": "DNase hypersensitivity predictions",
+            "data_type": "float",
+            "range": "[0.0, 1.0]",
+            "units": "hypersensitivity_score"
+        },
+        "HISTONE_MARKS": {
+            "description": "Histone modification predictions",
+            "data_type": "float",
+            "range": "[0.0, 1.0]",
+            "units": "modification_score"
+        },
+        "GENE_EXPRESSION": {
+            "description": "Gene expression predictions",
+            "data_type": "float",
+            "range": "[0.0, inf]",
+            "units": "expression_level"
         }
+    }
+
+    return {
+        "success": True,
+        "organism": organism,
+        "available_outputs": list(output_types.keys()),
+        "output_descriptions": output_types,
+        "model_info": {
+            "version": model_version,
+            "type": "mock_model",
+            "supported_organisms": ["human", "mouse", "fly"]
+        },
+        "metadata": {
+            "api_version": "mock_v1.0",
+            "last_updated": "2024-12-25"
+        }
+    }
 
 
 class AlphaGenomeClient:
@@ -320,12 +451,18 @@ class AlphaGenomeClient:
                 "Use ALPHAGENOME_USE_MOCK=true for testing."
             )
 
-    def predict_sequence(self, sequence: str, organism: str = "human",
+    def predict_sequence(self, sequence: Union[str, bytes], organism: str = "human",
                         output_types: Optional[List[str]] = None,
                         ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Predict genomic features for a DNA sequence."""
+        """
+        Predict genomic features for a DNA sequence.
+
+        The sequence may be ASCII bytes (e.g. from load_sequences_with_lengths
+        with as_bytes=True); it is validated as is and decoded only once it
+        has passed.
+        """
         # Input validation
-        if not sequence or not isinstance(sequence, str):
+        if not sequence or not isinstance(sequence, (str, bytes)):
             return {
                 "success": False,
                 "error": "Sequence must be a non-empty string",
@@ -333,8 +470,7 @@ class AlphaGenomeClient:
             }
 
         # Check for valid DNA characters
-        valid_chars = set('ATGCN')
-        invalid_chars = set(sequence.upper()) - valid_chars
+        invalid_chars = invalid_dna_characters(sequence)
         if invalid_chars:
             return {
                 "success": False,
@@ -342,6 +478,8 @@ class AlphaGenomeClient:
                 "type": "ValueError"
             }
 
+        if isinstance(sequence, bytes):
+            sequence = sequence.decode('ascii')
         return self.client.predict_sequence(sequence, organism, output_types, ontology_terms)
 
     def predict_interval(self, chromosome: str, start: int, end: int,
@@ -391,8 +529,13 @@ class AlphaGenomeClient:
 
     def score_variant(self, chromosome: str, position: int, ref: str, alt: str,
                      interval_start: int, interval_end: int,
-                     organism: str = "human") -> Dict[str, Any]:
-        """Score a genetic variant using recommended scorers."""
+                     organism: str = "human", soa: bool = False) -> Dict[str, Any]:
+        """
+        Score a genetic variant using recommended scorers.
+
+        With soa=True the scores are also returned column-wise as "scores_soa"
+        (algorithms, score and prediction as parallel lists).
+        """
         # Same validation as predict_variant
         if not ref or not alt:
             return {
@@ -408,12 +551,13 @@ class AlphaGenomeClient:
                 "type": "ValueError"
             }
 
-        return self.client.score_variant(chromosome, position, ref, alt, interval_start, interval_end, organism)
+        return self.client.score_variant(chromosome, position, ref, alt, interval_start, interval_end, organism,
+                                         soa=soa)
 
-    def predict_sequences(self, sequences: List[str], organism: str = "human",
+    def predict_sequences(self, sequences: List[Union[str, bytes]], organism: str = "human",
                          output_types: Optional[List[str]] = None,
                          ontology_terms: Optional[List[str]] = None) -> Dict[str, Any]:
-        """Predict genomic features for multiple DNA sequences."""
+        """Predict genomic features for multiple DNA sequences (str or ASCII bytes)."""
         if not sequences:
             return {
                 "success": False,
@@ -421,8 +565,39 @@ class AlphaGenomeClient:
                 "type": "ValueError"
             }
 
+        sequences = [seq.decode('ascii') if isinstance(seq, bytes) else seq for seq in sequences]
         return self.client.predict_sequences(sequences, organism, output_types, ontology_terms)
 
     def get_output_metadata(self, organism: str = "human") -> Dict[str, Any]:
         """Get metadata about available outputs."""
-        return self.client.get_output_metadata(organism)
\ No newline at end of file
+        return self.client.get_output_metadata(organism)
+
+
+_client_cache: "OrderedDict[str, AlphaGenomeClient]" = OrderedDict()
+_client_cache_lock = threading.Lock()
+
+
+def get_cached_client(api_key: str) -> AlphaGenomeClient:
+    """
+    Return a shared AlphaGenomeClient for an API key, creating it on first use.
+
+    Pipelines calling the run_* functions in a loop reuse one client (and its
+    connections) per key instead of constructing a new one per call. Clients
+    are keyed by a BLAKE2b digest, so raw API keys are not kept as cache
+    keys; the least recently used client is dropped beyond CLIENT_CACHE_SIZE.
+    """
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest() if api_key else ""
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache.move_to_end(key)
+            return client
+
+    # Construct outside the lock; a concurrent first call may build a spare
+    client = AlphaGenomeClient(api_key)
+    with _client_cache_lock:
+        client = _client_cache.setdefault(key, client)
+        _client_cache.move_to_end(key)
+        while len(_client_cache) > CLIENT_CACHE_SIZE:
+            _client_cache.popitem(last=False)
+    return client
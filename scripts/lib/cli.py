@@ -0,0 +1,238 @@
+"""
+Shared command line interface for the prediction scripts.
+
+The DNA sequence, genomic interval and batch sequence scripts take the same
+analysis, API and output options and handle results and errors the same
+way. Each command is described once in COMMAND_SPECS; build_parser turns a
+spec into an ArgumentParser (memoized, so repeated calls in one process do
+not rebuild it) and run_command runs it. The scripts themselves are thin
+wrappers around run_command, and scripts/ag_cli.py exposes all commands as
+subcommands of one entry point.
+"""
+
+import argparse
+import importlib
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+
+from utils import handle_error
+
+# Per command: where its run_* function lives, its input options (flags,
+# add_argument keyword arguments), extra analysis options and how parsed
+# arguments map to run_* keyword arguments beyond the shared ones
+COMMAND_SPECS: Dict[str, Dict[str, Any]] = {
+    "dna": {
+        "module": "dna_sequence_prediction",
+        "runner": "run_dna_sequence_prediction",
+        "script": "dna_sequence_prediction.py",
+        "help": "Predict genomic features for a DNA sequence",
+        "inputs": [
+            (('--sequence', '-s'), {"help": 'DNA sequence string (A, T, G, C, N)'}),
+            (('--input', '-i'), {"help": 'Path to text file containing DNA sequence'}),
+        ],
+        "exclusive_inputs": True,
+        "options": [],
+        "kwargs": {"input_sequence": "sequence", "input_file": "input"},
+        "epilog": """
+Examples:
+  # Analyze a DNA sequence with specific output types
+  python %(prog)s --sequence "ATGCGATCGTAGCTAGCATGCAAATTTGGGCCC" --output-types atac cage dnase
+
+  # Load sequence from file
+  python %(prog)s --input examples/data/sample_sequence.txt --organism human
+
+  # Generate all available outputs
+  python %(prog)s --sequence "ATGCGATCGTAGCTAGCATGC" --all-outputs
+
+  # Save results to file with pretty formatting
+  python %(prog)s --sequence "ATGCGATCGATCGATC" --output results/pred.json --pretty
+        """,
+    },
+    "interval": {
+        "module": "genomic_interval_analysis",
+        "runner": "run_genomic_interval_analysis",
+        "script": "genomic_interval_analysis.py",
+        "help": "Analyze a genomic interval for regulatory features",
+        "inputs": [
+            (('--interval', '-i'), {"required": True,
+                                    "help": 'Genomic interval in format chr:start-end (e.g., chr1:1000000-2000000)'}),
+        ],
+        "exclusive_inputs": False,
+        "options": [],
+        "kwargs": {"interval": "interval"},
+        "epilog": """
+Examples:
+  # Analyze a genomic interval with default ATAC output
+  python %(prog)s --interval "chr1:1000000-1002048"
+
+  # Analyze interval with specific output types
+  python %(prog)s --interval "chr1:1000000-1002048" --output-types atac cage dnase
+
+  # Generate all available outputs with pretty formatting
+  python %(prog)s --interval "chr1:1000000-1002048" --all-outputs --pretty
+
+  # Save results to file
+  python %(prog)s --interval "chr1:1000000-1002048" --output results/interval.json
+        """,
+    },
+    "batch": {
+        "module": "batch_sequence_analysis",
+        "runner": "run_batch_sequence_analysis",
+        "script": "batch_sequence_analysis.py",
+        "help": "Analyze multiple DNA sequences in batch",
+        "inputs": [
+            (('--input', '-i'), {"required": True,
+                                 "help": 'Path to text file containing DNA sequences (one per line)'}),
+        ],
+        "exclusive_inputs": False,
+        "options": [
+            (('--max-workers',), {"type": int, "default": 5,
+                                  "help": 'Maximum number of requests in flight (default: %(default)s)'}),
+        ],
+        "kwargs": {"input_file": "input", "max_workers": "max_workers"},
+        "epilog": """
+Examples:
+  # Analyze sequences from file with default outputs
+  python %(prog)s --input examples/data/sequences.txt
+
+  # Analyze with specific output types
+  python %(prog)s --input examples/data/sequences.txt --output-types atac cage
+
+  # Save results with pretty formatting
+  python %(prog)s --input examples/data/sequences.txt --output results/batch.json --pretty
+
+  # Analyze all output types with parallel processing
+  python %(prog)s --input examples/data/sequences.txt --all-outputs --max-workers 10
+        """,
+    },
+}
+
+
+def add_arguments(parser: argparse.ArgumentParser, spec: Dict[str, Any]) -> None:
+    """Add the input options of a command spec and the shared options to parser."""
+    # Input options
+    if spec["exclusive_inputs"]:
+        input_group = parser.add_mutually_exclusive_group(required=True)
+    else:
+        input_group = parser
+    for flags, options in spec["inputs"]:
+        input_group.add_argument(*flags, **options)
+
+    # Analysis options
+    parser.add_argument('--organism', default="human",
+                        help='Target organism (default: human)')
+    parser.add_argument('--output-types', nargs='*',
+                        help='Specific output types to request (e.g., atac cage dnase)')
+    parser.add_argument('--all-outputs', action='store_true',
+                        help='Request all available output types')
+    for flags, options in spec["options"]:
+        parser.add_argument(*flags, **options)
+
+    # API options
+    parser.add_argument('--api-key',
+                        help='AlphaGenome API key (or set ALPHAGENOME_API_KEY env var)')
+
+    # Output options
+    parser.add_argument('--output', '-o',
+                        help='Output file path (default: stdout)')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Pretty print JSON output')
+
+
+@lru_cache(maxsize=None)
+def build_parser(command: str, description: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the parser of one command, e.g. for the standalone script."""
+    spec = COMMAND_SPECS[command]
+    parser = argparse.ArgumentParser(
+        description=description or spec["help"],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=spec["epilog"]
+    )
+    add_arguments(parser, spec)
+    return parser
+
+
+@lru_cache(maxsize=None)
+def build_main_parser() -> argparse.ArgumentParser:
+    """Build the parser with one subcommand per command spec."""
+    parser = argparse.ArgumentParser(description="AlphaGenome analysis tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, spec in COMMAND_SPECS.items():
+        subparser = subparsers.add_parser(
+            command,
+            help=spec["help"],
+            description=spec["help"],
+            formatter_class=argparse.RawDescriptionHelpFormatter,
+            epilog=spec["epilog"]
+        )
+        add_arguments(subparser, spec)
+    return parser
+
+
+def run_command(command: str, runner: Optional[Callable[..., Dict[str, Any]]] = None,
+                argv: Optional[List[str]] = None, description: Optional[str] = None) -> int:
+    """
+    Parse the arguments of one command, run it and write its result.
+
+    Args:
+        command: Key into COMMAND_SPECS
+        runner: The command's run_* function (imported from its script if omitted)
+        argv: Command line arguments (default: sys.argv[1:])
+        description: Parser description (default: the spec's help text)
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser(command, description=description).parse_args(argv)
+    return _execute(COMMAND_SPECS[command], runner, args)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point dispatching to the command named by the first argument."""
+    args = build_main_parser().parse_args(argv)
+    return _execute(COMMAND_SPECS[args.command], None, args)
+
+
+def _execute(spec: Dict[str, Any], runner: Optional[Callable[..., Dict[str, Any]]],
+             args: argparse.Namespace) -> int:
+    # Imported here so that --help and argument errors do not load it
+    from file_io import get_writer
+    write = get_writer(args.pretty)
+
+    try:
+        if runner is None:
+            runner = getattr(importlib.import_module(spec["module"]), spec["runner"])
+
+        kwargs = {name: getattr(args, dest) for name, dest in spec["kwargs"].items()}
+        result = runner(
+            output_file=args.output,
+            organism=args.organism,
+            output_types=args.output_types,
+            all_outputs=args.all_outputs,
+            api_key=args.api_key,
+            pretty=args.pretty,
+            async_write=True,
+            **kwargs
+        )
+
+        # Wait for the output file before reporting success
+        write_future = result.pop("_write_future", None)
+        if write_future is not None:
+            write_future.result()
+
+        # Output results if not saved to file
+        if not args.output:
+            write(result)
+        else:
+            print(f"✅ Success: {result.get('output_file', 'Completed')}")
+
+        # Exit with error code if the command failed
+        return 0 if result.get('success', False) else 1
+
+    except KeyboardInterrupt:
+        print("\n⚠️  Operation cancelled by user")
+        return 1
+    except Exception as e:
+        error_result = handle_error(e, spec["script"])
+        write(error_result)
+        return 1
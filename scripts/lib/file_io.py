@@ -5,8 +5,37 @@ Extracted and simplified from repo code to minimize dependencies.
 """
 
 import json
+import mmap
+import os
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Union, Any, List
+from typing import Union, Any, Callable, List, Optional, Tuple
+
+try:
+    from utils import invalid_dna_characters
+except ImportError:  # imported as part of the lib package, e.g. lib.file_io by the server
+    from .utils import invalid_dna_characters
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Background writer for write_output_async, created on first use
+_writer: Optional[ThreadPoolExecutor] = None
+_writer_lock = threading.Lock()
+
+# Parent directories already created (or found) by ensure_parent
+_DIR_CACHE = set()
+
+# Sequence files at least this large are read with concurrent chunk reads
+PARALLEL_READ_THRESHOLD = 256 << 20
+
+# Byte tables for sequence cleaning: upper-case a/t/g/c/n and drop everything else
+_UPPER = bytes.maketrans(b'atgcn', b'ATGCN')
+_DELETE = bytes(b for b in range(256) if chr(b).upper() not in 'ATGCN')
 
 
 def load_json(file_path: Union[str, Path]) -> dict:
@@ -15,15 +44,30 @@ def load_json(file_path: Union[str, Path]) -> dict:
         return json.load(f)
 
 
-def save_json(data: dict, file_path: Union[str, Path], pretty: bool = True) -> None:
-    """Save data to JSON file."""
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w') as f:
-        if pretty:
-            json.dump(data, f, indent=2)
-        else:
-            json.dump(data, f)
+def ensure_parent(file_path: Union[str, Path]) -> Path:
+    """
+    Create the parent directory of file_path if needed and return file_path as a Path.
+
+    Directories are remembered once created, so repeated writes into the same
+    directory (e.g. a server saving many results) only check that it still
+    exists instead of calling mkdir; one removed in the meantime is re-created.
+    """
+    file_path = file_path if isinstance(file_path, Path) else Path(file_path)
+    parent = file_path.parent
+    if parent not in _DIR_CACHE or not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
+        _DIR_CACHE.add(parent)
+    return file_path
+
+
+def save_json(data: dict, file_path: Union[str, Path], pretty: bool = False) -> None:
+    """
+    Save data to JSON file (encoded with orjson if installed).
+
+    Compact by default: indentation roughly doubles the size of large
+    results; pass pretty=True for files meant to be read by people.
+    """
+    ensure_parent(file_path).write_bytes(_dumps(data, pretty))
 
 
 def load_text(file_path: Union[str, Path]) -> str:
@@ -34,9 +78,7 @@ def load_text(file_path: Union[str, Path]) -> str:
 
 def save_text(text: str, file_path: Union[str, Path]) -> None:
     """Save text to file."""
-    file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w') as f:
+    with open(ensure_parent(file_path), 'w') as f:
         f.write(text)
 
 
@@ -47,12 +89,11 @@ def load_sequence_from_file(file_path: Union[str, Path]) -> str:
     Extracted from examples/use_case_1_dna_sequence_prediction.py:load_sequence_from_file
     """
     try:
-        with open(file_path, 'r') as f:
-            # Read first line and strip whitespace
-            sequence = f.readline().strip()
-            # Remove any non-DNA characters
-            sequence = ''.join(c.upper() for c in sequence if c.upper() in 'ATGCN')
-            return sequence
+        with open(file_path, 'rb') as f:
+            # Read first line (ending at \n, \r\n or a lone \r, as in text mode)
+            lines = f.readline().splitlines()
+            # Upper-case and remove any non-DNA characters in one pass
+            return lines[0].translate(_UPPER, delete=_DELETE).decode('ascii') if lines else ''
     except Exception as e:
         raise ValueError(f"Could not read sequence from {file_path}: {e}")
 
@@ -63,27 +104,98 @@ def load_sequences_from_file(file_path: Union[str, Path]) -> List[str]:
 
     Extracted from examples/use_case_5_batch_sequence_analysis.py:load_sequences_from_file
     """
+    return load_sequences_with_lengths(file_path)[0]
+
+
+def load_sequences_with_lengths(file_path: Union[str, Path], as_bytes: bool = False) -> Tuple[List[Any], Any]:
+    """
+    Load multiple DNA sequences from a text file together with their lengths.
+
+    The file is memory-mapped (or, from PARALLEL_READ_THRESHOLD on, read
+    with concurrent chunk reads, see parallel_reader) and split at the
+    newline offsets found in one NumPy scan. If the file holds nothing but DNA characters and newlines,
+    the lengths are the gaps between newlines and come without another pass
+    over the sequences. Lines are cleaned as in load_sequences_from_file
+    (upper-cased, non-DNA characters removed).
+
+    Args:
+        file_path: Text file with one sequence per line
+        as_bytes: Return the sequences as ASCII bytes instead of decoding
+            every one of them to str
+
+    Returns:
+        Tuple of (sequences, lengths); lengths is a NumPy int64 array, or a
+        list of ints if NumPy is not installed
+    """
     try:
-        sequences = []
-        with open(file_path, 'r') as f:
-            for line_num, line in enumerate(f, 1):
-                sequence = line.strip()
-                if sequence:  # Skip empty lines
-                    # Clean sequence (remove non-DNA characters)
-                    cleaned_sequence = ''.join(c.upper() for c in sequence if c.upper() in 'ATGCN')
-                    if cleaned_sequence:
-                        sequences.append(cleaned_sequence)
-                    else:
-                        raise ValueError(f"Line {line_num} contains no valid DNA characters: {sequence}")
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                sequences, lengths = [], []
+            elif size >= PARALLEL_READ_THRESHOLD:
+                from parallel_reader import read_file_parallel
+                sequences, lengths = _split_sequences(read_file_parallel(file_path), as_bytes)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sequences, lengths = _split_sequences(mm, as_bytes)
 
         if not sequences:
             raise ValueError("No valid DNA sequences found in file")
 
-        return sequences
+        return sequences, lengths
     except Exception as e:
         raise ValueError(f"Could not read sequences from {file_path}: {e}")
 
 
+def _split_sequences(data, as_bytes: bool = False) -> Tuple[List[Any], Any]:
+    """Split and clean the sequences of a file's contents, see load_sequences_with_lengths."""
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is None:
+        sequences = _clean_lines(data[:].splitlines(), as_bytes)
+        return sequences, [len(seq) for seq in sequences]
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    valid = np.zeros(256, dtype=bool)
+    valid[np.frombuffer(b'ATGCNatgcn\n', dtype=np.uint8)] = True
+    if not valid[buf].all():
+        del buf  # release the buffer export so a memory map can be closed
+        # Other characters (including \r line endings) need line-by-line cleaning
+        sequences = _clean_lines(data[:].splitlines(), as_bytes)
+        return sequences, np.fromiter(map(len, sequences), dtype=np.int64, count=len(sequences))
+
+    # Every line is already a valid sequence: only drop the empty ones
+    bounds = np.concatenate(([-1], np.flatnonzero(buf == 0x0A), [len(buf)]))
+    del buf
+    starts = bounds[:-1] + 1
+    ends = bounds[1:]
+    lengths = ends - starts
+    keep = lengths > 0
+    sequences = [bytes(data[start:end].translate(_UPPER))
+                 for start, end in zip(starts[keep].tolist(), ends[keep].tolist())]
+    if not as_bytes:
+        sequences = [seq.decode('ascii') for seq in sequences]
+    return sequences, lengths[keep]
+
+
+def _clean_lines(lines, as_bytes: bool = False) -> List[Any]:
+    """Upper-case and clean raw lines, skipping empty ones."""
+    sequences = []
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:  # Skip empty lines
+            continue
+        # Clean sequence (remove non-DNA characters)
+        cleaned_sequence = line.translate(_UPPER, delete=_DELETE)
+        if not cleaned_sequence:
+            raise ValueError(f"Line {line_num} contains no valid DNA characters: {line.decode('utf-8', 'replace')}")
+        sequences.append(bytes(cleaned_sequence) if as_bytes else cleaned_sequence.decode('ascii'))
+    return sequences
+
+
 def validate_dna_sequence(sequence: str) -> None:
     """
     Validate DNA sequence contains only valid characters.
@@ -94,31 +206,97 @@ def validate_dna_sequence(sequence: str) -> None:
         raise ValueError("DNA sequence cannot be empty")
 
     # Check for valid DNA characters
-    valid_chars = set('ATGCN')
-    invalid_chars = set(sequence.upper()) - valid_chars
+    invalid_chars = invalid_dna_characters(sequence)
     if invalid_chars:
         raise ValueError(f"Invalid DNA characters found: {invalid_chars}. Only A, T, G, C, N are allowed")
 
 
+# Encoders for both output styles, chosen once here instead of on every call
+_json_compact = json.JSONEncoder(separators=(',', ':'))
+_json_pretty = json.JSONEncoder(indent=2)
+
+if orjson is not None:
+    _ORJSON_OPTION = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps_compact(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTION)
+
+    def _dumps_pretty(data: Any) -> bytes:
+        return orjson.dumps(data, option=_ORJSON_OPTION | orjson.OPT_INDENT_2)
+else:
+    def _dumps_compact(data: Any) -> bytes:
+        return _json_compact.encode(data).encode()
+
+    def _dumps_pretty(data: Any) -> bytes:
+        return _json_pretty.encode(data).encode()
+
+
 def format_output(data: Any, pretty: bool = False) -> str:
-    """Format data as JSON string."""
-    if pretty:
-        return json.dumps(data, indent=2)
+    """Format data as JSON string (encoded with orjson if installed)."""
+    if orjson is not None:
+        return _dumps(data, pretty).decode()
+    return (_json_pretty if pretty else _json_compact).encode(data)
+
+
+def _dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize data to JSON bytes with orjson if installed (NumPy arrays included)."""
+    return _dumps_pretty(data) if pretty else _dumps_compact(data)
+
+
+def _write(output_bytes: bytes, output_file: Union[str, Path, None]) -> str:
+    if output_file:
+        ensure_parent(output_file).write_bytes(output_bytes)
+        return f"Results written to {output_file}"
     else:
-        return json.dumps(data)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(output_bytes + b'\n')
+        sys.stdout.buffer.flush()
+        return output_bytes.decode()
+
+
+def _write_compact(data: Any, output_file: Union[str, Path, None] = None) -> str:
+    return _write(_dumps_compact(data), output_file)
+
+
+def _write_pretty(data: Any, output_file: Union[str, Path, None] = None) -> str:
+    return _write(_dumps_pretty(data), output_file)
+
+
+def get_writer(pretty: bool = False) -> Callable[..., str]:
+    """
+    Return write_output specialized for one output style.
+
+    The returned function takes (data, output_file=None) and behaves like
+    write_output with the given pretty flag; callers writing several
+    results (e.g. a result and then an error) resolve it once.
+    """
+    return _write_pretty if pretty else _write_compact
 
 
 def write_output(data: Any, output_file: Union[str, Path, None] = None, pretty: bool = False) -> str:
     """
     Write output to file or return as string.
 
+    The JSON is encoded straight to bytes and written without a text codec.
+
     Returns the formatted output string.
     """
-    output_str = format_output(data, pretty)
+    return get_writer(pretty)(data, output_file)
 
-    if output_file:
-        save_text(output_str, output_file)
-        return f"Results written to {output_file}"
-    else:
-        print(output_str)
-        return output_str
\ No newline at end of file
+
+def write_output_async(data: Any, output_file: Union[str, Path], pretty: bool = False) -> Future:
+    """
+    Write output to a file on a background thread.
+
+    Serialization and the write overlap with whatever the caller does next;
+    data must not be modified until the returned Future is done. Pending
+    writes are completed before the interpreter exits.
+
+    Returns:
+        Future resolving to write_output's return value (re-raising its errors)
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="write_output")
+    return _writer.submit(get_writer(pretty), data, output_file)
@@ -0,0 +1,62 @@
+"""
+Parallel whole-file reads for very large input files.
+
+A plain read() (or faulting in a memory map) issues one request at a time,
+which leaves most of an SSD's queue depth unused. read_file_parallel splits
+the file into chunks and reads them with positional reads (os.preadv) from
+a pool of threads, so that up to `depth` requests are outstanding at once;
+the reads release the GIL and land directly in one preallocated buffer.
+
+This stands in for an io_uring reader: there are no io_uring bindings in the
+scripts' environment, while positional reads from threads give the same
+queue depth with the standard library only.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Union
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_DEPTH = 16
+
+
+def read_file_parallel(file_path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       depth: int = DEFAULT_DEPTH) -> bytearray:
+    """
+    Read a whole file with up to `depth` concurrent chunk reads.
+
+    Falls back to a single sequential read on platforms without os.preadv
+    and for files no larger than one chunk.
+
+    Args:
+        file_path: File to read
+        chunk_size: Bytes per read request
+        depth: Maximum number of read requests in flight
+
+    Returns:
+        The file contents
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not hasattr(os, 'preadv') or size <= chunk_size or depth <= 1:
+            return bytearray(f.read())
+
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        fd = f.fileno()
+
+        def read_chunk(offset: int) -> None:
+            end = min(offset + chunk_size, size)
+            while offset < end:
+                n = os.preadv(fd, [view[offset:end]], offset)
+                if n == 0:
+                    raise EOFError(f"{file_path} shrank while being read")
+                offset += n
+
+        with ThreadPoolExecutor(max_workers=depth) as pool:
+            # list() re-raises the first read error, if any
+            list(pool.map(read_chunk, range(0, size, chunk_size)))
+
+        view.release()
+        return buffer
@@ -5,13 +5,25 @@ Extracted and simplified parsing functions from use case scripts.
 """
 
 import re
-from typing import Tuple
+from functools import lru_cache
+from typing import Any, List, Sequence, Tuple
 
+# Interval format chr:start-end, e.g. chr1:1000-2000 or chr1:1000000-2000000
+_INTERVAL_RE = re.compile(r'^([^:]+):(\d+)-(\d+)$')
 
+# Variant format chr:posREF>ALT, e.g. chr1:1001000A>G
+_VARIANT_RE = re.compile(r'^([^:]+):(\d+)([ATGCN]+)>([ATGCN]+)$')
+_BASES = frozenset('ATGCN')
+
+
+@lru_cache(maxsize=4096)
 def parse_interval_string(interval_str: str) -> Tuple[str, int, int]:
     """
     Parse genomic interval string in format 'chr:start-end'.
 
+    Results are cached per string, so pipelines re-running the same interval
+    (e.g. over several organisms or output types) parse it once.
+
     Extracted from examples/use_case_2_genomic_interval_analysis.py:parse_interval_string
 
     Args:
@@ -23,16 +35,14 @@ def parse_interval_string(interval_str: str) -> Tuple[str, int, int]:
     Raises:
         ValueError: If interval format is invalid
     """
-    # Match patterns like chr1:1000-2000 or chr1:1000000-2000000
-    pattern = r'^([^:]+):(\d+)-(\d+)$'
-    match = re.match(pattern, interval_str.strip())
+    match = _INTERVAL_RE.match(interval_str.strip())
 
     if not match:
         raise ValueError(f"Invalid interval format: {interval_str}. Expected format: chr:start-end (e.g., chr1:1000-2000)")
 
-    chromosome = match.group(1)
-    start = int(match.group(2))
-    end = int(match.group(3))
+    chromosome, start, end = match.groups()
+    start = int(start)
+    end = int(end)
 
     if start >= end:
         raise ValueError(f"Start position ({start}) must be less than end position ({end})")
@@ -43,10 +53,67 @@ def parse_interval_string(interval_str: str) -> Tuple[str, int, int]:
     return chromosome, start, end
 
 
+def is_interval_string(interval_str: str) -> bool:
+    """Check the chr:start-end format without raising; parse_interval_string also checks the coordinates."""
+    return _INTERVAL_RE.match(interval_str.strip()) is not None
+
+
+def parse_intervals_many(lines: Sequence[str]) -> Tuple[List[str], Any, Any]:
+    """
+    Parse many interval strings in format 'chr:start-end' at once.
+
+    Coordinates are collected into int64 arrays and checked in one
+    vectorized pass, instead of validating every interval separately.
+
+    Args:
+        lines: Interval strings, e.g. "chr1:1000000-2000000"
+
+    Returns:
+        Tuple of (chromosomes, starts, ends); starts and ends are NumPy int64
+        arrays, or lists of ints if NumPy is not installed
+
+    Raises:
+        ValueError: For the first invalid interval
+    """
+    chromosomes = []
+    start_strs = []
+    end_strs = []
+    for line in lines:
+        match = _INTERVAL_RE.match(line.strip())
+        if not match:
+            raise ValueError(f"Invalid interval format: {line}. Expected format: chr:start-end (e.g., chr1:1000-2000)")
+        chromosome, start, end = match.groups()
+        chromosomes.append(chromosome)
+        start_strs.append(start)
+        end_strs.append(end)
+
+    try:
+        import numpy as np
+    except ImportError:
+        starts = list(map(int, start_strs))
+        ends = list(map(int, end_strs))
+        bad = next((i for i, (start, end) in enumerate(zip(starts, ends)) if start >= end), None)
+    else:
+        starts = np.fromiter(map(int, start_strs), dtype=np.int64, count=len(start_strs))
+        ends = np.fromiter(map(int, end_strs), dtype=np.int64, count=len(end_strs))
+        invalid = starts >= ends
+        bad = int(np.argmax(invalid)) if invalid.any() else None
+
+    # Starts are unsigned digit strings, so only the order needs checking
+    if bad is not None:
+        raise ValueError(f"Start position ({int(starts[bad])}) must be less than end position ({int(ends[bad])}) "
+                         f"in interval {lines[bad]}")
+
+    return chromosomes, starts, ends
+
+
+@lru_cache(maxsize=4096)
 def parse_variant_string(variant_str: str) -> Tuple[str, int, str, str]:
     """
     Parse variant string in format 'chr:posREF>ALT'.
 
+    Results are cached per string, like parse_interval_string.
+
     Extracted from examples/use_case_3_variant_effect_prediction.py:parse_variant_string
 
     Args:
@@ -58,17 +125,23 @@ def parse_variant_string(variant_str: str) -> Tuple[str, int, str, str]:
     Raises:
         ValueError: If variant format is invalid
     """
-    # Match patterns like chr1:1001000A>G
-    pattern = r'^([^:]+):(\d+)([ATGCN]+)>([ATGCN]+)$'
-    match = re.match(pattern, variant_str.strip().upper())
+    normalized = variant_str.strip().upper()
+
+    # Fast path for SNVs (single-base REF and ALT), which make up most variant
+    # sets: check the fixed-shape tail directly instead of running the regex
+    colon = normalized.find(':')
+    if (colon > 0 and len(normalized) - colon >= 5 and normalized[-2] == '>'
+            and normalized[-3] in _BASES and normalized[-1] in _BASES
+            and normalized[colon + 1:-3].isdecimal()):
+        return normalized[:colon], int(normalized[colon + 1:-3]), normalized[-3], normalized[-1]
+
+    match = _VARIANT_RE.match(normalized)
 
     if not match:
         raise ValueError(f"Invalid variant format: {variant_str}. Expected format: chr:posREF>ALT (e.g., chr1:1001000A>G)")
 
-    chromosome = match.group(1)
-    position = int(match.group(2))
-    ref = match.group(3)
-    alt = match.group(4)
+    chromosome, position, ref, alt = match.groups()
+    position = int(position)
 
     if position < 0:
         raise ValueError(f"Position ({position}) cannot be negative")
@@ -86,6 +159,11 @@ def parse_variant_string(variant_str: str) -> Tuple[str, int, str, str]:
     return chromosome, position, ref, alt
 
 
+def is_variant_string(variant_str: str) -> bool:
+    """Check the chr:posREF>ALT format without raising; a match always parses with parse_variant_string."""
+    return _VARIANT_RE.match(variant_str.strip().upper()) is not None
+
+
 def validate_variant_in_interval(chromosome: str, position: int, interval_chr: str,
                                 interval_start: int, interval_end: int) -> None:
     """
@@ -104,17 +182,21 @@ def validate_variant_in_interval(chromosome: str, position: int, interval_chr: s
         ValueError: If variant is not within interval
     """
     # Case-insensitive chromosome comparison (fix from step 4 execution)
-    if chromosome.lower() != interval_chr.lower():
+    if normalize_chromosome(chromosome) != normalize_chromosome(interval_chr):
         raise ValueError(f"Variant chromosome ({chromosome}) must match interval chromosome ({interval_chr})")
 
     if not (interval_start <= position <= interval_end):
         raise ValueError(f"Variant position ({position}) must be within interval ({interval_start}-{interval_end})")
 
 
+@lru_cache(maxsize=256)
 def normalize_chromosome(chromosome: str) -> str:
     """
     Normalize chromosome name for consistent comparison.
 
+    Cached, since a batch compares the same few chromosome names (e.g. one
+    interval's) over and over.
+
     Args:
         chromosome: Chromosome name (e.g., "chr1", "CHR1", "1")
 
@@ -6,7 +6,29 @@ Common helper functions extracted from use case scripts.
 
 import os
 import sys
-from typing import Dict, Any, Optional, List
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Sequence, Set, Tuple, Union
+
+# Sequences at least this long are validated with the numba kernel (if installed)
+NUMBA_MIN_LENGTH = 1 << 20
+
+# Deleting these (valid bases in either case) leaves only invalid bytes; a
+# deletion-only translate is several times faster than one that also maps
+# lower case to upper case
+_DNA_BASES = b'ATGCNatgcn'
+
+# Output types accepted by validate_output_types
+_VALID_OUTPUT_TYPES = frozenset({'atac', 'cage', 'dnase', 'histone_marks', 'gene_expression'})
+
+# Key layout of handle_error responses; copying it reuses the built hash table
+_ERROR_TEMPLATE = {"success": False, "error": None, "type": None, "script": None}
+
+# Deleting these leaves only the G/C bases (any case) of a sequence
+_NON_GC = bytes(b for b in range(256) if b not in b'GCgc')
 
 
 def get_api_key(provided_key: Optional[str] = None) -> str:
@@ -25,16 +47,14 @@ def get_api_key(provided_key: Optional[str] = None) -> str:
         ValueError: If no API key is available and not in mock mode
     """
     # Check if using mock mode first
-    use_mock = os.getenv('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
-
-    if use_mock:
+    if check_mock_mode():
         return "mock_key"  # Dummy key for mock mode
 
     if provided_key:
         return provided_key
 
     # Try to get from environment
-    api_key = os.getenv('ALPHAGENOME_API_KEY')
+    api_key = _environment()['ALPHAGENOME_API_KEY']
     if api_key:
         return api_key
 
@@ -54,12 +74,11 @@ def handle_error(error: Exception, script_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with error information
     """
-    return {
-        "success": False,
-        "error": str(error),
-        "type": type(error).__name__,
-        "script": script_name
-    }
+    response = _ERROR_TEMPLATE.copy()
+    response["error"] = str(error)
+    response["type"] = type(error).__name__
+    response["script"] = script_name
+    return response
 
 
 def add_metadata(result: Dict[str, Any], script_name: str, **kwargs) -> Dict[str, Any]:
@@ -76,37 +95,93 @@ def add_metadata(result: Dict[str, Any], script_name: str, **kwargs) -> Dict[str
     Returns:
         Result dictionary with metadata added
     """
-    if 'metadata' not in result:
-        result['metadata'] = {}
-
-    result['metadata'].update({
-        'script': script_name,
-        **kwargs
-    })
+    metadata = result.setdefault('metadata', {})
+    metadata['script'] = script_name
+    metadata.update(kwargs)
 
     return result
 
 
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+
+def current_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string, at one second resolution."""
+    # Formatted once per second however many results are produced within it
+    return _iso_timestamp(int(time.time()))
+
+
+@dataclass(slots=True)
+class ExecMetadata:
+    """
+    Script execution metadata merged into a result's metadata.
+
+    Built once per run_* call and merged with
+    result['metadata'] |= meta.to_dict().
+    """
+    script_name: str
+    pretty_output: bool = False
+    timestamp: str = ""
+
+    def __post_init__(self):
+        if not self.timestamp:
+            self.timestamp = current_timestamp()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metadata as a fresh dictionary."""
+        return {
+            'script': self.script_name,
+            'timestamp': self.timestamp,
+            'pretty_output': self.pretty_output,
+        }
+
+
+@lru_cache(maxsize=1)
 def check_mock_mode() -> bool:
     """
     Check if we're running in mock mode.
 
+    ALPHAGENOME_USE_MOCK is read once per process; call refresh_env_cache
+    after changing it.
+
     Returns:
         True if mock mode is enabled
     """
-    return os.getenv('ALPHAGENOME_USE_MOCK', '').lower() == 'true'
+    return _environment()['ALPHAGENOME_USE_MOCK'].lower() == 'true'
+
+
+@lru_cache(maxsize=1)
+def _environment() -> Dict[str, Optional[str]]:
+    """Snapshot of the environment variables read by these utilities, taken on first use."""
+    return {
+        'ALPHAGENOME_USE_MOCK': os.getenv('ALPHAGENOME_USE_MOCK', ''),
+        'ALPHAGENOME_API_KEY': os.getenv('ALPHAGENOME_API_KEY'),
+    }
 
 
+def refresh_env_cache() -> None:
+    """Re-read the cached environment settings (ALPHAGENOME_USE_MOCK, ALPHAGENOME_API_KEY) on next use."""
+    _environment.cache_clear()
+    check_mock_mode.cache_clear()
+
+
+@lru_cache(maxsize=1)
 def get_script_dir() -> str:
     """
     Get the directory containing the current script.
 
+    Resolved once per process (against the working directory at the first
+    call), since neither sys.argv[0] nor the answer changes afterwards.
+
     Returns:
         Absolute path to script directory
     """
     return os.path.dirname(os.path.abspath(sys.argv[0]))
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> str:
     """
     Get the project root directory.
@@ -115,12 +190,18 @@ def get_project_root() -> str:
         Absolute path to project root
     """
     script_dir = get_script_dir()
-    if script_dir.endswith('/scripts'):
+    # basename rather than endswith('/scripts'), which never matches on Windows
+    if os.path.basename(script_dir) == 'scripts':
         return os.path.dirname(script_dir)
     else:
         return script_dir
 
 
+def as_path(path: Union[str, os.PathLike]) -> Path:
+    """Return path as a Path, without constructing a new one if it already is."""
+    return path if isinstance(path, Path) else Path(path)
+
+
 def validate_output_types(output_types: Optional[List[str]]) -> Optional[List[str]]:
     """
     Validate and normalize output types.
@@ -137,22 +218,128 @@ def validate_output_types(output_types: Optional[List[str]]) -> Optional[List[st
     if output_types is None:
         return None
 
-    valid_output_types = {'atac', 'cage', 'dnase', 'histone_marks', 'gene_expression'}
-    normalized_types = [ot.lower() for ot in output_types]
+    # A fresh list per call, so callers may modify it without touching the cache
+    return list(_validate_output_types_cached(tuple(output_types)))
+
 
-    invalid_types = set(normalized_types) - valid_output_types
-    if invalid_types:
-        raise ValueError(f"Invalid output types: {invalid_types}. Valid types: {valid_output_types}")
+@lru_cache(maxsize=128)
+def _validate_output_types_cached(output_types: tuple) -> tuple:
+    """Validate and normalize a tuple of output types; repeated combinations are answered from the cache."""
+    # Lower-case and check in one pass; the (cold) error path collects all
+    # invalid types for the message
+    normalized_types = []
+    for ot in output_types:
+        normalized = ot.lower()
+        if normalized not in _VALID_OUTPUT_TYPES:
+            invalid_types = {t.lower() for t in output_types} - _VALID_OUTPUT_TYPES
+            raise ValueError(f"Invalid output types: {invalid_types}. Valid types: {set(_VALID_OUTPUT_TYPES)}")
+        normalized_types.append(normalized)
 
-    return normalized_types
+    return tuple(normalized_types)
 
 
-def calculate_gc_content(sequence: str) -> float:
+def invalid_dna_characters(sequence: Union[str, bytes]) -> Set[str]:
+    """
+    Return the characters of a DNA sequence that are not A, T, G, C or N.
+
+    The check is one deletion-only bytes.translate pass over the
+    ASCII-encoded sequence (faster than a NumPy lookup table, which has to
+    materialize a gathered copy) rather than an upper-cased copy turned into
+    a set; sequences of NUMBA_MIN_LENGTH and up are scanned by
+    find_invalid_dna's compiled numba loop instead when numba is installed.
+    The set of offending (upper-cased) characters is only built for invalid
+    sequences.
+
+    Args:
+        sequence: DNA sequence string, or its ASCII bytes
+
+    Returns:
+        Set of invalid characters, empty if the sequence is valid
+    """
+    raw = sequence if isinstance(sequence, bytes) else sequence.encode('ascii', 'replace')
+    if len(raw) >= NUMBA_MIN_LENGTH and _dna_kernel() is not None:
+        # No translated copy of a genome-scale sequence, and the scan stops early
+        if find_invalid_dna(raw) is None:
+            return set()
+    elif not raw.translate(None, _DNA_BASES):
+        return set()
+
+    text = sequence.decode('latin-1') if isinstance(sequence, bytes) else sequence
+    return set(text.upper()) - set('ATGCN')
+
+
+def find_invalid_dna(sequence: Union[str, bytes]) -> Optional[int]:
+    """
+    Find the first character of a DNA sequence that is not A, T, G, C or N (any case).
+
+    Long sequences (NUMBA_MIN_LENGTH and up) are scanned with a compiled
+    numba loop when numba is installed, which stops at the first invalid
+    byte without allocating temporaries; otherwise the bytes are checked
+    against a lookup table in one vectorized NumPy pass.
+
+    Args:
+        sequence: DNA sequence string, or its ASCII bytes (scanned without a copy)
+
+    Returns:
+        Index of the first invalid character, or None if the sequence is valid
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        valid = b'ATGCNatgcn' if isinstance(sequence, bytes) else 'ATGCNatgcn'
+        for i, c in enumerate(sequence):
+            if c not in valid:
+                return i
+        return None
+
+    # 'replace' keeps one byte per character, so byte offsets are string indices
+    raw = sequence if isinstance(sequence, bytes) else sequence.encode('ascii', 'replace')
+    data = np.frombuffer(raw, dtype=np.uint8)
+
+    kernel = _dna_kernel() if len(data) >= NUMBA_MIN_LENGTH else None
+    if kernel is not None:
+        index = kernel(data)
+        return None if index < 0 else int(index)
+
+    valid = np.zeros(256, dtype=bool)
+    valid[np.frombuffer(b'ATGCNatgcn', dtype=np.uint8)] = True
+    invalid = ~valid[data]
+    if not invalid.any():
+        return None
+    return int(np.argmax(invalid))
+
+
+def _validate_dna_nb(buf) -> int:
+    """
+    Return the index of the first byte in buf that is not A, C, G, T or N (any case), or -1.
+
+    Written for numba's nopython mode, see _dna_kernel.
+    """
+    for i in range(buf.shape[0]):
+        # Setting bit 5 folds upper case onto lower case
+        c = buf[i] | 32
+        if not (c == 97 or c == 99 or c == 103 or c == 116 or c == 110):
+            return i
+    return -1
+
+
+@lru_cache(maxsize=1)
+def _dna_kernel():
+    """Compile _validate_dna_nb with numba on first use; None if numba is not installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+    return numba.njit(cache=True, boundscheck=False)(_validate_dna_nb)
+
+
+def calculate_gc_content(sequence: Union[str, bytes]) -> float:
     """
     Calculate GC content of DNA sequence.
 
     Args:
-        sequence: DNA sequence string
+        sequence: DNA sequence as a string or ASCII bytes (bytes are counted
+            in place, without encoding a copy)
 
     Returns:
         GC content as percentage (0-100)
@@ -160,10 +347,85 @@ def calculate_gc_content(sequence: str) -> float:
     if not sequence:
         return 0.0
 
-    gc_count = sequence.upper().count('G') + sequence.upper().count('C')
+    if isinstance(sequence, str):
+        sequence = sequence.encode('ascii', 'replace')
+    # One translate pass keeps just the G/C bytes, without case-folded copies
+    # or separate count scans per base
+    gc_count = len(sequence.translate(None, _NON_GC))
     return (gc_count / len(sequence)) * 100.0
 
 
+def calculate_gc_content_batch(sequences: Sequence[Union[str, bytes]]) -> Any:
+    """
+    Calculate the GC content of many DNA sequences at once.
+
+    With NumPy all sequences are joined into one buffer, G/C bytes are
+    flagged through a lookup table and summed per sequence with one
+    add.reduceat, so there is no per-sequence Python work besides encoding
+    str input.
+
+    Args:
+        sequences: DNA sequences as strings or ASCII bytes
+
+    Returns:
+        GC content per sequence as percentage (0-100, 0.0 for empty
+        sequences); a float64 array, or a list of floats if NumPy is not
+        installed
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return [calculate_gc_content(sequence) for sequence in sequences]
+
+    encoded = [s.encode('ascii', 'replace') if isinstance(s, str) else s for s in sequences]
+    lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+    starts = np.cumsum(lengths) - lengths
+
+    is_gc = np.zeros(256, dtype=np.uint8)
+    is_gc[list(b'GCgc')] = 1
+    flags = is_gc[np.frombuffer(b''.join(encoded), dtype=np.uint8)]
+
+    # reduceat returns the element at the offset for an empty segment, so
+    # empty sequences are left out and keep a count of 0
+    counts = np.zeros(len(encoded), dtype=np.int64)
+    non_empty = lengths > 0
+    if non_empty.any():
+        counts[non_empty] = np.add.reduceat(flags, starts[non_empty], dtype=np.int64)
+
+    return np.divide(counts * 100.0, lengths, out=np.zeros(len(lengths)), where=non_empty)
+
+
+def length_statistics(lengths) -> Dict[str, Any]:
+    """
+    Summarize sequence lengths as min, max and mean (rounded to 0.1).
+
+    With NumPy the lengths (a list or an int64 array, e.g. from
+    file_io.load_sequences_with_lengths) are reduced in C instead of in
+    Python loops.
+
+    Args:
+        lengths: Non-empty sequence of lengths
+
+    Returns:
+        Dictionary with min_length, max_length and mean_length
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return {
+            "min_length": min(lengths),
+            "max_length": max(lengths),
+            "mean_length": round(sum(lengths) / len(lengths), 1)
+        }
+
+    lengths = np.asarray(lengths, dtype=np.int64)
+    return {
+        "min_length": int(lengths.min()),
+        "max_length": int(lengths.max()),
+        "mean_length": round(float(lengths.mean()), 1)
+    }
+
+
 def create_sequence_metadata(sequence: str, organism: str = "human",
                            output_types: Optional[List[str]] = None) -> Dict[str, Any]:
     """
@@ -182,4 +444,41 @@ def create_sequence_metadata(sequence: str, organism: str = "human",
         'gc_content': round(calculate_gc_content(sequence), 2),
         'organism': organism,
         'output_types_requested': output_types or 'all'
-    }
\ No newline at end of file
+    }
+
+
+def create_variant_metadata(variant: str, interval: str,
+                            parsed_variant: Tuple[str, int, str, str],
+                            parsed_interval: Tuple[str, int, int],
+                            organism: str = "human") -> Dict[str, Any]:
+    """
+    Create the metadata shared by the variant analysis scripts.
+
+    Built from a single constant-key dict literal, which CPython creates
+    presized in one step.
+
+    Args:
+        variant: Variant string as given
+        interval: Interval string as given
+        parsed_variant: (chromosome, position, ref, alt) from parse_variant_string
+        parsed_interval: (chromosome, start, end) from parse_interval_string
+        organism: Target organism
+
+    Returns:
+        Metadata dictionary
+    """
+    var_chromosome, var_position, ref, alt = parsed_variant
+    interval_chromosome, interval_start, interval_end = parsed_interval
+    return {
+        "variant": variant,
+        "variant_chromosome": var_chromosome,
+        "variant_position": var_position,
+        "reference_allele": ref,
+        "alternate_allele": alt,
+        "interval": interval,
+        "interval_chromosome": interval_chromosome,
+        "interval_start": interval_start,
+        "interval_end": interval_end,
+        "interval_length": interval_end - interval_start,
+        "organism": organism
+    }
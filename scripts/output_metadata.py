@@ -23,11 +23,14 @@ from pathlib import Path
 from typing import Union, Optional, Dict, Any
 
 # Add lib directory to path for our simplified modules
-sys.path.insert(0, str(Path(__file__).parent / "lib"))
+_LIB_DIR = str(Path(__file__).parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
-from alphagenome_client import AlphaGenomeClient
-from file_io import write_output
-from utils import get_api_key, handle_error, add_metadata
+from utils import get_api_key, handle_error
+
+# Heavier modules (client, file I/O) are imported on first use inside run_*,
+# so --help and argument errors return without loading them
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -44,8 +47,7 @@ def run_output_metadata(
     output_file: Optional[Union[str, Path]] = None,
     organism: str = "human",
     api_key: Optional[str] = None,
-    pretty: bool = False,
-    **kwargs
+    pretty: bool = False
 ) -> Dict[str, Any]:
     """
     Main function for retrieving output metadata.
@@ -55,7 +57,6 @@ def run_output_metadata(
         organism: Target organism (default: human)
         api_key: AlphaGenome API key (optional, reads from env)
         pretty: Pretty print JSON output
-        **kwargs: Override specific config parameters
 
     Returns:
         Dict containing:
@@ -72,11 +73,14 @@ def run_output_metadata(
     script_name = "output_metadata.py"
 
     try:
+        from alphagenome_client import get_cached_client
+        from file_io import ensure_parent, write_output
+
         # Get API key
         client_api_key = get_api_key(api_key)
 
-        # Initialize client
-        client = AlphaGenomeClient(client_api_key)
+        # Get the shared client for this key
+        client = get_cached_client(client_api_key)
 
         # Get output metadata
         metadata_result = client.get_output_metadata(organism=organism)
@@ -97,8 +101,9 @@ def run_output_metadata(
         }
 
         # Add script metadata
-        add_metadata(result, script_name,
-                    pretty_output=pretty)
+        metadata = result["metadata"]
+        metadata["script"] = script_name
+        metadata["pretty_output"] = pretty
 
         # Add summary information to metadata
         if 'available_outputs' in metadata_result:
@@ -109,8 +114,7 @@ def run_output_metadata(
 
         # Save output if requested
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path = ensure_parent(output_file)
             write_output(result, output_path, pretty)
             result["output_file"] = str(output_path)
 
@@ -159,6 +163,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # Imported here so that --help and argument errors do not load it
+    from file_io import get_writer
+    write = get_writer(args.pretty)
+
     try:
         # Get metadata
         result = run_output_metadata(
@@ -170,7 +178,7 @@ Examples:
 
         # Output results if not saved to file
         if not args.output:
-            write_output(result, pretty=args.pretty)
+            write(result)
         else:
             print(f"✅ Success: {result.get('output_file', 'Completed')}")
 
@@ -185,7 +193,7 @@ Examples:
         sys.exit(1)
     except Exception as e:
         error_result = handle_error(e, "output_metadata.py")
-        write_output(error_result, pretty=args.pretty)
+        write(error_result)
         sys.exit(1)
 
 
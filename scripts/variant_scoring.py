@@ -23,12 +23,15 @@ from pathlib import Path
 from typing import Union, Optional, Dict, Any
 
 # Add lib directory to path for our simplified modules
-sys.path.insert(0, str(Path(__file__).parent / "lib"))
+_LIB_DIR = str(Path(__file__).parent / "lib")
+if _LIB_DIR not in sys.path:
+    sys.path.insert(0, _LIB_DIR)
 
-from alphagenome_client import AlphaGenomeClient
-from file_io import write_output
 from parsers import parse_interval_string, parse_variant_string, validate_variant_in_interval
-from utils import get_api_key, handle_error, add_metadata
+from utils import get_api_key, handle_error, create_variant_metadata
+
+# Heavier modules (client, file I/O) are imported on first use inside run_*,
+# so --help and argument errors return without loading them
 
 # ==============================================================================
 # Configuration (extracted from use case)
@@ -47,8 +50,7 @@ def run_variant_scoring(
     output_file: Optional[Union[str, Path]] = None,
     organism: str = "human",
     api_key: Optional[str] = None,
-    pretty: bool = False,
-    **kwargs
+    pretty: bool = False
 ) -> Dict[str, Any]:
     """
     Main function for variant scoring using multiple algorithms.
@@ -60,7 +62,6 @@ def run_variant_scoring(
         organism: Target organism (default: human)
         api_key: AlphaGenome API key (optional, reads from env)
         pretty: Pretty print JSON output
-        **kwargs: Override specific config parameters
 
     Returns:
         Dict containing:
@@ -81,6 +82,9 @@ def run_variant_scoring(
     script_name = "variant_scoring.py"
 
     try:
+        from alphagenome_client import get_cached_client
+        from file_io import ensure_parent, write_output
+
         # Parse and validate variant
         var_chromosome, var_position, ref, alt = parse_variant_string(variant)
 
@@ -96,8 +100,8 @@ def run_variant_scoring(
         # Get API key
         client_api_key = get_api_key(api_key)
 
-        # Initialize client
-        client = AlphaGenomeClient(client_api_key)
+        # Get the shared client for this key
+        client = get_cached_client(client_api_key)
 
         # Make scoring request
         scoring_result = client.score_variant(
@@ -118,31 +122,25 @@ def run_variant_scoring(
         result = {
             "success": True,
             "result": scoring_result,
-            "metadata": {
-                "variant": variant,
-                "variant_chromosome": var_chromosome,
-                "variant_position": var_position,
-                "reference_allele": ref,
-                "alternate_allele": alt,
-                "interval": interval,
-                "interval_chromosome": interval_chromosome,
-                "interval_start": interval_start,
-                "interval_end": interval_end,
-                "interval_length": interval_end - interval_start,
-                "organism": organism,
-                "analysis_type": "variant_scoring"
-            },
+            "metadata": create_variant_metadata(
+                variant, interval,
+                (var_chromosome, var_position, ref, alt),
+                (interval_chromosome, interval_start, interval_end),
+                organism
+            ),
             "output_file": None
         }
 
+        result["metadata"]["analysis_type"] = "variant_scoring"
+
         # Add script metadata
-        add_metadata(result, script_name,
-                    pretty_output=pretty)
+        metadata = result["metadata"]
+        metadata["script"] = script_name
+        metadata["pretty_output"] = pretty
 
         # Save output if requested
         if output_file:
-            output_path = Path(output_file)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path = ensure_parent(output_file)
             write_output(result, output_path, pretty)
             result["output_file"] = str(output_path)
 
@@ -194,6 +192,10 @@ Examples:
 
     args = parser.parse_args()
 
+    # Imported here so that --help and argument errors do not load it
+    from file_io import get_writer
+    write = get_writer(args.pretty)
+
     try:
         # Run scoring
         result = run_variant_scoring(
@@ -207,7 +209,7 @@ Examples:
 
         # Output results if not saved to file
         if not args.output:
-            write_output(result, pretty=args.pretty)
+            write(result)
         else:
             print(f"✅ Success: {result.get('output_file', 'Completed')}")
 
@@ -222,7 +224,7 @@ Examples:
         sys.exit(1)
     except Exception as e:
         error_result = handle_error(e, "variant_scoring.py")
-        write_output(error_result, pretty=args.pretty)
+        write(error_result)
         sys.exit(1)
 
 
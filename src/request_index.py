@@ -0,0 +1,40 @@
+"""
+Index of the requests of submitted variant jobs.
+
+A request that repeats one whose job is still queued or running can join
+that job instead of running the model again. RequestIndex remembers the job
+submitted for each request, bounded to the most recent max_size requests so
+that a long-running server does not grow it without limit.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class RequestIndex:
+    """Job ids of the most recently submitted requests, oldest evicted first."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        # request key -> job_id, in submission order
+        self._jobs: "OrderedDict[Hashable, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, request: Hashable, job_id: str) -> None:
+        """Record the job submitted for request, evicting the oldest request if full."""
+        with self._lock:
+            self._jobs[request] = job_id
+            self._jobs.move_to_end(request)
+            while len(self._jobs) > self.max_size:
+                self._jobs.popitem(last=False)
+
+    def find(self, request: Hashable) -> Optional[str]:
+        """Return the job submitted for exactly this request, or None."""
+        with self._lock:
+            return self._jobs.get(request)
+
+    def forget(self, request: Hashable) -> None:
+        """Drop a request whose job can no longer be reused (e.g. it finished or failed)."""
+        with self._lock:
+            self._jobs.pop(request, None)
@@ -6,25 +6,73 @@ Provides both synchronous and asynchronous (submit) APIs for genomic analysis to
 
 from fastmcp import FastMCP
 from pathlib import Path
+from functools import lru_cache
 from typing import Optional, List, Union
+import atexit
+import copy
+import shutil
 import sys
 import os
+import tempfile
+import time
 
 # Setup paths
 SCRIPT_DIR = Path(__file__).parent.resolve()
 MCP_ROOT = SCRIPT_DIR.parent
 SCRIPTS_DIR = MCP_ROOT / "scripts"
-sys.path.insert(0, str(SCRIPT_DIR))
-sys.path.insert(0, str(SCRIPTS_DIR))
+
+# Scripts run by the submit tools
+_SCRIPT_DNA_SEQ = str(SCRIPTS_DIR / "dna_sequence_prediction.py")
+_SCRIPT_VARIANT_EFFECT = str(SCRIPTS_DIR / "variant_effect_prediction.py")
+_SCRIPT_VARIANT_SCORING = str(SCRIPTS_DIR / "variant_scoring.py")
+_SCRIPT_BATCH_SEQ = str(SCRIPTS_DIR / "batch_sequence_analysis.py")
+_ANALYSIS_SCRIPTS = {"effects": _SCRIPT_VARIANT_EFFECT, "scoring": _SCRIPT_VARIANT_SCORING}
+
+for _path in (str(SCRIPT_DIR), str(SCRIPTS_DIR)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
 
 # Set mock mode for all operations
 os.environ["ALPHAGENOME_USE_MOCK"] = "true"
 
 from jobs.manager import job_manager
+from request_index import RequestIndex
+
+# Runners of the synchronous tools, bound once here instead of imported on
+# every call (the scripts defer their heavier imports to the first run)
+from dna_sequence_prediction import run_dna_sequence_prediction
+from genomic_interval_analysis import run_genomic_interval_analysis
+from variant_effect_prediction import run_variant_effect_prediction
+from variant_scoring import run_variant_scoring
+from output_metadata import run_output_metadata
+
+from lib.parsers import (is_interval_string, is_variant_string, parse_interval_string,
+                         parse_variant_string, validate_variant_in_interval)
+from lib.file_io import validate_dna_sequence
+from lib.utils import invalid_dna_characters
 
 # Create MCP server
 mcp = FastMCP("AlphaGenome-MCP-Server")
 
+# Responses of the (near-)static tools, reused across calls
+_OUTPUT_METADATA_CACHE_SIZE = 8
+_output_metadata_cache = {}
+_EXAMPLE_DATA_TTL = 60.0  # seconds
+_example_data_cache = None  # (time.monotonic() of the scan, response)
+
+# Requests of submitted variant jobs, and the job statuses in which a
+# repeat of the request joins the job instead of submitting a new one
+_variant_requests = RequestIndex(max_size=1024)
+_REUSABLE_JOB_STATUSES = frozenset(("submitted", "pending", "queued", "running"))
+
+# Longer sequences are handed to jobs as a file rather than as an argument,
+# which stays well below the 128 KiB limit of a single command line argument.
+# The file of a job is deleted once a status check sees the job finished
+_SEQUENCE_SPILL_THRESHOLD = 65536
+_spill_dir = None
+_spilled_files = {}  # job_id -> path of its sequence file
+_FINISHED_JOB_STATUSES = frozenset(("completed", "failed", "cancelled", "error"))
+
 # ==============================================================================
 # Job Management Tools (for async operations)
 # ==============================================================================
@@ -40,7 +88,34 @@ def get_job_status(job_id: str) -> dict:
     Returns:
         Dictionary with job status, timestamps, and any errors
     """
-    return job_manager.get_job_status(job_id)
+    response = job_manager.get_job_status(job_id)
+    _release_spilled_file(job_id, response.get("status"))
+    return response
+
+@mcp.tool()
+def get_batch_status(job_ids: List[str]) -> dict:
+    """
+    Get the status of several jobs at once, e.g. those of submit_batch_variant_analysis.
+
+    Args:
+        job_ids: The job IDs to check
+
+    Returns:
+        Dictionary with each job's status and the number of jobs per status
+    """
+    jobs = {job_id: job_manager.get_job_status(job_id) for job_id in job_ids}
+    counts = {}
+    for job_id, job in jobs.items():
+        job_status = job.get("status", "unknown")
+        _release_spilled_file(job_id, job_status)
+        counts[job_status] = counts.get(job_status, 0) + 1
+
+    return {
+        "status": "success",
+        "total": len(job_ids),
+        "counts": counts,
+        "jobs": jobs
+    }
 
 @mcp.tool()
 def get_job_result(job_id: str) -> dict:
@@ -53,7 +128,9 @@ def get_job_result(job_id: str) -> dict:
     Returns:
         Dictionary with the job results or error if not completed
     """
-    return job_manager.get_job_result(job_id)
+    response = job_manager.get_job_result(job_id)
+    _release_spilled_file(job_id)
+    return response
 
 @mcp.tool()
 def get_job_log(job_id: str, tail: int = 50) -> dict:
@@ -80,7 +157,9 @@ def cancel_job(job_id: str) -> dict:
     Returns:
         Success or error message
     """
-    return job_manager.cancel_job(job_id)
+    response = job_manager.cancel_job(job_id)
+    _release_spilled_file(job_id)
+    return response
 
 @mcp.tool()
 def list_jobs(status: Optional[str] = None) -> dict:
@@ -127,17 +206,17 @@ def predict_dna_sequence(
         predict_dna_sequence(sequence="ATGCGATCGTAGCTAGC", organism="human")
     """
     try:
-        from dna_sequence_prediction import run_dna_sequence_prediction
-
         result = run_dna_sequence_prediction(
-            sequence=sequence,
+            input_sequence=sequence,
             input_file=input_file,
             organism=organism,
             output_types=output_types,
             output_file=output_file,
             pretty=True
         )
-        return {"status": "success", **result}
+        # The runners return a fresh dict, so it is marked in place instead of copied
+        result["status"] = "success"
+        return result
     except FileNotFoundError as e:
         return {"status": "error", "error": f"File not found: {e}"}
     except ValueError as e:
@@ -170,8 +249,6 @@ def analyze_genomic_interval(
         analyze_genomic_interval(interval="chr1:1000000-1002048", organism="human")
     """
     try:
-        from genomic_interval_analysis import run_genomic_interval_analysis
-
         result = run_genomic_interval_analysis(
             interval=interval,
             organism=organism,
@@ -179,7 +256,8 @@ def analyze_genomic_interval(
             output_file=output_file,
             pretty=True
         )
-        return {"status": "success", **result}
+        result["status"] = "success"
+        return result
     except ValueError as e:
         return {"status": "error", "error": f"Invalid interval format: {e}"}
     except Exception as e:
@@ -213,8 +291,6 @@ def predict_variant_effects(
         predict_variant_effects(variant="chr1:1001000A>G", interval="chr1:1000000-1002048")
     """
     try:
-        from variant_effect_prediction import run_variant_effect_prediction
-
         result = run_variant_effect_prediction(
             variant=variant,
             interval=interval,
@@ -223,7 +299,8 @@ def predict_variant_effects(
             output_file=output_file,
             pretty=True
         )
-        return {"status": "success", **result}
+        result["status"] = "success"
+        return result
     except ValueError as e:
         return {"status": "error", "error": f"Invalid variant or interval format: {e}"}
     except Exception as e:
@@ -256,8 +333,6 @@ def score_variant_pathogenicity(
         score_variant_pathogenicity(variant="chr1:1001000A>G", interval="chr1:1000000-1002048")
     """
     try:
-        from variant_scoring import run_variant_scoring
-
         result = run_variant_scoring(
             variant=variant,
             interval=interval,
@@ -265,7 +340,8 @@ def score_variant_pathogenicity(
             output_file=output_file,
             pretty=True
         )
-        return {"status": "success", **result}
+        result["status"] = "success"
+        return result
     except ValueError as e:
         return {"status": "error", "error": f"Invalid variant or interval format: {e}"}
     except Exception as e:
@@ -279,7 +355,8 @@ def get_output_metadata(
     """
     Get metadata about available outputs and organisms (fast operation).
 
-    Fast operation suitable for metadata queries (~100ms).
+    Fast operation suitable for metadata queries (~100ms). Successful
+    responses are cached per organism unless output_file is given.
 
     Args:
         organism: Target organism to get specific metadata for (optional)
@@ -291,22 +368,115 @@ def get_output_metadata(
     Example:
         get_output_metadata(organism="human")
     """
-    try:
-        from output_metadata import run_output_metadata
+    if output_file is None:
+        cached = _output_metadata_cache.get(organism)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
+    try:
         result = run_output_metadata(
             organism=organism,
             output_file=output_file,
             pretty=True
         )
-        return {"status": "success", **result}
+        result["status"] = "success"
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
+    if output_file is None and result.get("success", False):
+        if len(_output_metadata_cache) >= _OUTPUT_METADATA_CACHE_SIZE:
+            # Evict the oldest entry
+            del _output_metadata_cache[next(iter(_output_metadata_cache))]
+        _output_metadata_cache[organism] = result
+        result = copy.deepcopy(result)
+    return result
+
 # ==============================================================================
 # Submit Tools (for long-running operations and batch processing)
 # ==============================================================================
 
+def _validate_or_error(
+    variant: Optional[str] = None,
+    interval: Optional[str] = None,
+    sequence: Optional[str] = None,
+    input_file: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Check job inputs with the cheap parsers before the job is submitted.
+
+    Returns None if the given inputs are valid, otherwise the error response,
+    so that malformed inputs are rejected at once instead of failing in a
+    background job after the model has been loaded.
+    """
+    try:
+        if sequence is not None:
+            validate_dna_sequence(sequence)
+        if input_file is not None and not (os.path.isfile(input_file) and os.access(input_file, os.R_OK)):
+            raise ValueError(f"input file not found or not readable: {input_file}")
+        if interval is not None:
+            parsed_interval = parse_interval_string(interval)
+        if variant is not None:
+            chromosome, position, _, _ = parse_variant_string(variant)
+            if interval is not None:
+                validate_variant_in_interval(chromosome, position, *parsed_interval)
+    except ValueError as e:
+        return {"status": "error", "error": f"Invalid input: {e}"}
+    return None
+
+def _spill_sequence(sequence: str) -> str:
+    """Write a sequence to a file in the server's temporary directory and return its path."""
+    global _spill_dir
+    if _spill_dir is None:
+        _spill_dir = tempfile.mkdtemp(prefix="alphagenome_mcp_")
+        atexit.register(shutil.rmtree, _spill_dir, ignore_errors=True)
+    fd, path = tempfile.mkstemp(suffix=".txt", prefix="sequence_", dir=_spill_dir)
+    with os.fdopen(fd, "w") as f:
+        f.write(sequence)
+        f.write("\n")
+    return path
+
+def _release_spilled_file(job_id: str, job_status: Optional[str] = None) -> None:
+    """Delete the spilled sequence file of a job once the job has finished (status looked up if not given)."""
+    if job_id not in _spilled_files:
+        return
+    if job_status is None:
+        job_status = job_manager.get_job_status(job_id).get("status")
+    if job_status in _FINISHED_JOB_STATUSES:
+        path = _spilled_files.pop(job_id, None)
+        if path is not None:
+            _remove_file(path)
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+def _submit_variant_job(script_path: str, args: dict, job_name: str, force: bool = False) -> dict:
+    """
+    Submit a variant job, or join the job of an identical request still in flight.
+
+    A repeat of a request whose job is still queued or running returns that
+    job instead of running the model again; jobs that finished, failed or are
+    unknown to the job manager are never reused, and force=True always submits
+    a new job. Responses carry "reused" to tell the two cases apart.
+    """
+    request = (script_path, args["variant"], args["interval"], args["organism"],
+               tuple(args.get("output_types") or ()), args["output_dir"])
+
+    if not force:
+        job_id = _variant_requests.find(request)
+        if job_id is not None:
+            if job_manager.get_job_status(job_id).get("status") in _REUSABLE_JOB_STATUSES:
+                return {"status": "submitted", "job_id": job_id, "reused": True}
+            _variant_requests.forget(request)
+
+    response = job_manager.submit_job(script_path=script_path, args=args, job_name=job_name)
+    if response.get("job_id") is not None:
+        _variant_requests.add(request, response["job_id"])
+        response["reused"] = False
+    return response
+
 @mcp.tool()
 def submit_dna_sequence_prediction(
     sequence: Optional[str] = None,
@@ -335,11 +505,25 @@ def submit_dna_sequence_prediction(
         - get_job_status(job_id) to check progress
         - get_job_result(job_id) to get results when completed
         - get_job_log(job_id) to see execution logs
+
+    Sequences longer than 64 KiB are passed to the job as a temporary file,
+    which is deleted once get_job_status, get_batch_status, get_job_result or
+    cancel_job sees the job finished, or otherwise when the server exits.
     """
-    script_path = str(SCRIPTS_DIR / "dna_sequence_prediction.py")
+    if sequence is None and input_file is None:
+        return {"status": "error", "error": "Invalid input: either sequence or input_file must be provided"}
+    error = _validate_or_error(sequence=sequence, input_file=input_file)
+    if error:
+        return error
 
-    return job_manager.submit_job(
-        script_path=script_path,
+    # Pass long sequences as input_file, which the script reads the same way
+    spilled_file = None
+    if sequence is not None and input_file is None and len(sequence) > _SEQUENCE_SPILL_THRESHOLD:
+        input_file = spilled_file = _spill_sequence(sequence)
+        sequence = None
+
+    response = job_manager.submit_job(
+        script_path=_SCRIPT_DNA_SEQ,
         args={
             "sequence": sequence,
             "input_file": input_file,
@@ -349,6 +533,12 @@ def submit_dna_sequence_prediction(
         },
         job_name=job_name or "dna_sequence_prediction"
     )
+    if spilled_file is not None:
+        if response.get("job_id") is not None:
+            _spilled_files[response["job_id"]] = spilled_file
+        else:
+            _remove_file(spilled_file)
+    return response
 
 @mcp.tool()
 def submit_variant_effect_prediction(
@@ -357,7 +547,8 @@ def submit_variant_effect_prediction(
     organism: str = "human",
     output_types: Optional[List[str]] = None,
     output_dir: Optional[str] = None,
-    job_name: Optional[str] = None
+    job_name: Optional[str] = None,
+    force: bool = False
 ) -> dict:
     """
     Submit variant effect prediction for background processing.
@@ -372,14 +563,17 @@ def submit_variant_effect_prediction(
         output_types: List of output types (atac, cage, dnase, histone_marks, gene_expression)
         output_dir: Directory to save outputs
         job_name: Optional name for the job
+        force: Submit a new job even if an identical request is still queued or running
 
     Returns:
         Dictionary with job_id for tracking the prediction job
     """
-    script_path = str(SCRIPTS_DIR / "variant_effect_prediction.py")
+    error = _validate_or_error(variant=variant, interval=interval)
+    if error:
+        return error
 
-    return job_manager.submit_job(
-        script_path=script_path,
+    return _submit_variant_job(
+        script_path=_SCRIPT_VARIANT_EFFECT,
         args={
             "variant": variant,
             "interval": interval,
@@ -387,7 +581,8 @@ def submit_variant_effect_prediction(
             "output_types": output_types,
             "output_dir": output_dir
         },
-        job_name=job_name or "variant_effect_prediction"
+        job_name=job_name or "variant_effect_prediction",
+        force=force
     )
 
 @mcp.tool()
@@ -396,7 +591,8 @@ def submit_variant_scoring(
     interval: str,
     organism: str = "human",
     output_dir: Optional[str] = None,
-    job_name: Optional[str] = None
+    job_name: Optional[str] = None,
+    force: bool = False
 ) -> dict:
     """
     Submit variant pathogenicity scoring for background processing.
@@ -410,21 +606,25 @@ def submit_variant_scoring(
         organism: Target organism (default: human)
         output_dir: Directory to save outputs
         job_name: Optional name for the job
+        force: Submit a new job even if an identical request is still queued or running
 
     Returns:
         Dictionary with job_id for tracking the scoring job
     """
-    script_path = str(SCRIPTS_DIR / "variant_scoring.py")
+    error = _validate_or_error(variant=variant, interval=interval)
+    if error:
+        return error
 
-    return job_manager.submit_job(
-        script_path=script_path,
+    return _submit_variant_job(
+        script_path=_SCRIPT_VARIANT_SCORING,
         args={
             "variant": variant,
             "interval": interval,
             "organism": organism,
             "output_dir": output_dir
         },
-        job_name=job_name or "variant_scoring"
+        job_name=job_name or "variant_scoring",
+        force=force
     )
 
 @mcp.tool()
@@ -451,10 +651,12 @@ def submit_batch_sequence_analysis(
     Returns:
         Dictionary with job_id for tracking the batch job
     """
-    script_path = str(SCRIPTS_DIR / "batch_sequence_analysis.py")
+    error = _validate_or_error(input_file=input_file)
+    if error:
+        return error
 
     return job_manager.submit_job(
-        script_path=script_path,
+        script_path=_SCRIPT_BATCH_SEQ,
         args={
             "input_file": input_file,
             "organism": organism,
@@ -476,12 +678,14 @@ def submit_batch_variant_analysis(
     organism: str = "human",
     output_types: Optional[List[str]] = None,
     output_dir: Optional[str] = None,
-    job_name: Optional[str] = None
+    job_name: Optional[str] = None,
+    force: bool = False
 ) -> dict:
     """
     Submit batch variant analysis for multiple variants.
 
-    Processes multiple variants in a single job. Suitable for:
+    Submits one job per variant, so that the job manager runs independent
+    variants in parallel. Suitable for:
     - Processing many variants at once
     - Large-scale variant analysis
     - Parallel processing of independent variants
@@ -493,10 +697,12 @@ def submit_batch_variant_analysis(
         organism: Target organism (default: human)
         output_types: List of output types (for effects analysis)
         output_dir: Directory to save all outputs
-        job_name: Optional name for the batch job
+        job_name: Optional name prefix for the jobs (suffixed with the variant index)
+        force: Submit a new job even if an identical request is still queued or running
 
     Returns:
-        Dictionary with job_id for tracking the batch job
+        Dictionary with the job_ids of all submitted jobs, in variant order.
+        Use get_batch_status(job_ids) to monitor them together.
     """
     if len(variants) != len(intervals):
         return {
@@ -504,32 +710,42 @@ def submit_batch_variant_analysis(
             "error": "Number of variants must match number of intervals"
         }
 
-    if analysis_type == "effects":
-        script_path = str(SCRIPTS_DIR / "variant_effect_prediction.py")
-    elif analysis_type == "scoring":
-        script_path = str(SCRIPTS_DIR / "variant_scoring.py")
-    else:
+    script_path = _ANALYSIS_SCRIPTS.get(analysis_type)
+    if script_path is None:
         return {
             "status": "error",
             "error": "analysis_type must be 'effects' or 'scoring'"
         }
 
-    # For batch processing, we'll process variants sequentially
-    # This could be enhanced to run multiple scripts in parallel
-    variants_str = ",".join(variants)
-    intervals_str = ",".join(intervals)
+    # Reject the whole batch before any job is submitted
+    for index, (variant, interval) in enumerate(zip(variants, intervals)):
+        error = _validate_or_error(variant=variant, interval=interval)
+        if error:
+            error["index"] = index
+            return error
+
+    job_name = job_name or f"batch_variant_{analysis_type}"
+    jobs = []
+    for index, (variant, interval) in enumerate(zip(variants, intervals)):
+        jobs.append(_submit_variant_job(
+            script_path=script_path,
+            args={
+                "variant": variant,
+                "interval": interval,
+                "organism": organism,
+                "output_types": output_types,
+                "output_dir": output_dir
+            },
+            job_name=f"{job_name}_{index}",
+            force=force
+        ))
 
-    return job_manager.submit_job(
-        script_path=script_path,
-        args={
-            "variant": variants_str,
-            "interval": intervals_str,
-            "organism": organism,
-            "output_types": output_types,
-            "output_dir": output_dir
-        },
-        job_name=job_name or f"batch_variant_{analysis_type}_{len(variants)}_variants"
-    )
+    return {
+        "status": "success",
+        "job_ids": [job.get("job_id") for job in jobs],
+        "count": len(jobs),
+        "jobs": jobs
+    }
 
 # ==============================================================================
 # Validation and Utilities
@@ -553,33 +769,46 @@ def validate_genomic_inputs(
         Dictionary with validation results for each input
     """
     try:
-        from lib.parsers import parse_interval_string, parse_variant_string
-        from lib.file_io import validate_dna_sequence
-
         results = {}
 
+        # Malformed inputs are reported from format checks that do not raise;
+        # only well-formed intervals go on to the parser's coordinate checks
         if sequence:
-            try:
-                validate_dna_sequence(sequence)
+            invalid_chars = invalid_dna_characters(sequence)
+            if invalid_chars:
+                results["sequence"] = {
+                    "valid": False,
+                    "error": f"Invalid DNA characters found: {invalid_chars}. Only A, T, G, C, N are allowed"
+                }
+            else:
                 results["sequence"] = {"valid": True, "length": len(sequence)}
-            except Exception as e:
-                results["sequence"] = {"valid": False, "error": str(e)}
 
         if interval:
-            try:
-                chrom, start, end = parse_interval_string(interval)
+            if not is_interval_string(interval):
                 results["interval"] = {
-                    "valid": True,
-                    "chromosome": chrom,
-                    "start": start,
-                    "end": end,
-                    "length": end - start
+                    "valid": False,
+                    "error": f"Invalid interval format: {interval}. Expected format: chr:start-end (e.g., chr1:1000-2000)"
                 }
-            except Exception as e:
-                results["interval"] = {"valid": False, "error": str(e)}
+            else:
+                try:
+                    chrom, start, end = parse_interval_string(interval)
+                    results["interval"] = {
+                        "valid": True,
+                        "chromosome": chrom,
+                        "start": start,
+                        "end": end,
+                        "length": end - start
+                    }
+                except ValueError as e:
+                    results["interval"] = {"valid": False, "error": str(e)}
 
         if variant:
-            try:
+            if not is_variant_string(variant):
+                results["variant"] = {
+                    "valid": False,
+                    "error": f"Invalid variant format: {variant}. Expected format: chr:posREF>ALT (e.g., chr1:1001000A>G)"
+                }
+            else:
                 chrom, pos, ref, alt = parse_variant_string(variant)
                 results["variant"] = {
                     "valid": True,
@@ -588,8 +817,6 @@ def validate_genomic_inputs(
                     "reference": ref,
                     "alternate": alt
                 }
-            except Exception as e:
-                results["variant"] = {"valid": False, "error": str(e)}
 
         return {"status": "success", "validation": results}
 
@@ -604,6 +831,10 @@ def get_supported_organisms() -> dict:
     Returns:
         Dictionary with available organism names and descriptions
     """
+    return copy.deepcopy(_supported_organisms())
+
+@lru_cache(maxsize=1)
+def _supported_organisms() -> dict:
     return {
         "status": "success",
         "organisms": {
@@ -626,9 +857,16 @@ def get_example_data() -> dict:
     """
     Get information about available example datasets for testing.
 
+    Which files exist is re-checked at most once every _EXAMPLE_DATA_TTL (60) seconds.
+
     Returns:
         Dictionary with example files and their descriptions
     """
+    global _example_data_cache
+    now = time.monotonic()
+    if _example_data_cache is not None and now - _example_data_cache[0] < _EXAMPLE_DATA_TTL:
+        return copy.deepcopy(_example_data_cache[1])
+
     examples_dir = SCRIPTS_DIR.parent / "examples" / "data"
 
     examples = {
@@ -651,34 +889,34 @@ def get_example_data() -> dict:
         }
     }
 
-    # Check which files actually exist
+    # Check which files actually exist, with one directory listing instead
+    # of a stat per file
+    try:
+        present = {entry.name for entry in os.scandir(examples_dir)}
+    except FileNotFoundError:
+        present = set()
+
     existing_files = {}
-    if examples_dir.exists():
-        for category, files in examples.items():
-            if category == "sequences":
-                existing_files[category] = {}
-                for filename, desc in files.items():
-                    file_path = examples_dir / filename
-                    if file_path.exists():
-                        existing_files[category][filename] = {
-                            "description": desc,
-                            "path": str(file_path),
-                            "exists": True
-                        }
-                    else:
-                        existing_files[category][filename] = {
-                            "description": desc,
-                            "path": str(file_path),
-                            "exists": False
-                        }
-            else:
-                existing_files[category] = files
+    for category, files in examples.items():
+        if category == "sequences":
+            existing_files[category] = {
+                filename: {
+                    "description": desc,
+                    "path": str(examples_dir / filename),
+                    "exists": filename in present
+                }
+                for filename, desc in files.items()
+            }
+        else:
+            existing_files[category] = files
 
-    return {
+    response = {
         "status": "success",
         "examples_directory": str(examples_dir),
         "examples": existing_files
     }
+    _example_data_cache = (now, response)
+    return copy.deepcopy(response)
 
 # ==============================================================================
 # Entry Point
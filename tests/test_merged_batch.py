@@ -0,0 +1,99 @@
+"""
+Tests for slicing merged-window predictions back to their intervals
+(examples/_cluster.py and use case 2's analyze_merged_batch).
+
+Run with: python -m unittest discover -s tests
+"""
+
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'examples'))
+
+import use_case_2_genomic_interval_analysis as use_case_2  # noqa: E402
+from _cluster import slice_predictions  # noqa: E402
+
+
+def _window_result(chromosome, start, end, organism, output_types, api_key, num_scores=131):
+    """Mock-shaped interval prediction whose score count does not divide the window length."""
+    scores = [round(i / num_scores, 4) for i in range(num_scores)]
+    step = (end - start) // num_scores
+    peaks = [{"position": start + i * step, "score": score} for i, score in enumerate(scores) if score > 0.7]
+    return {
+        "success": True,
+        "interval": f"{chromosome}:{start}-{end}",
+        "interval_info": {"chromosome": chromosome, "start": start, "end": end,
+                          "length": end - start, "organism": organism},
+        "predictions": {
+            "atac_accessibility_scores": scores,
+            "peaks": peaks,
+            "summary": {"total_scores": len(scores), "peaks_detected": len(peaks),
+                        "mean_accessibility": round(sum(scores) / len(scores), 4)}
+        }
+    }
+
+
+class SlicePredictionsTest(unittest.TestCase):
+
+    def test_non_divisible_track_is_sliced_proportionally(self):
+        # 10 bins over 2048 bp: bin i covers [204.8 * i, 204.8 * (i + 1))
+        track = list(range(10))
+        sliced = slice_predictions({"scores": track}, 0, 2048, offset=300, length=500)
+        self.assertEqual(sliced["scores"], [1, 2, 3])
+
+    def test_every_bin_is_covered_by_the_whole_window(self):
+        track = list(range(131))
+        sliced = slice_predictions({"scores": track}, 1000, 132072, offset=0, length=131072)
+        self.assertEqual(sliced["scores"], track)
+
+    def test_recomputed_values_are_left_out(self):
+        sliced = slice_predictions({"scores": [1, 2], "summary": {"total_scores": 2}}, 0, 100, 0, 50,
+                                   recomputed=("summary",))
+        self.assertEqual(sliced, {"scores": [1]})
+
+    def test_unsliceable_value_returns_none(self):
+        self.assertIsNone(slice_predictions({"labels": ["a", "b"]}, 0, 100, 0, 50))
+        self.assertIsNone(slice_predictions({"window_mean": 0.5}, 0, 100, 0, 50))
+
+
+class AnalyzeMergedBatchTest(unittest.TestCase):
+
+    def test_merged_records_keep_their_tracks(self):
+        records = [{"chromosome": "chr1", "start": start, "end": start + 2048}
+                   for start in (1000000, 1002500, 1005000)]
+        with mock.patch.object(use_case_2, "predict_genomic_interval", side_effect=_window_result) as predict:
+            results = list(use_case_2.analyze_merged_batch(records, merge_distance=1000))
+
+        self.assertEqual(predict.call_count, 1)
+        for record, result in zip(records, results):
+            self.assertTrue(result["success"])
+            self.assertEqual(result["interval_info"]["start"], record["start"])
+            self.assertEqual(result["interval_info"]["length"], 2048)
+            predictions = result["predictions"]
+            self.assertTrue(predictions["atac_accessibility_scores"])
+            self.assertEqual(predictions["summary"]["total_scores"],
+                             len(predictions["atac_accessibility_scores"]))
+            self.assertIn("mean_accessibility", predictions["summary"])
+
+    def test_unsliceable_window_falls_back_to_own_prediction(self):
+        def window_with_labels(*args):
+            result = _window_result(*args)
+            result["predictions"]["labels"] = ["open", "closed"]
+            return result
+
+        records = [{"chromosome": "chr1", "start": start, "end": start + 2048} for start in (1000000, 1002500)]
+        with mock.patch.object(use_case_2, "predict_genomic_interval", side_effect=window_with_labels) as predict:
+            results = list(use_case_2.analyze_merged_batch(records, merge_distance=1000))
+
+        # One merged window, then each record on its own
+        self.assertEqual(predict.call_count, 3)
+        for record, result in zip(records, results):
+            self.assertEqual(result["interval_info"]["start"], record["start"])
+            self.assertIsNone(result["metadata"]["merged_window"])
+            self.assertEqual(len(result["predictions"]["atac_accessibility_scores"]), 131)
+
+
+if __name__ == '__main__':
+    unittest.main()